@@ -5,6 +5,7 @@
 #  found in the license.txt file.
 #
 
+import bce.instrumentation.initializer as _instrumentation_init
 import bce.locale.initializer as _locale_init
 import bce.logic.balancer.initializer as _logic_bce_init
 import bce.logic.common.initializer as _logic_cm_init
@@ -12,6 +13,49 @@ import bce.parser.common.initializer as _parser_cm_init
 import bce.parser.cexp.initializer as _parser_cexp_init
 import bce.parser.mexp.initializer as _parser_mexp_init
 import bce.parser.molecule.initializer as _parser_ml_init
+import bce.utils.compatible as _utils_compatible
+import importlib as _importlib
+
+#
+#  Note:
+#    [1] Initializing the sub modules only registers options, localization
+#        loaders and parser factories. SymPy, the parsers, the printers and the
+#        message trees are loaded on first use.
+#    [2] Python runtimes older than 3.7 don't support module-level
+#        __getattr__(), so the sub packages are imported eagerly on them (after
+#        all sub modules were initialized).
+#
+
+#  Sub packages that are imported on first access (see __getattr__()).
+_LAZY_SUB_PACKAGES = frozenset([
+    "base",
+    "database",
+    "dom",
+    "instrumentation",
+    "locale",
+    "logic",
+    "math",
+    "option",
+    "parser",
+    "public",
+    "shell",
+    "utils"
+])
+
+
+def __getattr__(name):
+    """Import a sub package on first access (PEP 562, Python 3.7+).
+
+    :type name: str
+    :param name: The attribute name.
+    :return: The sub package.
+    :raise AttributeError: Raise this exception if there is no such sub package.
+    """
+
+    if name in _LAZY_SUB_PACKAGES:
+        return _importlib.import_module("bce." + name)
+
+    raise AttributeError("module 'bce' has no attribute '%s'" % name)
 
 #
 #  Initialize all sub modules.
@@ -20,6 +64,9 @@ import bce.parser.molecule.initializer as _parser_ml_init
 #  Initialize locale module.
 _locale_init.initialize_module()
 
+#  Initialize instrumentation module.
+_instrumentation_init.initialize_module()
+
 #  Initialize logic modules.
 _logic_cm_init.initialize_module()
 _logic_bce_init.initialize_module()
@@ -29,3 +76,8 @@ _parser_cm_init.initialize_module()
 _parser_mexp_init.initialize_module()
 _parser_ml_init.initialize_module()
 _parser_cexp_init.initialize_module()
+
+#  Import all sub packages eagerly on old Python runtimes (without PEP 562).
+if not _utils_compatible.is_module_getattr_supported():
+    for _sub_package in sorted(_LAZY_SUB_PACKAGES):
+        _importlib.import_module("bce." + _sub_package)
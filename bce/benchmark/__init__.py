@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
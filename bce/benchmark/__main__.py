@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.benchmark.main as _main
+
+#  Run the benchmark suite ("python -m bce.benchmark").
+_main.main()
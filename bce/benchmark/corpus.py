@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#  Categories.
+CATEGORY_SIMPLE_INORGANIC = "simple_inorganic"
+CATEGORY_REDOX = "redox"
+CATEGORY_HYDRATE = "hydrate"
+CATEGORY_ABBREVIATION = "abbreviation"
+CATEGORY_SYMBOLIC_MEXP = "symbolic_mexp"
+CATEGORY_AUTO_ARRANGING = "auto_arranging"
+
+#  Representative chemical equations of each category.
+#
+#  Note:
+#    [1] All chemical equations can be balanced with the bundled abbreviations
+#        and the default options.
+#    [2] Never change existing entries, or results of different releases can't
+#        be compared. Add new categories instead.
+CORPUS = {
+    CATEGORY_SIMPLE_INORGANIC: [
+        "H2+O2=H2O",
+        "Fe+Cl2=FeCl3",
+        "Al+O2=Al2O3",
+        "Na+H2O=NaOH+H2",
+        "Fe2O3+CO=Fe+CO2",
+        "CaCO3+HCl=CaCl2+H2O+CO2",
+        "NH3+O2=NO+H2O",
+        "P4+O2=P4O10",
+        "KClO3=KCl+O2",
+        "C6H12O6+O2=CO2+H2O"
+    ],
+    CATEGORY_REDOX: [
+        "KMnO4+HCl=KCl+MnCl2+Cl2+H2O",
+        "Cu+HNO3=Cu(NO3)2+NO+H2O",
+        "K2Cr2O7+HCl=KCl+CrCl3+Cl2+H2O",
+        "As2S3+HNO3+H2O=H3AsO4+H2SO4+NO",
+        "Fe<3e+>+<e->=Fe<2e+>",
+        "MnO4<e->+H<e+>+<e->=Mn<2e+>+H2O",
+        "Cr2O7<2e->+H<e+>+Fe<2e+>=Cr<3e+>+Fe<3e+>+H2O",
+        "NH4<e+>+OH<e->=NH3+H2O"
+    ],
+    CATEGORY_HYDRATE: [
+        "CuSO4.5H2O=CuSO4+H2O",
+        "Na2CO3.10H2O=Na2CO3+H2O",
+        "CaSO4.2H2O=(CaSO4)2.H2O+H2O",
+        "MgSO4.7H2O+NaOH=Mg(OH)2+Na2SO4+H2O",
+        "FeSO4.7H2O+KMnO4+H2SO4=Fe2(SO4)3+MnSO4+K2SO4+H2O"
+    ],
+    CATEGORY_ABBREVIATION: [
+        "[Ph]OH+O2=CO2+H2O",
+        "[Me]OH+O2=CO2+H2O",
+        "[Et]OH+O2=CO2+H2O",
+        "[Ac]OH+NaOH=[Ac]ONa+H2O",
+        "[Val]+O2=CO2+H2O+N2",
+        "[Trp]+O2=CO2+H2O+NO2"
+    ],
+    CATEGORY_SYMBOLIC_MEXP: [
+        "C{n}H{2n+2}+O2=CO2+H2O",
+        "C{n}H{2n}+O2=CO2+H2O",
+        "C{n}H{2n-2}+O2=CO2+H2O",
+        "C{x}H{y}O{z}+O2=CO2+H2O",
+        "Fe{x}O{y}+CO=Fe+CO2",
+        "A{2/3}B+B=A{1/3}B"
+    ],
+    CATEGORY_AUTO_ARRANGING: [
+        "H2;O2;H2O",
+        "Fe;Cl2;FeCl3",
+        "C6H12O6;O2;CO2;H2O",
+        "Cu;HNO3;Cu(NO3)2;NO;H2O",
+        "KMnO4;HCl;KCl;MnCl2;Cl2;H2O"
+    ]
+}
+
+
+def get_categories():
+    """Get all categories.
+
+    :rtype : list[str]
+    :return: The categories (sorted).
+    """
+
+    return sorted(CORPUS.keys())
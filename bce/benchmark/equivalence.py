@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    This module compares alternative implementations that must give the same
+#    results, and measures their time on the same inputs:
+#
+#      - Multi-modular elimination (bce.math.modular) and fraction-free
+#        elimination (bce.math.bareiss) on random integer systems.
+#      - The integer kernel in Hermite normal form (bce.math.lattice) and the
+#        kernel read from the fraction-free reduced row echelon form.
+#
+#    Random inputs are generated from a seed, so every run with the same
+#    arguments checks the same cases ("python -m bce.benchmark.equivalence").
+#
+
+import bce.benchmark.main as _bm_main
+import bce.logic.balancer.model as _bce_model
+import bce.math.bareiss as _bareiss
+import bce.math.lattice as _lattice
+import bce.math.modular as _modular
+import argparse as _argparse
+import fractions as _fractions
+import json as _json
+import random as _random
+import sys as _sys
+import timeit as _timeit
+
+#  Version of the output format.
+FORMAT_VERSION = 1
+
+#  Count of mismatches that are reported in detail (per comparison).
+_MISMATCH_REPORT_LIMIT = 10
+
+#  Kinds of random integer systems.
+SYSTEM_KIND_SMALL = "small"
+SYSTEM_KIND_UNLUCKY = "unlucky"
+SYSTEM_KIND_LARGE = "large"
+
+
+def get_system_kinds():
+    """Get all kinds of random integer systems.
+
+    :rtype : list[str]
+    :return: The kinds.
+    """
+
+    return [SYSTEM_KIND_SMALL, SYSTEM_KIND_UNLUCKY, SYSTEM_KIND_LARGE]
+
+
+def generate_integer_system(rnd, kind):
+    """Generate a random integer system.
+
+    Note:
+      [1] "small" systems have up to 8 unknowns and are often rank-deficient.
+      [2] "unlucky" systems have coefficients that are multiples of the primes
+          used by the multi-modular elimination, so some primes are unlucky.
+      [3] "large" systems have 20 to 40 unknowns and are mostly consistent.
+      [4] About half of the systems are homogeneous.
+
+    :type rnd: random.Random
+    :type kind: str
+    :param rnd: The random generator.
+    :param kind: The kind of the system (one of SYSTEM_KIND_* constants).
+    :rtype : (list[dict[int, int]], int)
+    :return: A tuple (integer rows, count of columns).
+    """
+
+    if kind == SYSTEM_KIND_SMALL:
+        unknown_count = rnd.randint(1, 8)
+        row_count = rnd.randint(1, 8)
+        basis_count = rnd.randint(1, row_count)
+    elif kind == SYSTEM_KIND_UNLUCKY:
+        unknown_count = rnd.randint(1, 5)
+        row_count = rnd.randint(1, 5)
+        basis_count = row_count
+    elif kind == SYSTEM_KIND_LARGE:
+        unknown_count = rnd.randint(20, 40)
+        row_count = rnd.randint(unknown_count - 5, unknown_count)
+        basis_count = row_count - rnd.randint(0, 2)
+    else:
+        raise ValueError("Unknown system kind.")
+
+    primes = [_modular._get_prime(prime_id) for prime_id in range(0, 3)]
+    density = rnd.uniform(0.2, 1.0)
+
+    def generate_item():
+        if kind == SYSTEM_KIND_UNLUCKY and rnd.random() < 0.3:
+            return rnd.choice(primes) * rnd.choice([-2, -1, 1, 2])
+        if rnd.random() >= density:
+            return 0
+        return rnd.randint(-9, 9)
+
+    #  Generate the coefficients (as combinations of a few basis rows, so that the rank may be deficient).
+    basis = [[generate_item() for _ in range(0, unknown_count)] for _ in range(0, basis_count)]
+    if kind == SYSTEM_KIND_UNLUCKY:
+        #  Keep the multiples of the primes.
+        coefficients = basis
+    else:
+        coefficients = []
+        for _ in range(0, row_count):
+            combined = [0] * unknown_count
+            for basis_row in basis:
+                factor = rnd.randint(-3, 3)
+                for column_id in range(0, unknown_count):
+                    combined[column_id] += factor * basis_row[column_id]
+            coefficients.append(combined)
+
+    #  Generate the constants (consistent if they are from an integer solution, random otherwise).
+    #  Constants from integer solutions would also be multiples of the primes, so unlucky systems
+    #  always use random constants.
+    if rnd.random() < 0.5:
+        constants = [0] * row_count
+    elif kind != SYSTEM_KIND_UNLUCKY and rnd.random() < 0.8:
+        solution = [rnd.randint(-3, 3) for _ in range(0, unknown_count)]
+        constants = [sum([row[column_id] * solution[column_id] for column_id in range(0, unknown_count)])
+                     for row in coefficients]
+    else:
+        constants = [generate_item() for _ in range(0, row_count)]
+
+    rows = []
+    for row_id in range(0, row_count):
+        items = coefficients[row_id] + [constants[row_id]]
+        rows.append(dict([(column_id, items[column_id]) for column_id in range(0, unknown_count + 1)
+                          if items[column_id] != 0]))
+
+    return rows, unknown_count + 1
+
+
+def _copy_rows(rows):
+    """Copy integer rows.
+
+    :type rows: list[dict[int, int]]
+    :param rows: The integer rows.
+    :rtype : list[dict[int, int]]
+    :return: The copy.
+    """
+
+    return [dict(row) for row in rows]
+
+
+def _reduce_with_bareiss(rows, column_count):
+    """Get the reduced row echelon form with fraction-free elimination.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :param rows: The integer rows (not changed).
+    :param column_count: The count of columns.
+    :rtype : (list[int], list[dict[int, fractions.Fraction]], bool)
+    :return: A tuple (pivot columns, pivot rows, whether the equations are consistent).
+    """
+
+    work = _copy_rows(rows)
+    pivot_columns, divisor = _bareiss.reduce_integer_rows(work, column_count)
+
+    reduced_rows = []
+    for row_id in range(0, len(pivot_columns)):
+        row = work[row_id]
+        reduced_rows.append(dict([(column_id, _fractions.Fraction(row[column_id], divisor)) for column_id in row]))
+
+    is_consistent = True
+    for row_id in range(len(pivot_columns), len(work)):
+        if len(work[row_id]) != 0:
+            is_consistent = False
+
+    return pivot_columns, reduced_rows, is_consistent
+
+
+def _new_comparison():
+    """Create an empty comparison record.
+
+    :rtype : dict
+    :return: The record.
+    """
+
+    return {
+        "cases": 0,
+        "mismatches": 0,
+        "mismatch_examples": []
+    }
+
+
+def _report_mismatch(record, example):
+    """Count a mismatch of a comparison.
+
+    :type record: dict
+    :param record: The comparison record.
+    :param example: The description of the mismatch (JSON-serializable).
+    """
+
+    record["mismatches"] += 1
+    if len(record["mismatch_examples"]) < _MISMATCH_REPORT_LIMIT:
+        record["mismatch_examples"].append(example)
+
+
+def compare_solvers(kind, trials, seed):
+    """Compare the multi-modular elimination with the fraction-free elimination.
+
+    Note:
+      [1] The multi-modular elimination may give up (and the callers fall back
+          to the fraction-free elimination). Giving up on inconsistent systems
+          is expected. Giving up on consistent systems is counted separately
+          since it only costs time.
+
+    :type kind: str
+    :type trials: int
+    :type seed: int
+    :param kind: The kind of the systems (one of SYSTEM_KIND_* constants).
+    :param trials: The count of systems.
+    :param seed: The random seed.
+    :rtype : dict
+    :return: The comparison results (JSON-serializable).
+    """
+
+    rnd = _random.Random(seed)
+    record = _new_comparison()
+    record["inconsistent"] = 0
+    record["consistent_fallbacks"] = 0
+    time_bareiss = 0.0
+    time_modular = 0.0
+
+    for _ in range(0, trials):
+        rows, column_count = generate_integer_system(rnd, kind)
+        record["cases"] += 1
+
+        time_begin = _timeit.default_timer()
+        expected = _reduce_with_bareiss(rows, column_count)
+        time_bareiss += _timeit.default_timer() - time_begin
+
+        time_begin = _timeit.default_timer()
+        actual = _modular.reduce_integer_rows(rows, column_count)
+        time_modular += _timeit.default_timer() - time_begin
+
+        pivot_columns, reduced_rows, is_consistent = expected
+        if not is_consistent:
+            record["inconsistent"] += 1
+            if actual is not None:
+                _report_mismatch(record, {"rows": repr(rows), "reason": "inconsistent system was reduced"})
+        elif actual is None:
+            record["consistent_fallbacks"] += 1
+        elif actual != (pivot_columns, reduced_rows):
+            _report_mismatch(record, {"rows": repr(rows), "reason": "different reduced row echelon form"})
+
+    record["time"] = {
+        "bareiss": time_bareiss,
+        "modular": time_modular
+    }
+
+    return record
+
+
+def compare_kernels(kind, trials, seed):
+    """Compare the integer kernel in Hermite normal form with the kernel read from the reduced row echelon form.
+
+    Note:
+      [1] Only the homogeneous parts of the systems are used. The dimensions of
+          the kernels are compared, and one-dimensional kernels are also
+          compared item by item (see bce.logic.balancer.model).
+
+    :type kind: str
+    :type trials: int
+    :type seed: int
+    :param kind: The kind of the systems (one of SYSTEM_KIND_* constants).
+    :param trials: The count of systems.
+    :param seed: The random seed.
+    :rtype : dict
+    :return: The comparison results (JSON-serializable).
+    """
+
+    rnd = _random.Random(seed)
+    record = _new_comparison()
+    time_bareiss = 0.0
+    time_lattice = 0.0
+
+    for _ in range(0, trials):
+        rows, column_count = generate_integer_system(rnd, kind)
+        unknown_count = column_count - 1
+        for row in rows:
+            row.pop(unknown_count, None)
+        record["cases"] += 1
+
+        time_begin = _timeit.default_timer()
+        pivot_columns, reduced_rows, _ = _reduce_with_bareiss(rows, column_count)
+        expected = None
+        if len(pivot_columns) + 1 == unknown_count:
+            free_column = [column_id for column_id in range(0, unknown_count) if column_id not in pivot_columns][0]
+            vector = [0] * unknown_count
+            vector[free_column] = 1
+            for row_id in range(0, len(pivot_columns)):
+                vector[pivot_columns[row_id]] = -reduced_rows[row_id].get(free_column, 0)
+            expected = [int(value) for value in _bce_model.make_primitive_coefficients(vector)]
+        time_bareiss += _timeit.default_timer() - time_begin
+
+        time_begin = _timeit.default_timer()
+        kernel = _lattice.get_integer_kernel(rows, unknown_count)
+        time_lattice += _timeit.default_timer() - time_begin
+
+        if len(kernel) != unknown_count - len(pivot_columns):
+            _report_mismatch(record, {"rows": repr(rows), "reason": "different kernel dimension"})
+        elif expected is not None and kernel[0] != expected:
+            _report_mismatch(record, {"rows": repr(rows), "reason": "different kernel vector"})
+
+    record["time"] = {
+        "bareiss": time_bareiss,
+        "lattice": time_lattice
+    }
+
+    return record
+
+
+def run_comparisons(kinds=None, trials=200, seed=0):
+    """Run all comparisons.
+
+    :type kinds: list[str] | None
+    :type trials: int
+    :type seed: int
+    :param kinds: The kinds of random integer systems (None if all kinds).
+    :param trials: The count of random integer systems of each kind.
+    :param seed: The random seed.
+    :rtype : dict
+    :return: The results (JSON-serializable).
+    """
+
+    if kinds is None:
+        kinds = get_system_kinds()
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "environment": _bm_main._get_environment(),
+        "seed": seed,
+        "solvers": dict([(kind, compare_solvers(kind, trials, seed)) for kind in kinds]),
+        "kernels": dict([(kind, compare_kernels(kind, trials, seed)) for kind in kinds])
+    }
+
+
+def count_mismatches(results):
+    """Count the mismatches of all comparisons.
+
+    :type results: dict
+    :param results: The results of run_comparisons().
+    :rtype : int
+    :return: The count.
+    """
+
+    count = 0
+    for key in ["solvers", "kernels"]:
+        for kind in results[key]:
+            count += results[key][kind]["mismatches"]
+
+    return count
+
+
+def main():
+    """Main entry of the equivalence checks (exits with 1 if any mismatch is found)."""
+
+    arg_parser = _argparse.ArgumentParser(description="BCE - Chemical Equation Balancer (Equivalence Checks)")
+    arg_parser.add_argument(
+        "--kind",
+        dest="kinds",
+        action="append",
+        choices=get_system_kinds(),
+        default=None,
+        help="Check random integer systems of specified kind only (can be repeated)."
+    )
+    arg_parser.add_argument(
+        "--trials",
+        dest="trials",
+        action="store",
+        type=int,
+        default=200,
+        help="Set the count of random integer systems of each kind."
+    )
+    arg_parser.add_argument(
+        "--seed",
+        dest="seed",
+        action="store",
+        type=int,
+        default=0,
+        help="Set the random seed."
+    )
+    arg_parser.add_argument(
+        "--output",
+        dest="output",
+        action="store",
+        type=str,
+        default=None,
+        help="Write the results (JSON) to specified file instead of the standard output."
+    )
+    args = arg_parser.parse_args()
+
+    if args.trials < 1:
+        arg_parser.error("The count of trials should be positive.")
+
+    results = run_comparisons(kinds=args.kinds, trials=args.trials, seed=args.seed)
+    dumped = _json.dumps(results, indent=4, sort_keys=True)
+
+    if args.output is None:
+        print(dumped)
+    else:
+        with open(args.output, "w") as handler:
+            handler.write(dumped + "\n")
+
+    _sys.exit(1 if count_mismatches(results) != 0 else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.base.version as _version
+import bce.benchmark.corpus as _corpus
+import bce.option as _option
+import bce.parser.interface.option as _interface_opt
+import bce.public.api as _public_api
+import bce.public.database as _public_db
+import bce.public.option as _public_option
+import argparse as _argparse
+import json as _json
+import os as _os
+import platform as _platform
+import subprocess as _subprocess
+import sympy as _sympy
+import sys as _sys
+import time as _time
+import timeit as _timeit
+
+try:
+    import resource as _resource
+except ImportError:
+    _resource = None
+
+try:
+    import tracemalloc as _tracemalloc
+except ImportError:
+    _tracemalloc = None
+
+#  Version of the output format.
+FORMAT_VERSION = 1
+
+#  Script that measures the time of importing "bce" (in a fresh interpreter).
+_COLD_IMPORT_SCRIPT = """
+import json, timeit
+time_begin = timeit.default_timer()
+import bce
+print(json.dumps({"import_time": timeit.default_timer() - time_begin}))
+"""
+
+#  Script that measures the latency of the first balancing call (in a fresh interpreter).
+_FIRST_CALL_SCRIPT = """
+import json, sys, timeit
+time_begin = timeit.default_timer()
+import bce.option, bce.public.api
+time_imported = timeit.default_timer()
+bce.public.api.balance_chemical_equation("H2+O2=H2O", bce.option.Option())
+time_balanced = timeit.default_timer()
+try:
+    import resource
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        max_rss *= 1024
+except ImportError:
+    max_rss = None
+print(json.dumps({
+    "import_time": time_imported - time_begin,
+    "first_call_time": time_balanced - time_imported,
+    "max_rss": max_rss
+}))
+"""
+
+
+def _get_statistics(samples):
+    """Get statistics of samples.
+
+    :type samples: list[float]
+    :param samples: The samples.
+    :rtype : dict
+    :return: The statistics.
+    """
+
+    ordered = sorted(samples)
+    count = len(ordered)
+    if count % 2 == 1:
+        median = ordered[count // 2]
+    else:
+        median = (ordered[count // 2 - 1] + ordered[count // 2]) / 2.0
+
+    return {
+        "samples": samples,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "median": median,
+        "mean": sum(ordered) / float(count)
+    }
+
+
+def _get_max_rss():
+    """Get the maximum resident set size of current process.
+
+    :rtype : int | None
+    :return: The size (in bytes, None if not available).
+    """
+
+    if _resource is None:
+        return None
+
+    max_rss = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+    if _sys.platform != "darwin":
+        max_rss *= 1024
+
+    return max_rss
+
+
+def _run_script(script):
+    """Run a measuring script in a fresh interpreter.
+
+    Note:
+      [1] The script imports the "bce" package that this module belongs to.
+
+    :type script: str
+    :param script: The script.
+    :rtype : dict
+    :return: The measured values.
+    """
+
+    package_root = _os.path.dirname(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+
+    env = dict(_os.environ)
+    if "PYTHONPATH" in env and len(env["PYTHONPATH"]) != 0:
+        env["PYTHONPATH"] = package_root + _os.pathsep + env["PYTHONPATH"]
+    else:
+        env["PYTHONPATH"] = package_root
+
+    output = _subprocess.check_output([_sys.executable, "-c", script], env=env)
+
+    return _json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+def measure_cold_import(repeat=5):
+    """Measure the time of importing "bce" in fresh interpreters.
+
+    :type repeat: int
+    :param repeat: The count of interpreters.
+    :rtype : dict
+    :return: The statistics (in seconds).
+    """
+
+    return _get_statistics([_run_script(_COLD_IMPORT_SCRIPT)["import_time"] for _ in range(0, repeat)])
+
+
+def measure_first_call(repeat=5):
+    """Measure the latency of the first balancing call in fresh interpreters.
+
+    :type repeat: int
+    :param repeat: The count of interpreters.
+    :rtype : dict
+    :return: The statistics of the import time, the first call latency (in seconds) and the maximum
+             resident set size (in bytes).
+    """
+
+    results = [_run_script(_FIRST_CALL_SCRIPT) for _ in range(0, repeat)]
+    max_rss_samples = [item["max_rss"] for item in results if item["max_rss"] is not None]
+
+    return {
+        "import_time": _get_statistics([item["import_time"] for item in results]),
+        "first_call_time": _get_statistics([item["first_call_time"] for item in results]),
+        "max_rss": max(max_rss_samples) if len(max_rss_samples) != 0 else None
+    }
+
+
+def _create_options():
+    """Create the options for balancing the corpus.
+
+    :rtype : bce.option.Option
+    :return: The options.
+    """
+
+    options = _option.Option()
+    _public_option.MoleculeParserOptionWrapper(options).set_abbreviation_mapping(
+        dict(_public_db.BUNDLED_ABBREVIATION_DATABASE)
+    )
+
+    return options
+
+
+def _clear_caches(options):
+    """Clear all caches that are reachable from the options.
+
+    :type options: bce.option.Option
+    :param options: The options.
+    """
+
+    #  Clear the parser caches.
+    if_opt = _interface_opt.OptionWrapper(options)
+    for parser_impl in [if_opt.get_cexp_parser(), if_opt.get_molecule_parser(), if_opt.get_mexp_parser()]:
+        get_cache = getattr(parser_impl, "get_cache", None)
+        if get_cache is not None and get_cache() is not None:
+            get_cache().clear()
+
+    #  Clear the solution cache.
+    solution_cache = _public_option.BalancerOptionWrapper(options).get_solution_cache()
+    if solution_cache is not None:
+        solution_cache.clear()
+
+    #  Drop the compiled abbreviations (by assigning a new compiled table).
+    ml_opt = _public_option.MoleculeParserOptionWrapper(options)
+    ml_opt.set_abbreviation_mapping(ml_opt.get_abbreviation_mapping())
+
+
+def measure_throughput(categories, rounds=5, use_caches=True):
+    """Measure the steady-state throughput of balancing the corpus.
+
+    :type categories: list[str]
+    :type rounds: int
+    :type use_caches: bool
+    :param categories: The categories to be measured.
+    :param rounds: The count of rounds (each round balances all chemical equations of a category once).
+    :param use_caches: Whether the caches are kept between rounds.
+    :rtype : dict
+    :return: The result of each category.
+    """
+
+    options = _create_options()
+    result = {}
+
+    for category in categories:
+        expressions = _corpus.CORPUS[category]
+
+        #  Warm up.
+        for expression in expressions:
+            _public_api.balance_chemical_equation(expression, options)
+
+        samples = []
+        for _ in range(0, rounds):
+            if not use_caches:
+                _clear_caches(options)
+
+            time_begin = _timeit.default_timer()
+            for expression in expressions:
+                _public_api.balance_chemical_equation(expression, options)
+            samples.append(_timeit.default_timer() - time_begin)
+
+        statistics = _get_statistics(samples)
+        result[category] = {
+            "equation_count": len(expressions),
+            "round_time": statistics,
+            "equations_per_second": len(expressions) / statistics["median"]
+        }
+
+    return result
+
+
+def measure_memory(categories):
+    """Measure the memory high-water marks of balancing the corpus.
+
+    Note:
+      [1] The traced peak (Python 3.4+ only) is the peak of memory blocks
+          allocated by Python while balancing a category with cold caches.
+
+    :type categories: list[str]
+    :param categories: The categories to be measured.
+    :rtype : dict
+    :return: The traced peak of each category (in bytes, None if not available) and the maximum resident set size
+             of current process (in bytes, None if not available).
+    """
+
+    options = _create_options()
+    traced_peaks = {}
+
+    for category in categories:
+        if _tracemalloc is None:
+            traced_peaks[category] = None
+            continue
+
+        _clear_caches(options)
+
+        _tracemalloc.start()
+        try:
+            for expression in _corpus.CORPUS[category]:
+                _public_api.balance_chemical_equation(expression, options)
+            traced_peaks[category] = _tracemalloc.get_traced_memory()[1]
+        finally:
+            _tracemalloc.stop()
+
+    return {
+        "traced_peak": traced_peaks,
+        "max_rss": _get_max_rss()
+    }
+
+
+def _get_environment():
+    """Get the information of the environment.
+
+    :rtype : dict
+    :return: The information.
+    """
+
+    return {
+        "bce": "%d.%d.%d" % _version.get_version(),
+        "python": _platform.python_version(),
+        "python_implementation": _platform.python_implementation(),
+        "sympy": _sympy.__version__,
+        "platform": _platform.platform(),
+        "timestamp": _time.strftime("%Y-%m-%dT%H:%M:%SZ", _time.gmtime())
+    }
+
+
+def run_benchmarks(categories=None, repeat=5, rounds=5):
+    """Run all benchmarks.
+
+    :type categories: list[str] | None
+    :type repeat: int
+    :type rounds: int
+    :param categories: The categories of the throughput and memory benchmarks (None if all categories).
+    :param repeat: The count of fresh interpreters for the cold-start benchmarks.
+    :param rounds: The count of rounds of the throughput benchmarks.
+    :rtype : dict
+    :return: The results (JSON-serializable).
+    """
+
+    if categories is None:
+        categories = _corpus.get_categories()
+
+    return {
+        "format_version": FORMAT_VERSION,
+        "environment": _get_environment(),
+        "cold_import": measure_cold_import(repeat),
+        "first_call": measure_first_call(repeat),
+        "throughput": {
+            "cached": measure_throughput(categories, rounds=rounds, use_caches=True),
+            "uncached": measure_throughput(categories, rounds=rounds, use_caches=False)
+        },
+        "memory": measure_memory(categories)
+    }
+
+
+def main():
+    """Main entry of the benchmark suite."""
+
+    arg_parser = _argparse.ArgumentParser(description="BCE - Chemical Equation Balancer (Benchmarks)")
+    arg_parser.add_argument(
+        "--category",
+        dest="categories",
+        action="append",
+        choices=_corpus.get_categories(),
+        default=None,
+        help="Measure the throughput and the memory of specified corpus category only (can be repeated)."
+    )
+    arg_parser.add_argument(
+        "--repeat",
+        dest="repeat",
+        action="store",
+        type=int,
+        default=5,
+        help="Set the count of fresh interpreters for the cold-start benchmarks."
+    )
+    arg_parser.add_argument(
+        "--rounds",
+        dest="rounds",
+        action="store",
+        type=int,
+        default=5,
+        help="Set the count of rounds of the throughput benchmarks."
+    )
+    arg_parser.add_argument(
+        "--output",
+        dest="output",
+        action="store",
+        type=str,
+        default=None,
+        help="Write the results (JSON) to specified file instead of the standard output."
+    )
+    args = arg_parser.parse_args()
+
+    if args.repeat < 1 or args.rounds < 1:
+        arg_parser.error("The count of interpreters and rounds should be positive.")
+
+    results = _json.dumps(
+        run_benchmarks(categories=args.categories, repeat=args.repeat, rounds=args.rounds),
+        indent=4,
+        sort_keys=True
+    )
+
+    if args.output is None:
+        print(results)
+    else:
+        with open(args.output, "w") as handler:
+            handler.write(results + "\n")
+
+    _sys.exit(0)
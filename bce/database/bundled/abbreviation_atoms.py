@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    This table contains the atoms of each abbreviation in the bundled abbreviation
+#    database (bce.database.bundled.abbreviation). It must be updated whenever the
+#    bundled abbreviation database changes.
+#
+
+ABBREVIATION_ATOMS_DATABASE = {
+    "CHES": {"C": 8, "H": 17, "N": 1, "O": 3, "S": 1},
+    "Val": {"C": 5, "H": 11, "N": 1, "O": 2},
+    "BOP": {"C": 12, "H": 22, "F": 6, "N": 6, "O": 1, "P": 2},
+    "CPD": {"C": 5, "H": 6},
+    "DABCO": {"C": 6, "H": 12, "N": 2},
+    "MTBE": {"C": 5, "H": 12, "O": 1},
+    "BuLi": {"C": 4, "H": 9, "Li": 1},
+    "Trp": {"C": 11, "H": 12, "N": 2, "O": 2},
+    "TBTU": {"C": 11, "H": 16, "N": 5, "O": 1, "B": 1, "F": 4},
+    "Cys": {"C": 3, "H": 7, "N": 1, "O": 2, "S": 1},
+    "DCM": {"C": 1, "H": 2, "Cl": 2},
+    "DMPU": {"C": 6, "H": 12, "N": 2, "O": 1},
+    "Bn": {"C": 7, "H": 7},
+    "TEMPO": {"C": 9, "H": 18, "N": 1, "O": 1},
+    "DCC": {"C": 13, "H": 22, "N": 2},
+    "Bu": {"C": 4, "H": 9},
+    "TBDMS": {"C": 6, "H": 15, "Si": 1},
+    "DIBAL": {"C": 16, "H": 38, "Al": 2},
+    "Bz": {"C": 7, "H": 5, "O": 1},
+    "DIBAH": {"C": 16, "H": 38, "Al": 2},
+    "DIBAL-H": {"C": 16, "H": 38, "Al": 2},
+    "HexLi": {"C": 6, "H": 13, "Li": 1},
+    "DMAP": {"C": 7, "H": 10, "N": 2},
+    "DEAD": {"C": 6, "H": 10, "N": 2, "O": 4},
+    "THF": {"C": 4, "H": 8, "O": 1},
+    "Trt": {"C": 19, "H": 15},
+    "Ser": {"C": 3, "H": 7, "N": 1, "O": 3},
+    "LAH": {"Li": 1, "Al": 1, "H": 4},
+    "Lys": {"C": 6, "H": 14, "N": 2, "O": 2},
+    "dG": {"C": 10, "H": 13, "N": 5, "O": 4},
+    "DIAD": {"C": 8, "H": 14, "N": 2, "O": 4},
+    "DBN": {"C": 7, "H": 12, "N": 2},
+    "dC": {"C": 9, "H": 13, "N": 3, "O": 4},
+    "TES_fa": {"C": 6, "H": 15, "N": 1, "O": 6, "S": 1},
+    "dA": {"C": 10, "H": 13, "N": 5, "O": 3},
+    "MoOPH": {"C": 11, "H": 23, "Mo": 1, "N": 3, "O": 6, "P": 1},
+    "MeLi": {"C": 1, "H": 3, "Li": 1},
+    "Arg": {"C": 6, "H": 14, "N": 4, "O": 2},
+    "dT": {"C": 10, "H": 14, "N": 2, "O": 5},
+    "dU": {"C": 9, "H": 12, "N": 2, "O": 5},
+    "DBU": {"C": 9, "H": 16, "N": 2},
+    "Pro": {"C": 5, "H": 9, "N": 1, "O": 2},
+    "MoOPD": {"C": 11, "H": 17, "O": 6, "N": 3, "Mo": 1},
+    "TosMIC": {"C": 9, "H": 9, "N": 1, "O": 2, "S": 1},
+    "Pr": {"C": 3, "H": 7},
+    "DMA": {"C": 4, "H": 9, "N": 1, "O": 1},
+    "DMF": {"C": 3, "H": 7, "N": 1, "O": 1},
+    "Py": {"C": 5, "H": 4, "N": 1},
+    "HATU": {"C": 10, "H": 15, "F": 6, "N": 6, "O": 1, "P": 1},
+    "C": {"C": 9, "H": 13, "N": 3, "O": 5},
+    "IDCP": {"C": 16, "H": 22, "N": 2, "O": 4, "I": 1, "Cl": 1},
+    "TESOTf": {"C": 8, "H": 15, "O": 2, "F": 3, "Si": 1},
+    "DMT": {"C": 21, "H": 19, "O": 2},
+    "PCC": {"C": 5, "H": 6, "N": 1, "Cl": 1, "Cr": 1, "O": 3},
+    "Ph": {"C": 6, "H": 5},
+    "9-BBN": {"C": 16, "H": 30, "B": 2},
+    "LDA": {"C": 6, "H": 14, "Li": 1, "N": 1},
+    "HMDS": {"C": 6, "H": 19, "N": 1, "Si": 2},
+    "Met": {"C": 5, "H": 11, "N": 1, "O": 2, "S": 1},
+    "Leu": {"C": 6, "H": 13, "N": 1, "O": 2},
+    "Mes": {"C": 1, "H": 3, "S": 1, "O": 2},
+    "Me": {"C": 1, "H": 3},
+    "TADDOL": {"C": 31, "H": 30, "O": 4},
+    "G": {"C": 10, "H": 13, "N": 5, "O": 5},
+    "CSA": {"C": 10, "H": 16, "O": 4, "S": 1},
+    "CAPS": {"C": 9, "H": 19, "N": 1, "O": 3, "S": 1},
+    "His": {"C": 6, "H": 9, "N": 3, "O": 2},
+    "Boc": {"C": 5, "H": 9, "O": 2},
+    "Fmoc": {"C": 15, "H": 11, "O": 2},
+    "TBS": {"C": 6, "H": 15, "Si": 1},
+    "MOPS": {"C": 7, "H": 15, "N": 1, "O": 4, "S": 1},
+    "Piv": {"C": 5, "H": 9, "O": 1},
+    "sec-BuLi": {"C": 4, "H": 9, "Li": 1},
+    "Et": {"C": 2, "H": 5},
+    "BTI": {"C": 10, "H": 5, "F": 6, "I": 1, "O": 4},
+    "TMS": {"C": 3, "H": 9, "Si": 1},
+    "ACAC": {"C": 5, "H": 8, "O": 2},
+    "COT": {"C": 8, "H": 8},
+    "mCPBA": {"C": 7, "H": 5, "Cl": 1, "O": 3},
+    "Tos": {"C": 7, "H": 7, "S": 1, "O": 2},
+    "ACN": {"C": 2, "H": 3, "N": 1},
+    "COD": {"C": 8, "H": 12},
+    "Tol": {"C": 7, "H": 7},
+    "PEG-r": {"C": 2, "H": 4, "O": 1},
+    "HEPES": {"C": 8, "H": 18, "N": 2, "O": 4, "S": 1},
+    "NBS": {"C": 4, "H": 4, "Br": 1, "N": 1, "O": 2},
+    "THP": {"C": 5, "H": 9, "O": 1},
+    "TMBE": {"C": 5, "H": 12, "O": 1},
+    "t-BuLi": {"Li": 1, "C": 4, "H": 9},
+    "EtOH": {"C": 2, "H": 6, "O": 1},
+    "SEM": {"C": 6, "H": 15, "O": 1, "Si": 1},
+    "TES": {"C": 6, "H": 15, "Si": 1},
+    "PMB": {"C": 8, "H": 9, "O": 1},
+    "OSu": {"C": 4, "H": 4, "O": 3, "N": 1},
+    "Ac": {"C": 2, "H": 3, "O": 1},
+    "TMEDA": {"C": 6, "H": 16, "N": 2},
+    "t-BuOH": {"C": 4, "H": 10, "O": 1},
+    "tert-BuLi": {"Li": 1, "C": 4, "H": 9},
+    "TRIS": {"C": 4, "H": 11, "N": 1, "O": 3},
+    "EDC": {"C": 8, "H": 17, "N": 3},
+    "HOBt": {"C": 6, "H": 5, "N": 3, "O": 1},
+    "MEM": {"C": 4, "H": 9, "O": 2},
+    "CDI": {"C": 7, "H": 6, "N": 4, "O": 1},
+    "Cy": {"C": 6, "H": 11},
+    "Sec": {"C": 3, "H": 7, "N": 1, "O": 2, "Se": 1},
+    "MES": {"C": 6, "H": 13, "N": 1, "O": 4, "S": 1},
+    "BisTris": {"C": 8, "H": 19, "N": 1, "O": 5},
+    "PIFA": {"C": 10, "H": 5, "F": 6, "I": 1, "O": 4},
+    "Tr": {"C": 19, "H": 15},
+    "BPO": {"C": 14, "H": 10, "O": 4},
+    "DIC": {"C": 7, "H": 14, "N": 2},
+    "MeOH": {"C": 1, "H": 4, "O": 1},
+    "HMPT": {"C": 6, "H": 18, "N": 3, "O": 1, "P": 1},
+    "AIBN": {"C": 8, "H": 12, "N": 4},
+    "Asp": {"C": 4, "H": 7, "N": 1, "O": 4},
+    "DBPO": {"C": 14, "H": 10, "O": 4},
+    "Phe": {"C": 9, "H": 11, "N": 1, "O": 2},
+    "Pyl": {"C": 12, "H": 21, "N": 3, "O": 3},
+    "NHS": {"C": 4, "H": 5, "N": 1, "O": 3},
+    "PyBOP": {"C": 18, "H": 28, "F": 6, "N": 6, "O": 1, "P": 2},
+    "Asn": {"C": 4, "H": 8, "N": 2, "O": 3},
+    "Tyr": {"C": 9, "H": 11, "N": 1, "O": 3},
+    "A": {"C": 10, "H": 13, "N": 5, "O": 4},
+    "AcOH": {"C": 2, "H": 4, "O": 2},
+    "Alloc": {"C": 4, "H": 5, "O": 2},
+    "Ile": {"C": 6, "H": 13, "N": 1, "O": 2},
+    "MOM": {"C": 2, "H": 5, "O": 1},
+    "Gln": {"C": 5, "H": 10, "N": 2, "O": 3},
+    "Thr": {"C": 4, "H": 9, "N": 1, "O": 3},
+    "DNPH": {"C": 6, "H": 6, "N": 4, "O": 4},
+    "Gly": {"C": 2, "H": 5, "N": 1, "O": 2},
+    "U": {"C": 9, "H": 12, "N": 2, "O": 6},
+    "BICINE": {"C": 6, "H": 13, "O": 4, "N": 1},
+    "Bzl": {"C": 7, "H": 7},
+    "Glu": {"C": 5, "H": 9, "N": 1, "O": 4},
+    "DADO": {"C": 4, "H": 8, "N": 2, "O": 2},
+    "TRICINE": {"C": 6, "H": 13, "N": 1, "O": 5},
+    "NCS": {"C": 4, "H": 4, "Cl": 1, "N": 1, "O": 2},
+    "TFA": {"C": 2, "H": 1, "F": 3, "O": 2},
+    "Ala": {"C": 3, "H": 7, "N": 1, "O": 2},
+    "DMSO": {"C": 2, "H": 6, "O": 1, "S": 1},
+    "T": {"C": 10, "H": 14, "N": 2, "O": 6}
+}
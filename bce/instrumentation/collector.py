@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+
+class CollectorInterface:
+    """Interface for instrumentation collectors.
+
+    Note:
+      [1] Stages can be nested (e.g. the molecule stages run inside the
+          "cexp.parse" stage). Each stage is reported by a begin event and an
+          end event, and the events of nested stages are reported between the
+          events of the enclosing stage.
+      [2] The measured times are inclusive (the time of a stage includes the
+          time of its nested stages).
+    """
+
+    def __init__(self):
+        """Initialize."""
+
+        pass
+
+    # noinspection PyMethodMayBeStatic
+    def on_stage_begin(self, stage, expression):
+        """Called when a stage begins.
+
+        :type stage: str
+        :type expression: str | None
+        :param stage: The stage (one of bce.instrumentation.stage.STAGE_* constants).
+        :param expression: The expression that the stage works on (None if not available).
+        """
+
+        raise RuntimeError("on_stage_begin() method should be overrided.")
+
+    # noinspection PyMethodMayBeStatic
+    def on_stage_end(self, stage, expression, wall_time, cpu_time):
+        """Called when a stage ends (whether it succeeded or not).
+
+        :type stage: str
+        :type expression: str | None
+        :type wall_time: float
+        :type cpu_time: float
+        :param stage: The stage (one of bce.instrumentation.stage.STAGE_* constants).
+        :param expression: The expression that the stage works on (None if not available).
+        :param wall_time: The elapsed wall time (in seconds).
+        :param cpu_time: The elapsed CPU time of the process (in seconds).
+        """
+
+        raise RuntimeError("on_stage_end() method should be overrided.")
+
+
+class StageStatistics:
+    """Statistics of a stage."""
+
+    def __init__(self):
+        """Initialize."""
+
+        self.__calls = 0
+        self.__wall = 0.0
+        self.__cpu = 0.0
+        self.__max_wall = 0.0
+        self.__max_wall_input = None
+
+    def get_call_count(self):
+        """Get the count of calls.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__calls
+
+    def get_total_wall_time(self):
+        """Get the total wall time.
+
+        :rtype : float
+        :return: The time (in seconds).
+        """
+
+        return self.__wall
+
+    def get_total_cpu_time(self):
+        """Get the total CPU time.
+
+        :rtype : float
+        :return: The time (in seconds).
+        """
+
+        return self.__cpu
+
+    def get_max_wall_time(self):
+        """Get the wall time of the slowest call.
+
+        :rtype : float
+        :return: The time (in seconds).
+        """
+
+        return self.__max_wall
+
+    def get_max_wall_time_input(self):
+        """Get the input of the slowest call.
+
+        :rtype : str | None
+        :return: The outermost expression that was being processed when the slowest call was made
+                 (None if not available).
+        """
+
+        return self.__max_wall_input
+
+    def add_sample(self, wall_time, cpu_time, input_expression):
+        """Add a sample.
+
+        :type wall_time: float
+        :type cpu_time: float
+        :type input_expression: str | None
+        :param wall_time: The wall time (in seconds).
+        :param cpu_time: The CPU time (in seconds).
+        :param input_expression: The outermost expression that was being processed.
+        """
+
+        self.__calls += 1
+        self.__wall += wall_time
+        self.__cpu += cpu_time
+
+        if self.__calls == 1 or wall_time > self.__max_wall:
+            self.__max_wall = wall_time
+            self.__max_wall_input = input_expression
+
+    def to_dict(self):
+        """Convert the statistics to a dictionary.
+
+        :rtype : dict
+        :return: The dictionary (JSON-serializable).
+        """
+
+        return {
+            "calls": self.__calls,
+            "wall_time": self.__wall,
+            "cpu_time": self.__cpu,
+            "max_wall_time": self.__max_wall,
+            "max_wall_time_input": self.__max_wall_input
+        }
+
+
+class StatisticsCollector(CollectorInterface):
+    """Collector that aggregates the call counts and the times of each stage.
+
+    Note:
+      [1] The slowest call of each stage is attributed to the outermost
+          expression that was being processed (e.g. the chemical equation
+          passed to the public API), so a latency spike in a nested stage
+          (such as solving the matrix) can be traced back to its input.
+      [2] The collector is not thread-safe. Use one collector per thread (or
+          serialize the calls, as the balancer service does).
+    """
+
+    def __init__(self):
+        """Initialize."""
+
+        CollectorInterface.__init__(self)
+
+        self.__stats = {}
+        self.__inputs = []
+
+    def on_stage_begin(self, stage, expression):
+        """Called when a stage begins.
+
+        :type stage: str
+        :type expression: str | None
+        :param stage: The stage.
+        :param expression: The expression that the stage works on (None if not available).
+        """
+
+        if len(self.__inputs) == 0 or self.__inputs[-1] is None:
+            self.__inputs.append(expression)
+        else:
+            self.__inputs.append(self.__inputs[-1])
+
+    def on_stage_end(self, stage, expression, wall_time, cpu_time):
+        """Called when a stage ends.
+
+        :type stage: str
+        :type expression: str | None
+        :type wall_time: float
+        :type cpu_time: float
+        :param stage: The stage.
+        :param expression: The expression that the stage works on (None if not available).
+        :param wall_time: The elapsed wall time (in seconds).
+        :param cpu_time: The elapsed CPU time of the process (in seconds).
+        """
+
+        if len(self.__inputs) != 0:
+            input_expression = self.__inputs.pop()
+        else:
+            input_expression = expression
+
+        stats = self.__stats.get(stage)
+        if stats is None:
+            stats = StageStatistics()
+            self.__stats[stage] = stats
+
+        stats.add_sample(wall_time, cpu_time, input_expression)
+
+    def get_stages(self):
+        """Get the stages that have been recorded.
+
+        :rtype : list[str]
+        :return: The stages.
+        """
+
+        return sorted(self.__stats.keys())
+
+    def get_statistics(self, stage):
+        """Get the statistics of a stage.
+
+        :type stage: str
+        :param stage: The stage.
+        :rtype : StageStatistics | None
+        :return: The statistics (None if the stage has not been recorded).
+        """
+
+        return self.__stats.get(stage)
+
+    def to_dict(self):
+        """Convert all statistics to a dictionary.
+
+        :rtype : dict
+        :return: The dictionary (stage => statistics, JSON-serializable).
+        """
+
+        return dict([(stage, self.__stats[stage].to_dict()) for stage in self.__stats])
+
+    def reset(self):
+        """Remove all recorded statistics."""
+
+        self.__stats.clear()
+        del self.__inputs[:]
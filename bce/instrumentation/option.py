@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.option as _opt
+
+#  Option keys.
+OPT_KEY_COLLECTOR = "instrumentation.collector"
+
+
+class OptionWrapper:
+    """Option operations wrapper."""
+
+    def __init__(self, opt):
+        """Initialize the wrapper.
+
+        :type opt: bce.option.Option
+        :param opt: The option object.
+        """
+
+        self.__opt = opt
+
+    def set_collector(self, collector):
+        """Set the instrumentation collector.
+
+        :type collector: bce.instrumentation.collector.CollectorInterface | None
+        :param collector: The collector (None if the instrumentation is to be disabled).
+        """
+
+        self.__opt.set_option_value(OPT_KEY_COLLECTOR, collector)
+
+    def get_collector(self):
+        """Get the instrumentation collector.
+
+        :rtype : bce.instrumentation.collector.CollectorInterface | None
+        :return: The collector (None if the instrumentation is disabled).
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_COLLECTOR)
+
+
+def initialize_global_option():
+    """Initialize global options."""
+
+    _opt.register_option_pair(OPT_KEY_COLLECTOR, None)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.instrumentation.option as _inst_opt
+import time as _time
+import timeit as _timeit
+
+#  Get the CPU time of current process (time.clock() measures the CPU time on POSIX in Python 2).
+if hasattr(_time, "process_time"):
+    get_cpu_time = _time.process_time
+else:
+    # noinspection PyUnresolvedReferences
+    get_cpu_time = _time.clock
+
+
+def run_stage(options, stage, expression, function, *args, **kwargs):
+    """Run a stage (and report it to the instrumentation collector).
+
+    Note:
+      [1] If no collector is set, the function is called directly, so the
+          overhead is one option lookup.
+
+    :type options: bce.option.Option
+    :type stage: str
+    :type expression: str | None
+    :param options: The options.
+    :param stage: The stage (one of bce.instrumentation.stage.STAGE_* constants).
+    :param expression: The expression that the stage works on (None if not available).
+    :param function: The function that does the work.
+    :param args: The positional arguments of the function.
+    :param kwargs: The keyword arguments of the function.
+    :return: The return value of the function.
+    """
+
+    collector = options.get_option_value(_inst_opt.OPT_KEY_COLLECTOR)
+    if collector is None:
+        return function(*args, **kwargs)
+
+    collector.on_stage_begin(stage, expression)
+
+    wall_begin = _timeit.default_timer()
+    cpu_begin = get_cpu_time()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        cpu_time = get_cpu_time() - cpu_begin
+        wall_time = _timeit.default_timer() - wall_begin
+        collector.on_stage_end(stage, expression, wall_time, cpu_time)
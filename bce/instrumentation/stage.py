@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#  Stage: balancing a chemical equation (the whole call of the public API).
+STAGE_BALANCE = "balance"
+
+#  Stages of the chemical equation parser.
+STAGE_CEXP_TOKENIZE = "cexp.tokenize"
+STAGE_CEXP_PARSE = "cexp.parse"
+
+#  Stages of the molecule parser.
+STAGE_MOLECULE_TOKENIZE = "molecule.tokenize"
+STAGE_MOLECULE_AST_GENERATE = "molecule.ast_generate"
+STAGE_MOLECULE_AST_FOLD = "molecule.ast_fold"
+
+#  Stages of the math expression parser.
+STAGE_MEXP_EVALUATE = "mexp.evaluate"
+
+#  Stages of the balancer.
+STAGE_MATRIX_BUILD = "balancer.matrix_build"
+STAGE_SOLVE = "balancer.solve"
+STAGE_COEFFICIENT_GENERATE = "balancer.coefficient_generate"
+STAGE_INTEGERIZE = "balancer.integerize"
+
+#  Stage: printing a chemical equation.
+STAGE_PRINT = "print"
+
+
+def get_stages():
+    """Get all stages.
+
+    :rtype : list[str]
+    :return: The stages.
+    """
+
+    return [
+        STAGE_BALANCE,
+        STAGE_CEXP_TOKENIZE,
+        STAGE_CEXP_PARSE,
+        STAGE_MOLECULE_TOKENIZE,
+        STAGE_MOLECULE_AST_GENERATE,
+        STAGE_MOLECULE_AST_FOLD,
+        STAGE_MEXP_EVALUATE,
+        STAGE_MATRIX_BUILD,
+        STAGE_SOLVE,
+        STAGE_COEFFICIENT_GENERATE,
+        STAGE_INTEGERIZE,
+        STAGE_PRINT
+    ]
@@ -5,11 +5,20 @@
 #  found in the license.txt file.
 #
 
-import bce.locale.tree as _tree
+import re as _re
 
-#  Message trees container.
+#  Message trees container (each item is a tuple (tree, compiled messages)).
 _MESSAGE_TREES = []
 
+#  Compiled message indexes (language ID => (messages of the language, messages with fallback)).
+_MESSAGE_INDEXES = {}
+
+#  Pattern of placeholders in messages.
+_PLACEHOLDER_PATTERN = _re.compile(r"(\$[0-9]+)")
+
+#  Message tree loaders that haven't been run.
+_PENDING_LOADERS = []
+
 #  Fallback language ID (use English by default).
 _FALLBACK_LANGUAGE_ID = "en_US"
 
@@ -21,7 +30,36 @@ def register_message_tree(tree):
     :param tree: The message tree object.
     """
 
-    _MESSAGE_TREES.append(tree)
+    #  Compile the messages of the tree.
+    messages = tree.get_flattened_messages()
+    compiled = dict([(key_path, _MessageTemplate(messages[key_path])) for key_path in messages])
+
+    _MESSAGE_TREES.append((tree, compiled))
+
+    #  Drop the indexes (they are rebuilt on next lookup).
+    _MESSAGE_INDEXES.clear()
+
+
+def register_message_tree_loader(loader):
+    """Register a message tree loader.
+
+    Note:
+      [1] The loader is run (to register its message trees) when a message is
+          looked up for the first time, so message trees that are never used
+          are never built.
+
+    :type loader: () -> None
+    :param loader: The loader.
+    """
+
+    _PENDING_LOADERS.append(loader)
+
+
+def _run_pending_loaders():
+    """Run all pending message tree loaders."""
+
+    while len(_PENDING_LOADERS) != 0:
+        _PENDING_LOADERS.pop(0)()
 
 
 def register_fallback_language_id(language_id):
@@ -34,6 +72,9 @@ def register_fallback_language_id(language_id):
     global _FALLBACK_LANGUAGE_ID
     _FALLBACK_LANGUAGE_ID = language_id
 
+    #  Drop the indexes (they are rebuilt on next lookup).
+    _MESSAGE_INDEXES.clear()
+
 
 def apply_replace_map(text, replace_map):
     """Apply replace map to a text.
@@ -51,6 +92,99 @@ def apply_replace_map(text, replace_map):
     return text
 
 
+class _MessageTemplate:
+    """Compiled message (split at its placeholders)."""
+
+    __slots__ = ["__text", "__parts"]
+
+    def __init__(self, text):
+        """Initialize the template.
+
+        :type text: str
+        :param text: The message.
+        """
+
+        self.__text = text
+
+        #  Split the message (placeholders are at the odd indexes).
+        parts = _PLACEHOLDER_PATTERN.split(text)
+        if len(parts) == 1:
+            self.__parts = None
+        else:
+            self.__parts = parts
+
+    def get_text(self):
+        """Get the message.
+
+        :rtype : str
+        :return: The message.
+        """
+
+        return self.__text
+
+    def substitute(self, replace_map):
+        """Substitute the placeholders.
+
+        Note:
+          [1] Placeholders are replaced in one pass. Maps whose keys are not
+              placeholders fall back to apply_replace_map().
+
+        :type replace_map: dict[str, str]
+        :param replace_map: The replace map (placeholder => text).
+        :rtype : str
+        :return: The substituted message.
+        """
+
+        for to_replace in replace_map:
+            if not (to_replace[:1] == "$" and to_replace[1:].isdigit()):
+                return apply_replace_map(self.__text, replace_map)
+
+        if self.__parts is None:
+            return self.__text
+
+        parts = list(self.__parts)
+        for idx in range(1, len(parts), 2):
+            parts[idx] = replace_map.get(parts[idx], parts[idx])
+
+        return "".join(parts)
+
+
+def _get_message_index(language_id):
+    """Get the compiled message index of a language.
+
+    :type language_id: str
+    :param language_id: The language ID.
+    :rtype : (dict[str, _MessageTemplate], dict[str, _MessageTemplate])
+    :return: A tuple (messages of the language, messages with the fallback language resolved).
+    """
+
+    index = _MESSAGE_INDEXES.get(language_id)
+    if index is not None:
+        return index
+
+    #  Collect the messages of the language (the tree registered first wins).
+    own_messages = {}
+    for tree, compiled in _MESSAGE_TREES:
+        if not tree.is_language_matches(language_id):
+            continue
+
+        for key_path in compiled:
+            if key_path not in own_messages:
+                own_messages[key_path] = compiled[key_path]
+
+    #  Resolve the fallback language.
+    if language_id == _FALLBACK_LANGUAGE_ID:
+        all_messages = own_messages
+    else:
+        all_messages = dict(_get_message_index(_FALLBACK_LANGUAGE_ID)[0])
+        all_messages.update(own_messages)
+
+    index = (own_messages, all_messages)
+    _MESSAGE_INDEXES[language_id] = index
+
+    return index
+
+
 def get_message(language_id, key_path, default=None, allow_fallback=True, replace_map=None):
     """Get a message from registered message trees.
 
@@ -68,28 +202,20 @@ def get_message(language_id, key_path, default=None, allow_fallback=True, replac
     :return: The message.
     """
 
-    if replace_map is None:
-        replace_map = {}
-
-    for msg_tree in _MESSAGE_TREES:
-        assert isinstance(msg_tree, _tree.MessageTree)
-
-        #  Check the language ID.
-        if not msg_tree.is_language_matches(language_id):
-            continue
-
-        #  Try to get the message from current tree.
-        if msg_tree.has_message(key_path):
-            return apply_replace_map(msg_tree.get_message(key_path), replace_map)
+    #  Load pending message trees.
+    if len(_PENDING_LOADERS) != 0:
+        _run_pending_loaders()
 
+    #  Look up the compiled index.
     if allow_fallback:
-        #  Fallback.
-        return get_message(
-            _FALLBACK_LANGUAGE_ID,
-            key_path,
-            default=default,
-            allow_fallback=False,
-            replace_map=replace_map
-        )
+        template = _get_message_index(language_id)[1].get(key_path)
     else:
+        template = _get_message_index(language_id)[0].get(key_path)
+
+    if template is None:
         raise KeyError("No such message.")
+
+    if replace_map is None or len(replace_map) == 0:
+        return template.get_text()
+
+    return template.substitute(replace_map)
@@ -78,6 +78,36 @@ class MessageTree:
 
         return current
 
+    def get_flattened_messages(self):
+        """Get all messages in the tree.
+
+        Note:
+          [1] Folders whose names contain a dot can't be reached by a key path,
+              so their messages are not included.
+
+        :rtype : dict[str, str]
+        :return: The messages (key path => message).
+        """
+
+        messages = {}
+
+        #  Initialize the stack (each item is a tuple (key path prefix, folder)).
+        stack = [("", self.__tree)]
+
+        while len(stack) != 0:
+            prefix, folder = stack.pop()
+            for name in folder:
+                if "." in name:
+                    continue
+
+                current = folder[name]
+                if isinstance(current, dict):
+                    stack.append((prefix + name + ".", current))
+                elif isinstance(current, str):
+                    messages[prefix + name] = current
+
+        return messages
+
 
 class EnglishMessageTree(MessageTree):
     """Base class for all English message tree classes."""
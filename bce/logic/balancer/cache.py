@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.math.integer as _math_integer
+import collections as _collections
+import sympy as _sympy
+import threading as _threading
+
+#  Cache key kinds.
+_KEY_KIND_PRIMITIVE = 1
+_KEY_KIND_ORDERED = 2
+
+#  Side marks.
+_SIDE_LEFT = 1
+_SIDE_RIGHT = 2
+
+
+def _get_species_signatures(cexp_object):
+    """Get the signature of each molecule of a chemical equation.
+
+    :type cexp_object: bce.parser.interface.cexp_parser.ChemicalEquation
+    :param cexp_object: The chemical equation object.
+    :rtype : (list[tuple], list[tuple] | None)
+    :return: A tuple (signatures, rational signatures). The rational signatures
+             would be None if some atom counts are not rational.
+    """
+
+    #  Initialize.
+    signatures = []
+    rational_signatures = []
+
+    #  Get all items and their sides.
+    all_items = []
+    for idx in range(0, cexp_object.get_left_item_count()):
+        all_items.append((_SIDE_LEFT, cexp_object.get_left_item(idx)))
+    for idx in range(0, cexp_object.get_right_item_count()):
+        all_items.append((_SIDE_RIGHT, cexp_object.get_right_item(idx)))
+
+    for side, item in all_items:
+        atom_dict = item.get_atoms_dictionary()
+        atom_symbols = sorted(atom_dict.keys())
+
+        #  Build the signature.
+        signatures.append((
+            side,
+            item.get_operator_id(),
+            tuple([(atom_symbol, atom_dict[atom_symbol]) for atom_symbol in atom_symbols])
+        ))
+
+        #  Build the rational signature (which is sortable).
+        if rational_signatures is not None:
+            atoms = []
+            for atom_symbol in atom_symbols:
+                parts = _math_integer.get_rational_parts(atom_dict[atom_symbol])
+                if parts is None:
+                    rational_signatures = None
+                    break
+                atoms.append((atom_symbol, parts))
+            else:
+                rational_signatures.append((side, item.get_operator_id(), tuple(atoms)))
+
+    return signatures, rational_signatures
+
+
+def _get_canonical_order(rational_signatures):
+    """Get the canonical order of molecules.
+
+    :type rational_signatures: list[tuple]
+    :param rational_signatures: The rational signatures.
+    :rtype : list[int]
+    :return: The molecule indexes in canonical order.
+    """
+
+    return sorted(range(0, len(rational_signatures)), key=lambda idx: (rational_signatures[idx], idx))
+
+
+class SolutionCache:
+    """LRU cache of balanced coefficients.
+
+    Note:
+      [1] Only the coefficients generated from the model equations are cached.
+          Removing molecules, moving molecules between sides, integerizing and
+          guessing the direction still depend on the options and are always
+          done by the balancer, so the option flags are not parts of the key.
+      [2] If the coefficients were generated from the integer kernel directly,
+          the key is independent of the order of molecules on each side (the
+          primitive integer kernel vector is unique up to its sign). Otherwise,
+          the key is order-sensitive since the form of the solution depends on
+          the order of unknowns.
+      [3] The cache is thread-safe.
+    """
+
+    def __init__(self, capacity=1024):
+        """Initialize the cache.
+
+        :type capacity: int
+        :param capacity: The maximum count of cached solutions.
+        """
+
+        if capacity < 1:
+            raise ValueError("Invalid capacity.")
+
+        self.__cap = capacity
+        self.__data = _collections.OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = _threading.Lock()
+
+    def __len__(self):
+        """Get the count of cached solutions.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return len(self.__data)
+
+    def get_capacity(self):
+        """Get the maximum count of cached solutions.
+
+        :rtype : int
+        :return: The capacity.
+        """
+
+        return self.__cap
+
+    def get_hit_count(self):
+        """Get the count of cache hits.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__hits
+
+    def get_miss_count(self):
+        """Get the count of cache misses.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__misses
+
+    def clear(self):
+        """Remove all cached solutions and reset the counters."""
+
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def __get(self, key):
+        """Get a cached value and mark it as the most recently used one.
+
+        :type key: tuple
+        :param key: The key.
+        :return: The value (None if not found).
+        """
+
+        with self.__lock:
+            value = self.__data.pop(key, None)
+            if value is None:
+                return None
+
+            self.__data[key] = value
+
+        return value
+
+    def __put(self, key, value):
+        """Put a value into the cache (and evict the least recently used one if needed).
+
+        :type key: tuple
+        :param key: The key.
+        :param value: The value.
+        """
+
+        with self.__lock:
+            self.__data.pop(key, None)
+            self.__data[key] = value
+
+            while len(self.__data) > self.__cap:
+                self.__data.popitem(last=False)
+
+    def __count(self, is_hit):
+        """Count a cache hit or miss.
+
+        :type is_hit: bool
+        :param is_hit: Whether it is a cache hit.
+        """
+
+        with self.__lock:
+            if is_hit:
+                self.__hits += 1
+            else:
+                self.__misses += 1
+
+    def lookup(self, cexp_object, unknown_header="X"):
+        """Look up the coefficients of a chemical equation.
+
+        :type cexp_object: bce.parser.interface.cexp_parser.ChemicalEquation
+        :type unknown_header: str
+        :param cexp_object: The chemical equation object.
+        :param unknown_header: The header of unknowns.
+        :rtype : (list, bool) | None
+        :return: A tuple (coefficients, whether the coefficients are integerized) or None if not found.
+        """
+
+        signatures, rational_signatures = _get_species_signatures(cexp_object)
+
+        #  Try the order-insensitive key.
+        if rational_signatures is not None:
+            order = _get_canonical_order(rational_signatures)
+            canonical_coefficients = self.__get((
+                _KEY_KIND_PRIMITIVE,
+                tuple([rational_signatures[idx] for idx in order])
+            ))
+            if canonical_coefficients is not None:
+                self.__count(True)
+
+                #  Restore the origin order.
+                coefficients = [0] * len(order)
+                for canonical_id in range(0, len(order)):
+                    coefficients[order[canonical_id]] = canonical_coefficients[canonical_id]
+
+                #  Let the last non-zero coefficient be positive.
+                for last_value in reversed(coefficients):
+                    if last_value != 0:
+                        if last_value < 0:
+                            coefficients = [-value for value in coefficients]
+                        break
+
+                return [_sympy.Integer(value) for value in coefficients], True
+
+        #  Try the order-sensitive key.
+        coefficients = self.__get((_KEY_KIND_ORDERED, unknown_header, tuple(signatures)))
+        if coefficients is not None:
+            self.__count(True)
+            return list(coefficients), False
+
+        self.__count(False)
+
+        return None
+
+    def store(self, cexp_object, coefficients, is_integerized, unknown_header="X"):
+        """Store the coefficients of a chemical equation.
+
+        :type cexp_object: bce.parser.interface.cexp_parser.ChemicalEquation
+        :type coefficients: list
+        :type is_integerized: bool
+        :type unknown_header: str
+        :param cexp_object: The chemical equation object (before merging coefficients).
+        :param coefficients: The coefficients.
+        :param is_integerized: Whether the coefficients were generated from the integer kernel.
+        :param unknown_header: The header of unknowns.
+        """
+
+        signatures, rational_signatures = _get_species_signatures(cexp_object)
+
+        if is_integerized and rational_signatures is not None:
+            order = _get_canonical_order(rational_signatures)
+            self.__put(
+                (_KEY_KIND_PRIMITIVE, tuple([rational_signatures[idx] for idx in order])),
+                tuple([int(coefficients[idx]) for idx in order])
+            )
+        else:
+            self.__put((_KEY_KIND_ORDERED, unknown_header, tuple(signatures)), tuple(coefficients))
@@ -5,6 +5,7 @@
 #  found in the license.txt file.
 #
 
+import bce.locale.registry as _l10n_reg
 import bce.logic.balancer.l10n as _l10n
 import bce.logic.balancer.option as _option
 
@@ -15,5 +16,5 @@ def initialize_module():
     #  Initialize the global option.
     _option.initialize_global_option()
 
-    #  Setup the localization module.
-    _l10n.setup_localization()
+    #  Setup the localization module (message trees are built on first use).
+    _l10n_reg.register_message_tree_loader(_l10n.setup_localization)
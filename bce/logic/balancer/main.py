@@ -5,6 +5,8 @@
 #  found in the license.txt file.
 #
 
+import bce.instrumentation.probe as _inst_probe
+import bce.instrumentation.stage as _inst_stage
 import bce.locale.option as _l10n_opt
 import bce.locale.registry as _l10n_reg
 import bce.logic.balancer.direction as _bce_direct
@@ -13,7 +15,70 @@ import bce.logic.balancer.merger as _bce_merger
 import bce.logic.balancer.model as _bce_model
 import bce.logic.balancer.option as _bce_option
 import bce.logic.common.error as _cm_error
+import bce.math.constant as _math_constant
 import bce.math.equation as _math_equation
+import bce.math.verification as _math_verification
+
+
+def _generate_coefficients(cexp_object, options, unknown_header="X"):
+    """Generate the coefficients of a chemical equation from its model equations.
+
+    :type cexp_object: bce.parser.interface.cexp_parser.ChemicalEquation
+    :type options: bce.option.Option
+    :type unknown_header: str
+    :param cexp_object: The chemical equation object.
+    :param options: The options.
+    :param unknown_header: The header of unknowns.
+    :rtype : (list, bool)
+    :return: A tuple (coefficients, whether the coefficients are integerized).
+    """
+
+    #  Get the solver.
+    solver = _bce_option.OptionWrapper(options).get_solver()
+
+    #  Build a matrix and backup.
+    equations = _inst_probe.run_stage(
+        options,
+        _inst_stage.STAGE_MATRIX_BUILD,
+        None,
+        _bce_model.build_model_equations,
+        cexp_object
+    )
+
+    #  Try to get integerized coefficients directly.
+    coefficients, solved = _inst_probe.run_stage(
+        options,
+        _inst_stage.STAGE_COEFFICIENT_GENERATE,
+        None,
+        _bce_model.generate_primitive_coefficients,
+        equations,
+        solver=solver
+    )
+    if coefficients is not None:
+        return coefficients, True
+
+    #  Solve the equation (unless the equations were already solved).
+    if solved is None:
+        solved = _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_SOLVE,
+            None,
+            _math_equation.solve_equations,
+            equations,
+            solver=solver
+        )
+
+    #  Post solving.
+    coefficients = _inst_probe.run_stage(
+        options,
+        _inst_stage.STAGE_COEFFICIENT_GENERATE,
+        None,
+        _bce_model.generate_balanced_coefficients,
+        solved,
+        header=unknown_header
+    )
+
+    return coefficients, False
 
 
 def balance_chemical_equation(cexp_object, options, unknown_header="X"):
@@ -51,14 +116,20 @@ def balance_chemical_equation(cexp_object, options, unknown_header="X"):
             options
         )
 
-    #  Build a matrix and backup.
-    equations = _bce_model.build_model_equations(cexp_object)
+    #  Try to get the coefficients from the solution cache.
+    solution_cache = balancer_opt.get_solution_cache()
+    cached = None
+    if solution_cache is not None:
+        cached = solution_cache.lookup(cexp_object, unknown_header=unknown_header)
 
-    #  Solve the equation and check the answer.
-    solved = _math_equation.solve_equations(equations)
+    if cached is not None:
+        coefficients, is_integerized = cached
+    else:
+        coefficients, is_integerized = _generate_coefficients(cexp_object, options, unknown_header)
 
-    #  Post solving.
-    coefficients = _bce_model.generate_balanced_coefficients(solved, header=unknown_header)
+        #  Save the coefficients to the solution cache.
+        if solution_cache is not None:
+            solution_cache.store(cexp_object, coefficients, is_integerized, unknown_header=unknown_header)
 
     #  Merge.
     _bce_merger.merge_coefficients_with_cexp_object(cexp_object, coefficients)
@@ -110,7 +181,13 @@ def balance_chemical_equation(cexp_object, options, unknown_header="X"):
             )
 
     #  Integerize the coefficients.
-    cexp_object.coefficients_integerize()
+    if not is_integerized:
+        _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_INTEGERIZE,
+            None,
+            cexp_object.coefficients_integerize
+        )
 
     #  'All-eliminated' check.
     if len(cexp_object) == 0:
@@ -161,6 +238,106 @@ def balance_chemical_equation(cexp_object, options, unknown_header="X"):
         cexp_object.flip()
 
 
+def _get_check_rows(cexp_object):
+    """Get the conservation rows of a chemical equation.
+
+    Note:
+      [1] The rows are the rows of the model equations (see
+          bce.logic.balancer.model.build_model_equations()), but they are
+          built from the atoms dictionaries directly (no matrix is needed).
+
+    :type cexp_object: bce.parser.interface.cexp_parser.ChemicalEquation
+    :param cexp_object: The chemical equation object.
+    :rtype : list[list]
+    :return: The rows (each row is a list of tuples (count, coefficient) whose products should sum to zero).
+    """
+
+    #  Get the items (and the sign of the atom counts of each side).
+    items = []
+    for idx in range(0, cexp_object.get_left_item_count()):
+        items.append((cexp_object.get_left_item(idx), True))
+    for idx in range(0, cexp_object.get_right_item_count()):
+        items.append((cexp_object.get_right_item(idx), False))
+
+    #  Collect the terms of each atom.
+    rows = {}
+    for item, is_left in items:
+        #  Move the sign to the coefficient (once per molecule).
+        coefficient = item.get_coefficient()
+        if is_left != item.is_operator_plus():
+            coefficient = -coefficient
+
+        atom_dict = item.get_atoms_dictionary()
+        for atom in atom_dict:
+            terms = rows.get(atom)
+            if terms is None:
+                terms = []
+                rows[atom] = terms
+            terms.append((atom_dict[atom], coefficient))
+
+    return list(rows.values())
+
+
+def _is_symbolic_row_satisfied(terms):
+    """Check whether a row that contains symbols is satisfied.
+
+    :type terms: list
+    :param terms: The terms (tuples (count, coefficient)).
+    :rtype : bool
+    :return: True if the products sum to zero.
+    """
+
+    sum_value = _math_constant.ZERO
+    for count, coefficient in terms:
+        sum_value += count * coefficient
+
+    #  Skip simplifying if the terms were cancelled out already.
+    if sum_value == _math_constant.ZERO:
+        return True
+
+    return sum_value.simplify() == _math_constant.ZERO
+
+
+def check_chemical_equations(cexp_objects, use_numpy=False):
+    """Check whether each of a batch of chemical equations is balanced.
+
+    Note:
+      [1] Rows that contain only rational numbers are checked with exact
+          integers. They are batched across all chemical equations (and
+          checked with NumPy if it is available and the batch is large
+          enough). Only rows that contain symbols are simplified with SymPy.
+
+    :type cexp_objects: list[bce.parser.interface.cexp_parser.ChemicalEquation]
+    :type use_numpy: bool
+    :param cexp_objects: The chemical equation objects.
+    :param use_numpy: Whether NumPy can be used.
+    :rtype : list[bool]
+    :return: Whether each chemical equation is balanced.
+    """
+
+    balanced = [True] * len(cexp_objects)
+
+    #  Collect the integer rows (and check the symbolic rows).
+    integer_rows = []
+    integer_row_owners = []
+    for cexp_id in range(0, len(cexp_objects)):
+        for terms in _get_check_rows(cexp_objects[cexp_id]):
+            row = _math_verification.normalize_rational_row(terms)
+            if row is not None:
+                integer_rows.append(row)
+                integer_row_owners.append(cexp_id)
+            elif balanced[cexp_id] and not _is_symbolic_row_satisfied(terms):
+                balanced[cexp_id] = False
+
+    #  Check the integer rows.
+    satisfied = _math_verification.check_integer_rows(integer_rows, use_numpy=use_numpy)
+    for row_id in range(0, len(integer_rows)):
+        if not satisfied[row_id]:
+            balanced[integer_row_owners[row_id]] = False
+
+    return balanced
+
+
 def check_chemical_equation(cexp_object):
     """Check whether a chemical equation is balanced.
 
@@ -170,15 +347,4 @@ def check_chemical_equation(cexp_object):
     :return: True if so.
     """
 
-    #  Build matrix.
-    mtx = _bce_model.build_model_equations(cexp_object)
-
-    #  Generate the solution of the matrix from the expression.
-    pfx_list = []
-    for i in range(0, cexp_object.get_left_item_count()):
-        pfx_list.append(cexp_object.get_left_item(i).get_coefficient())
-    for i in range(0, cexp_object.get_right_item_count()):
-        pfx_list.append(cexp_object.get_right_item(i).get_coefficient())
-
-    #  Check whether the solution matches with the matrix.
-    return _math_equation.check_answer(mtx, pfx_list)
+    return check_chemical_equations([cexp_object])[0]
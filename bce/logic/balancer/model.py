@@ -5,8 +5,13 @@
 #  found in the license.txt file.
 #
 
+import bce.math.bareiss as _math_bareiss
+import bce.math.equation as _math_equation
+import bce.math.integer as _math_integer
 import bce.math.matrix as _math_matrix
+import bce.math.modular as _math_modular
 import bce.math.constant as _math_constant
+import bce.math.solver as _math_solver
 import sympy as _sympy
 
 
@@ -15,7 +20,7 @@ def build_model_equations(cexp_object):
 
     :type cexp_object: bce.parser.interface.cexp_parser.ChemicalEquation
     :param cexp_object: The chemical equation object.
-    :rtype : bce.math.matrix.Matrix
+    :rtype : bce.math.matrix.SparseMatrix
     :return: The model equations matrix.
     """
 
@@ -50,8 +55,9 @@ def build_model_equations(cexp_object):
                 ref_atom_idx[atom_symbol] = ref_atom_counter
                 ref_atom_counter += 1
 
-    #  Build an empty matrix that only contains zero.
-    mtx = _math_matrix.Matrix(len(ref_atom_idx), len(cexp_object) + 1, _math_constant.ZERO)
+    #  Build an empty sparse matrix that only contains zero (each molecule only
+    #  contains a few of the atoms).
+    mtx = _math_matrix.SparseMatrix(len(ref_atom_idx), len(cexp_object) + 1, _math_constant.ZERO)
 
     #  Initialize column index counter.
     column_id = 0
@@ -95,6 +101,176 @@ def build_model_equations(cexp_object):
     return mtx
 
 
+def make_primitive_coefficients(vector):
+    """Scale a rational kernel vector of the model equations to primitive integer coefficients.
+
+    Note:
+      [1] The GCD of the coefficients is 1 and the last non-zero coefficient is
+          positive, which is the form of the only basis vector of a
+          one-dimensional integer kernel (see bce.math.lattice.get_integer_kernel()).
+
+    :type vector: list[int | fractions.Fraction]
+    :param vector: The kernel vector (not zero).
+    :rtype : list
+    :return: The coefficients list.
+    """
+
+    #  Scale the vector to integers.
+    denominator_lcm = 1
+    for value in vector:
+        denominator = value.denominator
+        if denominator != 1:
+            denominator_lcm = _math_integer.lcm(denominator_lcm, denominator)
+    integers = [int(value * denominator_lcm) for value in vector]
+
+    #  Get the divisor (and make the last non-zero item positive).
+    divisor = 0
+    for value in integers:
+        divisor = _math_integer.gcd(divisor, value)
+    for value in reversed(integers):
+        if value != 0:
+            if value < 0:
+                divisor = -divisor
+            break
+
+    return [_sympy.Integer(value // divisor) for value in integers]
+
+
+def _get_free_column(pivot_columns, unknown_count):
+    """Get the only free column of the reduced row echelon form of homogeneous equations.
+
+    :type pivot_columns: list[int]
+    :type unknown_count: int
+    :param pivot_columns: The pivot columns.
+    :param unknown_count: The count of unknowns.
+    :rtype : int | None
+    :return: The free column (None if the kernel isn't one-dimensional).
+    """
+
+    #  The kernel must be one-dimensional.
+    if len(pivot_columns) + 1 != unknown_count:
+        return None
+
+    for column_id in range(0, len(pivot_columns)):
+        if pivot_columns[column_id] != column_id:
+            return column_id
+
+    return unknown_count - 1
+
+
+def _read_primitive_coefficients(pivot_columns, reduced_rows, unknown_count):
+    """Read primitive integer coefficients from the reduced row echelon form of homogeneous equations.
+
+    :type pivot_columns: list[int]
+    :type reduced_rows: list[dict[int, fractions.Fraction]]
+    :type unknown_count: int
+    :param pivot_columns: The pivot columns.
+    :param reduced_rows: The pivot rows of the reduced row echelon form.
+    :param unknown_count: The count of unknowns.
+    :rtype : list | None
+    :return: The coefficients list (None if the kernel isn't one-dimensional).
+    """
+
+    free_column_id = _get_free_column(pivot_columns, unknown_count)
+    if free_column_id is None:
+        return None
+
+    #  Read the kernel vector from the reduced row echelon form.
+    vector = [-row.get(free_column_id, 0) for row in reduced_rows]
+    vector.insert(free_column_id, 1)
+
+    return make_primitive_coefficients(vector)
+
+
+def _read_primitive_coefficients_integer(pivot_columns, rows, divisor, unknown_count):
+    """Read primitive integer coefficients from the fraction-free reduced row echelon form of homogeneous equations.
+
+    Note:
+      [1] The kernel vector is scaled with the divisor, so all its items are
+          integers and no fraction is created.
+
+    :type pivot_columns: list[int]
+    :type rows: list[dict[int, int]]
+    :type divisor: int
+    :type unknown_count: int
+    :param pivot_columns: The pivot columns.
+    :param rows: The integer rows reduced by bce.math.bareiss.reduce_integer_rows().
+    :param divisor: The divisor.
+    :param unknown_count: The count of unknowns.
+    :rtype : list | None
+    :return: The coefficients list (None if the kernel isn't one-dimensional).
+    """
+
+    free_column_id = _get_free_column(pivot_columns, unknown_count)
+    if free_column_id is None:
+        return None
+
+    #  Read the kernel vector (scaled with the divisor) from the reduced row echelon form.
+    vector = [-rows[row_id].get(free_column_id, 0) for row_id in range(0, len(pivot_columns))]
+    vector.insert(free_column_id, divisor)
+
+    return make_primitive_coefficients(vector)
+
+
+def generate_primitive_coefficients(mtx, solver=_math_solver.SOLVER_BAREISS):
+    """Generate primitive integer coefficients directly from the model equations.
+
+    Note:
+      [1] This only works when all items of the model equations are rational
+          numbers and the equations have exactly one independent solution.
+      [2] The coefficients are the only primitive vector of the integer kernel
+          of the model equations, so they are already integerized (the GCD of
+          all coefficients is 1) and have the same sign as the coefficients
+          generated by generate_balanced_coefficients().
+      [3] The kernel is read from the reduced row echelon form that is computed
+          with fraction-free elimination (see bce.math.bareiss), or modulo
+          several primes with the modular solver (see bce.math.modular). If the
+          modular elimination fails, the former is used.
+      [4] If the equations have several independent solutions, the solution
+          system is built from the same reduced row echelon form, so the
+          equations needn't be solved again.
+
+    :type mtx: bce.math.matrix.SparseMatrix
+    :type solver: str
+    :param mtx: The model equations matrix.
+    :param solver: The solver (one of bce.math.solver.SOLVER_* constants).
+    :rtype : (list | None, bce.math.equation.SolutionSystem | None)
+    :return: A tuple (coefficients, solution system). The coefficients would be None if they can't be
+             generated directly. The solution system would be None if the equations weren't solved.
+    """
+
+    #  Convert the model equations to integer rows.
+    rows = _math_bareiss.convert_matrix_to_integer_rows(mtx)
+    if rows is None:
+        return None, None
+
+    #  The equations must be homogeneous.
+    column_count = mtx.get_column_count()
+    unknown_count = column_count - 1
+    for row in rows:
+        if unknown_count in row:
+            return None, None
+
+    #  Try to get the reduced row echelon form modulo several primes.
+    if solver == _math_solver.SOLVER_MODULAR:
+        reduced = _math_modular.reduce_integer_rows(rows, column_count)
+        if reduced is not None:
+            pivot_columns, reduced_rows = reduced
+            coefficients = _read_primitive_coefficients(pivot_columns, reduced_rows, unknown_count)
+            if coefficients is not None:
+                return coefficients, None
+
+            return None, _math_equation.build_fraction_solution_system(column_count, pivot_columns, reduced_rows)
+
+    #  Get the fraction-free reduced row echelon form.
+    pivot_columns, divisor = _math_bareiss.reduce_integer_rows(rows, column_count)
+    coefficients = _read_primitive_coefficients_integer(pivot_columns, rows, divisor, unknown_count)
+    if coefficients is not None:
+        return coefficients, None
+
+    return None, _math_equation.build_integer_solution_system(rows, column_count, pivot_columns, divisor)
+
+
 def generate_balanced_coefficients(solution, header="X"):
     """Generate balanced coefficients from the result of equations.
 
@@ -5,11 +5,14 @@
 #  found in the license.txt file.
 #
 
+import bce.math.solver as _math_solver
 import bce.option as _opt
 
 #  Option keys.
 OPT_KEY_ERROR_CORRECTION_ENABLED = "logic.balancer.feature.error_correction"
 OPT_KEY_AUTO_SIDE_ARRANGING_ENABLED = "logic.balancer.feature.auto_side_arrange"
+OPT_KEY_SOLUTION_CACHE = "logic.balancer.solution_cache"
+OPT_KEY_SOLVER = "logic.balancer.solver"
 
 
 class OptionWrapper:
@@ -60,9 +63,47 @@ class OptionWrapper:
 
         return self.__opt.get_option_value(OPT_KEY_AUTO_SIDE_ARRANGING_ENABLED)
 
+    def set_solution_cache(self, cache):
+        """Set the solution cache.
+
+        :type cache: bce.logic.balancer.cache.SolutionCache | None
+        :param cache: The cache (None if caching is to be disabled).
+        """
+
+        self.__opt.set_option_value(OPT_KEY_SOLUTION_CACHE, cache)
+
+    def get_solution_cache(self):
+        """Get the solution cache.
+
+        :rtype : bce.logic.balancer.cache.SolutionCache | None
+        :return: The cache (None if caching is disabled).
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_SOLUTION_CACHE)
+
+    def set_solver(self, solver):
+        """Set the solver of model equations whose coefficients are all rational numbers.
+
+        :type solver: str
+        :param solver: The solver (one of bce.math.solver.SOLVER_* constants).
+        """
+
+        self.__opt.set_option_value(OPT_KEY_SOLVER, solver)
+
+    def get_solver(self):
+        """Get the solver of model equations whose coefficients are all rational numbers.
+
+        :rtype : str
+        :return: The solver (one of bce.math.solver.SOLVER_* constants).
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_SOLVER)
+
 
 def initialize_global_option():
     """Initialize global options."""
 
     _opt.register_option_pair(OPT_KEY_ERROR_CORRECTION_ENABLED, True)
     _opt.register_option_pair(OPT_KEY_AUTO_SIDE_ARRANGING_ENABLED, True)
+    _opt.register_option_pair(OPT_KEY_SOLUTION_CACHE, None)
+    _opt.register_option_pair(OPT_KEY_SOLVER, _math_solver.SOLVER_BAREISS)
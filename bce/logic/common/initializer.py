@@ -5,10 +5,11 @@
 #  found in the license.txt file.
 #
 
+import bce.locale.registry as _l10n_reg
 import bce.logic.common.l10n as _l10n
 
 
 def initialize_module():
     """Initialize the module."""
 
-    _l10n.setup_localization()
+    _l10n_reg.register_message_tree_loader(_l10n.setup_localization)
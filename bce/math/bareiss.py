@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    This module implements the fraction-free (Bareiss) Gauss-Jordan elimination
+#    on native Python integers. All intermediate values are minors of the origin
+#    matrix, so every division in this module is exact.
+#
+#    Integer rows are sparse: each row is a dictionary (column index => value)
+#    that only contains non-zero items.
+#
+
+import bce.math.integer as _integer
+
+
+def convert_matrix_to_integer_rows(mtx):
+    """Convert a matrix that only contains rational numbers to integer rows.
+
+    Note:
+      [1] Each row is multiplied with the LCM of the denominators of its items,
+          which doesn't change the solution of the equations.
+
+    :type mtx: bce.math.matrix.Matrix | bce.math.matrix.SparseMatrix
+    :param mtx: The matrix.
+    :rtype : list[dict[int, int]] | None
+    :return: The integer rows (None if the matrix contains non-rational items).
+    """
+
+    #  Only non-default items have to be visited if the default value is zero.
+    zero_default = (_integer.get_rational_parts(mtx.get_default_value()) == (0, 1))
+
+    #  Initialize the rows container.
+    rows = []
+
+    for row_id in range(0, mtx.get_row_count()):
+        #  Get items of current row.
+        if zero_default:
+            items = mtx.get_row_items(row_id)
+        else:
+            items = []
+            for column_id in range(0, mtx.get_column_count()):
+                items.append((column_id, mtx.get_item_by_position(row_id, column_id)))
+
+        #  Get the numerator and the denominator of each item.
+        numerators = []
+        denominator_lcm = 1
+        for column_id, value in items:
+            parts = _integer.get_rational_parts(value)
+            if parts is None:
+                return None
+            if parts[0] != 0:
+                numerators.append((column_id, parts[0], parts[1]))
+                denominator_lcm = _integer.lcm(denominator_lcm, parts[1])
+
+        #  Scale the row to integers.
+        row = {}
+        for column_id, numerator, denominator in numerators:
+            row[column_id] = numerator * (denominator_lcm // denominator)
+        rows.append(row)
+
+    return rows
+
+
+def reduce_integer_rows(rows, column_count):
+    """Reduce integer rows to the fraction-free reduced row echelon form.
+
+    Note:
+      [1] The rows will be changed during reducing.
+      [2] The last column is treated as the constant column and is never used
+          as a pivot column.
+      [3] After reducing, the item at the pivot position of each pivot row equals
+          to the returned divisor, so the reduced row echelon form can be got by
+          dividing all items with the divisor.
+      [4] Among the rows that can be used as the pivot row of a column, the row
+          with the fewest non-zero items is chosen (sparsest-row pivoting) to
+          limit the fill-in. Pivot columns are still chosen from left to right,
+          so the reduced row echelon form is the same as the dense one.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :param rows: The integer rows.
+    :param column_count: The count of columns.
+    :rtype : (list[int], int)
+    :return: A tuple (pivot columns, divisor).
+    """
+
+    #  Initialize the pivot columns container.
+    pivot_columns = []
+
+    #  Initialize the previous pivot value.
+    previous = 1
+
+    row_count = len(rows)
+    cursor_row = 0
+    for cursor_column in range(0, column_count - 1):
+        if cursor_row >= row_count:
+            break
+
+        #  Find the sparsest row that has a non-zero item in current column.
+        pivot_row_id = None
+        for row_id in range(cursor_row, row_count):
+            row = rows[row_id]
+            if cursor_column in row and (pivot_row_id is None or len(row) < len(rows[pivot_row_id])):
+                pivot_row_id = row_id
+
+        #  If there is no non-zero item, keep finding in next column.
+        if pivot_row_id is None:
+            continue
+
+        #  Exchange the pivot row with current row.
+        rows[cursor_row], rows[pivot_row_id] = rows[pivot_row_id], rows[cursor_row]
+        pivot_row = rows[cursor_row]
+        pivot_value = pivot_row[cursor_column]
+
+        #  Eliminate all other rows.
+        for row_id in range(0, row_count):
+            if row_id == cursor_row:
+                continue
+
+            row = rows[row_id]
+            factor = row.get(cursor_column, 0)
+            if factor == 0:
+                #  Only rescaling is needed.
+                if pivot_value != previous:
+                    for column_id in row:
+                        row[column_id] = row[column_id] * pivot_value // previous
+            else:
+                new_row = {}
+                for column_id in row:
+                    value = row[column_id] * pivot_value - factor * pivot_row.get(column_id, 0)
+                    if value != 0:
+                        new_row[column_id] = value // previous
+                for column_id in pivot_row:
+                    if column_id not in row:
+                        new_row[column_id] = (-factor * pivot_row[column_id]) // previous
+                rows[row_id] = new_row
+
+        #  Save the pivot.
+        pivot_columns.append(cursor_column)
+        previous = pivot_value
+        cursor_row += 1
+
+    return pivot_columns, previous
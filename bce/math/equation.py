@@ -10,8 +10,12 @@
 #    In this module, all items in a matrix should be SymPy objects.
 #
 
+import bce.math.bareiss as _bareiss
 import bce.math.constant as _constant
 import bce.math.matrix as _matrix
+import bce.math.modular as _modular
+import bce.math.solver as _solver
+import sympy as _sympy
 
 
 class SolutionSystem:
@@ -62,15 +66,198 @@ class SolutionSystem:
         return len(self.__const_vector)
 
 
-def solve_equations(mtx):
+def solve_equations(mtx, solver=_solver.SOLVER_BAREISS):
     """Solve a linear equation group.
 
     Note:
       [1] The source matrix will be changed during solving the equations.
           If you want to keep the origin matrix, you have to copy it before
           calling this method.
+      [2] If the matrix only contains rational numbers, the equations would be
+          solved with native integers (see _solve_equations_integer() and
+          _solve_equations_modular()). SymPy would only be used when symbols
+          exist in the matrix.
+      [3] Both solvers give the same solution system. The modular solver keeps
+          the intermediate numbers small, which pays off when the coefficients
+          grow large during the fraction-free elimination.
+
+    :type mtx: bce.math.matrix.Matrix | bce.math.matrix.SparseMatrix
+    :type solver: str
+    :param mtx: The matrix of the equations.
+    :param solver: The solver of equations whose coefficients are all rational numbers (one of
+                   bce.math.solver.SOLVER_* constants).
+    :rtype : SolutionSystem
+    :return: The solution system.
+    """
 
-    :type mtx: bce.math.matrix.Matrix
+    #  Try to convert the matrix to integer rows.
+    integer_rows = _bareiss.convert_matrix_to_integer_rows(mtx)
+
+    if integer_rows is None:
+        return _solve_equations_symbolic(mtx)
+
+    if solver == _solver.SOLVER_MODULAR:
+        return _solve_equations_modular(integer_rows, mtx.get_column_count())
+    elif solver == _solver.SOLVER_BAREISS:
+        return _solve_equations_integer(integer_rows, mtx.get_column_count())
+    else:
+        raise ValueError("Unknown solver.")
+
+
+def _build_solution_system(column_count, pivot_columns, get_item):
+    """Build the solution system from the reduced row echelon form of the equations.
+
+    :type column_count: int
+    :type pivot_columns: list[int]
+    :type get_item: (int, int) -> sympy.Rational
+    :param column_count: The count of columns.
+    :param pivot_columns: The pivot column of each pivot row.
+    :param get_item: A function that gets an item (by row index and column index) of the reduced row echelon form.
+    :rtype : SolutionSystem
+    :return: The solution system.
+    """
+
+    #  Map each pivot column to its row.
+    pivot_rows = {}
+    for row_id in range(0, len(pivot_columns)):
+        pivot_rows[pivot_columns[row_id]] = row_id
+
+    #  Get base-vector columns.
+    unknown_count = column_count - 1
+    bv_columns = []
+    for column_id in range(0, unknown_count):
+        if column_id not in pivot_rows:
+            bv_columns.append(column_id)
+
+    #  Build the base vectors.
+    bv_mtx = _matrix.Matrix(unknown_count, len(bv_columns))
+    for bv_id in range(0, len(bv_columns)):
+        bv_column = bv_columns[bv_id]
+        for column_id in range(0, unknown_count):
+            if column_id == bv_column:
+                item = _constant.ONE
+            elif column_id in pivot_rows:
+                item = -get_item(pivot_rows[column_id], bv_column)
+            else:
+                item = _constant.ZERO
+            bv_mtx.write_item_by_position(column_id, bv_id, item)
+
+    #  Construct the constant vector.
+    const_vector = []
+    for column_id in range(0, unknown_count):
+        if column_id in pivot_rows:
+            const_vector.append(get_item(pivot_rows[column_id], column_count - 1))
+        else:
+            const_vector.append(_constant.ZERO)
+
+    return SolutionSystem(const_vector, bv_mtx)
+
+
+def build_integer_solution_system(rows, column_count, pivot_columns, divisor):
+    """Build the solution system from the fraction-free reduced row echelon form of the equations.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :type pivot_columns: list[int]
+    :type divisor: int
+    :param rows: The integer rows reduced by bce.math.bareiss.reduce_integer_rows().
+    :param column_count: The count of columns.
+    :param pivot_columns: The pivot columns.
+    :param divisor: The divisor.
+    :rtype : SolutionSystem
+    :return: The solution system.
+    """
+
+    return _build_solution_system(
+        column_count,
+        pivot_columns,
+        lambda row_id, column_id: _sympy.Rational(rows[row_id].get(column_id, 0), divisor)
+    )
+
+
+def build_fraction_solution_system(column_count, pivot_columns, reduced_rows):
+    """Build the solution system from the reduced row echelon form (with fractions) of the equations.
+
+    :type column_count: int
+    :type pivot_columns: list[int]
+    :type reduced_rows: list[dict[int, fractions.Fraction]]
+    :param column_count: The count of columns.
+    :param pivot_columns: The pivot columns.
+    :param reduced_rows: The pivot rows reduced by bce.math.modular.reduce_integer_rows().
+    :rtype : SolutionSystem
+    :return: The solution system.
+    """
+
+    return _build_solution_system(
+        column_count,
+        pivot_columns,
+        lambda row_id, column_id: _convert_fraction(reduced_rows[row_id].get(column_id))
+    )
+
+
+def _solve_equations_integer(rows, column_count):
+    """Solve a linear equation group whose coefficients are all integers.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :param rows: The integer rows of the equations.
+    :param column_count: The count of columns.
+    :rtype : SolutionSystem
+    :return: The solution system.
+    """
+
+    #  Reduce the rows with fraction-free elimination.
+    pivot_columns, divisor = _bareiss.reduce_integer_rows(rows, column_count)
+
+    return build_integer_solution_system(rows, column_count, pivot_columns, divisor)
+
+
+def _convert_fraction(item):
+    """Convert a fraction to a SymPy rational number.
+
+    :type item: fractions.Fraction | None
+    :param item: The fraction (None if zero).
+    :rtype : sympy.Rational
+    :return: The rational number.
+    """
+
+    if item is None:
+        return _constant.ZERO
+
+    return _sympy.Rational(item.numerator, item.denominator)
+
+
+def _solve_equations_modular(rows, column_count):
+    """Solve a linear equation group whose coefficients are all integers with multi-modular elimination.
+
+    Note:
+      [1] If the multi-modular elimination fails (e.g. the equations are
+          inconsistent), the equations would be solved with fraction-free
+          elimination instead.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :param rows: The integer rows of the equations.
+    :param column_count: The count of columns.
+    :rtype : SolutionSystem
+    :return: The solution system.
+    """
+
+    #  Reduce the rows modulo several primes.
+    reduced = _modular.reduce_integer_rows(rows, column_count)
+    if reduced is None:
+        return _solve_equations_integer(rows, column_count)
+
+    return build_fraction_solution_system(column_count, reduced[0], reduced[1])
+
+
+def _solve_equations_symbolic(mtx):
+    """Solve a linear equation group that contains symbols.
+
+    Note:
+      [1] The source matrix will be changed during solving the equations.
+
+    :type mtx: bce.math.matrix.Matrix | bce.math.matrix.SparseMatrix
     :param mtx: The matrix of the equations.
     :rtype : SolutionSystem
     :return: The solution system.
@@ -116,9 +303,11 @@ def solve_equations(mtx):
             item = item.simplify()
             mtx.write_item_by_position(cursor_row, column_id, item)
 
-        #  Eliminate other rows.
+        #  Eliminate other rows (skip rows that have nothing to be eliminated).
         for row_id in range(cursor_row + 1, mtx.get_row_count()):
             first_value = mtx.get_item_by_position(row_id, cursor_column)
+            if first_value.is_zero:
+                continue
             for column_id in range(cursor_column, mtx.get_column_count()):
                 item = mtx.get_item_by_position(row_id, column_id)
                 item -= first_value * mtx.get_item_by_position(cursor_row, column_id)
@@ -140,6 +329,8 @@ def solve_equations(mtx):
     for cursor_row, cursor_column in diagonal_line:
         for row_id in range(0, cursor_row):
             first_value = mtx.get_item_by_position(row_id, cursor_column)
+            if first_value.is_zero:
+                continue
             for column_id in range(cursor_column, mtx.get_column_count()):
                 item = mtx.get_item_by_position(row_id, column_id)
                 item -= first_value * mtx.get_item_by_position(cursor_row, column_id)
@@ -210,13 +401,21 @@ def check_answer(mtx, answers):
     :return: True if satisfied.
     """
 
+    #  Only non-default items have to be visited if the default value is zero.
+    zero_default = (mtx.get_default_value() == _constant.ZERO)
+
     for row_id in range(0, mtx.get_row_count()):
         #  Initialize sum.
         sum_value = _constant.ZERO
 
         #  Get the sum.
-        for col_id in range(0, mtx.get_column_count() - 1):
-            sum_value += mtx.get_item_by_position(row_id, col_id) * answers[col_id]
+        if zero_default:
+            for col_id, value in mtx.get_row_items(row_id):
+                if col_id + 1 < mtx.get_column_count():
+                    sum_value += value * answers[col_id]
+        else:
+            for col_id in range(0, mtx.get_column_count() - 1):
+                sum_value += mtx.get_item_by_position(row_id, col_id) * answers[col_id]
 
         #  Simplify before checking.
         sum_value = sum_value.simplify()
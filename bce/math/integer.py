@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    In this module, all numbers should be native Python integers.
+#
+
+
+def gcd(a, b):
+    """Get the greatest common divisor of two integers.
+
+    :type a: int
+    :type b: int
+    :param a: The first integer.
+    :param b: The second integer.
+    :rtype : int
+    :return: The greatest common divisor (always non-negative).
+    """
+
+    a = abs(a)
+    b = abs(b)
+    while b != 0:
+        a, b = b, a % b
+
+    return a
+
+
+def lcm(a, b):
+    """Get the least common multiple of two integers.
+
+    :type a: int
+    :type b: int
+    :param a: The first integer.
+    :param b: The second integer.
+    :rtype : int
+    :return: The least common multiple (always non-negative).
+    """
+
+    if a == 0 or b == 0:
+        return 0
+
+    return abs(a // gcd(a, b) * b)
+
+
+def get_rational_parts(value):
+    """Get the numerator and the denominator of a rational value.
+
+    :param value: The value (a native integer or a SymPy object).
+    :rtype : (int, int) | None
+    :return: A tuple (numerator, denominator) or None if the value isn't a rational number.
+    """
+
+    #  Native integers.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value, 1
+
+    #  SymPy rational numbers (including integers).
+    if getattr(value, "is_Rational", False) is True:
+        return int(value.p), int(value.q)
+
+    return None
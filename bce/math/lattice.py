@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    In this module, all numbers should be native Python integers. Only unimodular
+#    row operations (exchanging, negating and adding integer multiples of rows)
+#    are used, so the integer lattices are kept unchanged.
+#
+
+
+def _echelon_column(vectors, cursor, column_id):
+    """Eliminate one column of the vectors below the cursor with Euclid's algorithm.
+
+    :type vectors: list[list[int]]
+    :type cursor: int
+    :type column_id: int
+    :param vectors: The vectors.
+    :param cursor: The cursor (index of the first vector to be processed).
+    :param column_id: The column index.
+    :rtype : bool
+    :return: True if a pivot was placed at the cursor.
+    """
+
+    while True:
+        #  Find the vector that has the smallest non-zero item in current column.
+        pivot_id = None
+        for vector_id in range(cursor, len(vectors)):
+            value = vectors[vector_id][column_id]
+            if value != 0 and (pivot_id is None or abs(value) < abs(vectors[pivot_id][column_id])):
+                pivot_id = vector_id
+
+        #  No pivot in current column.
+        if pivot_id is None:
+            return False
+
+        #  Move the pivot vector to the cursor.
+        vectors[cursor], vectors[pivot_id] = vectors[pivot_id], vectors[cursor]
+        pivot_vector = vectors[cursor]
+        pivot_value = pivot_vector[column_id]
+
+        #  Reduce other vectors with the pivot vector.
+        done = True
+        for vector_id in range(cursor + 1, len(vectors)):
+            vector = vectors[vector_id]
+            if vector[column_id] == 0:
+                continue
+            quotient = vector[column_id] // pivot_value
+            for idx in range(0, len(vector)):
+                vector[idx] -= quotient * pivot_vector[idx]
+            if vector[column_id] != 0:
+                done = False
+
+        if done:
+            return True
+
+
+def hermite_normal_form(vectors, length):
+    """Get the Hermite normal form of a lattice basis.
+
+    Note:
+      [1] The columns are processed from the last one to the first one, so the
+          last non-zero item of each result vector is its (positive) pivot.
+      [2] Items above each pivot are reduced into [0, pivot).
+
+    :type vectors: list[list[int]]
+    :type length: int
+    :param vectors: The basis vectors (will be changed).
+    :param length: The length of each vector.
+    :rtype : list[list[int]]
+    :return: The non-zero vectors of the Hermite normal form.
+    """
+
+    #  Initialize the cursor.
+    cursor = 0
+
+    for column_id in range(length - 1, -1, -1):
+        if cursor >= len(vectors):
+            break
+
+        if not _echelon_column(vectors, cursor, column_id):
+            continue
+
+        #  Make the pivot positive.
+        pivot_vector = vectors[cursor]
+        if pivot_vector[column_id] < 0:
+            for idx in range(0, length):
+                pivot_vector[idx] = -pivot_vector[idx]
+
+        #  Reduce the vectors above the pivot.
+        pivot_value = pivot_vector[column_id]
+        for vector_id in range(0, cursor):
+            vector = vectors[vector_id]
+            quotient = vector[column_id] // pivot_value
+            if quotient != 0:
+                for idx in range(0, length):
+                    vector[idx] -= quotient * pivot_vector[idx]
+
+        cursor += 1
+
+    return vectors[:cursor]
+
+
+def get_integer_kernel(rows, column_count):
+    """Get a basis of the integer kernel (the integer solutions of A * x = 0) of
+    an integer matrix.
+
+    Note:
+      [1] The basis is in Hermite normal form. Particularly, if the kernel is
+          one-dimensional, the only basis vector is primitive (the GCD of its
+          items is 1) and its last non-zero item is positive.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :param rows: The (sparse) rows of the matrix.
+    :param column_count: The count of columns (unknowns).
+    :rtype : list[list[int]]
+    :return: The basis vectors.
+    """
+
+    #  Build the transposed matrix augmented with an identity matrix.
+    row_count = len(rows)
+    work = []
+    for column_id in range(0, column_count):
+        vector = [rows[row_id].get(column_id, 0) for row_id in range(0, row_count)]
+        identity = [0] * column_count
+        identity[column_id] = 1
+        work.append(vector + identity)
+
+    #  Do echelon on the transposed part.
+    cursor = 0
+    for row_id in range(0, row_count):
+        if cursor >= column_count:
+            break
+        if _echelon_column(work, cursor, row_id):
+            cursor += 1
+
+    #  The identity parts of the remaining vectors span the integer kernel.
+    kernel = [vector[row_count:] for vector in work[cursor:]]
+
+    return hermite_normal_form(kernel, column_count)
@@ -20,6 +20,7 @@ class Matrix:
         #  Initialize basic matrix information and the value pool.
         self.__rc = row_count
         self.__cc = column_count
+        self.__dv = default_value
         self.__v = [default_value] * (row_count * column_count)
         self.__ptr = []
 
@@ -61,6 +62,35 @@ class Matrix:
 
         return self.__cc
 
+    def get_default_value(self):
+        """Get the default value of items.
+
+        :return: The default value.
+        """
+
+        return self.__dv
+
+    def get_row_items(self, row):
+        """Get items that don't equal to the default value in specific row.
+
+        :type row: int
+        :param row: The row index.
+        :rtype : list[(int, object)]
+        :return: A list that contains (column index, value) pairs (sorted by the column index).
+        """
+
+        #  Initialize the result container.
+        r = []
+
+        #  Collect items.
+        row_offset = self._get_row_offset(row)
+        for column in range(0, self.__cc):
+            value = self._get_item_by_offset(row_offset + column)
+            if value != self.__dv:
+                r.append((column, value))
+
+        return r
+
     def _get_row_offset(self, row):
         """Get the offset of the first value of specific row.
 
@@ -159,3 +189,145 @@ class Matrix:
 
         #  Print end line.
         print("-------------------------")
+
+
+class SparseMatrix:
+    """Sparse matrix structure.
+
+    Note:
+      [1] Each row is stored as a dictionary (column index => value). Items that
+          equal to the default value are not stored.
+    """
+
+    def __init__(self, row_count, column_count, default_value=None):
+        """Initialize a |row_count| * |column_count| matrix and set all
+        values to |default_value|.
+
+        :type row_count: int
+        :type column_count: int
+        """
+
+        #  Initialize basic matrix information and the rows.
+        self.__rc = row_count
+        self.__cc = column_count
+        self.__dv = default_value
+        self.__rows = []
+        for row in range(0, row_count):
+            self.__rows.append({})
+
+    def exchange_row(self, row1, row2):
+        """Exchange two rows.
+
+        :type row1: int
+        :type row2: int
+        :param row1: The first row index.
+        :param row2: The second row index.
+        """
+
+        t = self.__rows[row1]
+        self.__rows[row1] = self.__rows[row2]
+        self.__rows[row2] = t
+
+    def get_row_count(self):
+        """Get the row count of the matrix.
+
+        :rtype : int
+        :return: The row count.
+        """
+
+        return self.__rc
+
+    def get_column_count(self):
+        """Get the column count of the matrix.
+
+        :rtype : int
+        :return: The column count.
+        """
+
+        return self.__cc
+
+    def get_default_value(self):
+        """Get the default value of items.
+
+        :return: The default value.
+        """
+
+        return self.__dv
+
+    def get_row_items(self, row):
+        """Get items that don't equal to the default value in specific row.
+
+        :type row: int
+        :param row: The row index.
+        :rtype : list[(int, object)]
+        :return: A list that contains (column index, value) pairs (sorted by the column index).
+        """
+
+        return sorted(self.__rows[row].items(), key=lambda pair: pair[0])
+
+    def write_item_by_position(self, row, column, new_value):
+        """Set the value of the item at specific position.
+
+        :type row: int
+        :type column: int
+        :param row: The row index of the item.
+        :param column: The column index of the item.
+        :param new_value: The new value of the item.
+        """
+
+        #  Check the position.
+        if column < 0 or column >= self.__cc:
+            raise IndexError("Column index out of range.")
+
+        row_data = self.__rows[row]
+        if new_value == self.__dv:
+            row_data.pop(column, None)
+        else:
+            row_data[column] = new_value
+
+    def get_item_by_position(self, row, column):
+        """Get the item at specific position.
+
+        :type row: int
+        :type column: int
+        :param row: The row index of the item.
+        :param column: The column index of the item.
+        :return: The value of the item.
+        """
+
+        #  Check the position.
+        if column < 0 or column >= self.__cc:
+            raise IndexError("Column index out of range.")
+
+        return self.__rows[row].get(column, self.__dv)
+
+    #
+    #  Debug codes.
+    #
+    def debug_print(self, title="Test", ofx_row=0, ofy_col=0):
+        """Print function for debugging.
+
+        :type title: str
+        :type ofx_row: int
+        :type ofy_col: int
+        :param title: Header text.
+        :param ofx_row: Row offset.
+        :param ofy_col: Column offset.
+        """
+
+        #  Print banner.
+        print("----- " + title + " -----")
+
+        for row in range(ofx_row, self.__rc):
+            line_str = ""
+
+            #  Join row items.
+            for col in range(ofy_col, self.__cc):
+                line_str += str(self.get_item_by_position(row, col))
+                line_str += ", "
+
+            #  Print the row.
+            print(line_str)
+
+        #  Print end line.
+        print("-------------------------")
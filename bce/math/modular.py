@@ -0,0 +1,545 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    This module implements the multi-modular Gauss-Jordan elimination on native
+#    Python integers. The integer rows are reduced modulo several word-size
+#    primes, so the intermediate values never grow beyond the primes. The
+#    reduced row echelon form over the rationals is reconstructed from the
+#    residues with the Chinese remainder theorem and rational reconstruction,
+#    and then verified against the origin rows.
+#
+#    Integer rows are sparse: each row is a dictionary (column index => value)
+#    that only contains non-zero items (see bce.math.bareiss).
+#
+
+import bce.math.integer as _integer
+import fractions as _fractions
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+#  The primes are searched downward from this value (all primes fit in 31 bits).
+_PRIME_SEARCH_START = (1 << 31) - 1
+
+#  Bases of the Miller-Rabin test (deterministic for all integers below 3215031751).
+_MILLER_RABIN_BASES = [2, 3, 5, 7]
+
+#  Primes that were found (in descending order).
+_PRIMES = []
+
+#  Minimum count of matrix items to eliminate with NumPy (small matrices are faster with native integers).
+_NUMPY_MINIMUM_ITEM_COUNT = 1024
+
+#  Count of primes that must agree that the equations are inconsistent before the elimination gives up.
+_INCONSISTENT_PRIME_COUNT_LIMIT = 3
+
+
+def _is_prime(value):
+    """Check whether an integer (below 2^31) is a prime.
+
+    :type value: int
+    :param value: The integer.
+    :rtype : bool
+    :return: True if so.
+    """
+
+    if value < 2:
+        return False
+
+    for base in _MILLER_RABIN_BASES:
+        if value % base == 0:
+            return value == base
+
+    #  Write value - 1 as d * 2^s.
+    d = value - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in _MILLER_RABIN_BASES:
+        x = pow(base, d, value)
+        if x == 1 or x == value - 1:
+            continue
+        for _ in range(0, s - 1):
+            x = x * x % value
+            if x == value - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def _get_prime(index):
+    """Get a word-size prime.
+
+    :type index: int
+    :param index: The index of the prime (the primes are in descending order).
+    :rtype : int
+    :return: The prime.
+    """
+
+    while len(_PRIMES) <= index:
+        if len(_PRIMES) == 0:
+            candidate = _PRIME_SEARCH_START
+        else:
+            candidate = _PRIMES[-1] - 2
+        while not _is_prime(candidate):
+            candidate -= 2
+        _PRIMES.append(candidate)
+
+    return _PRIMES[index]
+
+
+def _reduce_rows_modulo_natively(rows, column_count, prime):
+    """Reduce integer rows to the reduced row echelon form modulo a prime (with native integers).
+
+    Note:
+      [1] The origin rows are not changed.
+      [2] The last column is treated as the constant column and is never used
+          as a pivot column (see bce.math.bareiss.reduce_integer_rows()).
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :type prime: int
+    :param rows: The integer rows.
+    :param column_count: The count of columns.
+    :param prime: The prime.
+    :rtype : (list[int], list[dict[int, int]], bool)
+    :return: A tuple (pivot columns, pivot rows, whether the equations are consistent modulo the prime).
+    """
+
+    #  Get the residues.
+    work = []
+    for row in rows:
+        residues = {}
+        for column_id in row:
+            value = row[column_id] % prime
+            if value != 0:
+                residues[column_id] = value
+        work.append(residues)
+
+    #  Initialize the pivot columns container.
+    pivot_columns = []
+
+    row_count = len(work)
+    cursor_row = 0
+    for cursor_column in range(0, column_count - 1):
+        if cursor_row >= row_count:
+            break
+
+        #  Find the sparsest row that has a non-zero item in current column (sparsest-row pivoting).
+        pivot_row_id = None
+        for row_id in range(cursor_row, row_count):
+            row = work[row_id]
+            if cursor_column in row and (pivot_row_id is None or len(row) < len(work[pivot_row_id])):
+                pivot_row_id = row_id
+
+        #  If there is no non-zero item, keep finding in next column.
+        if pivot_row_id is None:
+            continue
+
+        #  Exchange the pivot row with current row and make the pivot one.
+        work[cursor_row], work[pivot_row_id] = work[pivot_row_id], work[cursor_row]
+        pivot_row = work[cursor_row]
+        inverse = pow(pivot_row[cursor_column], prime - 2, prime)
+        if inverse != 1:
+            for column_id in pivot_row:
+                pivot_row[column_id] = pivot_row[column_id] * inverse % prime
+
+        #  Eliminate all other rows.
+        for row_id in range(0, row_count):
+            if row_id == cursor_row:
+                continue
+
+            row = work[row_id]
+            factor = row.get(cursor_column, 0)
+            if factor == 0:
+                continue
+
+            for column_id in pivot_row:
+                value = (row.get(column_id, 0) - factor * pivot_row[column_id]) % prime
+                if value == 0:
+                    row.pop(column_id, None)
+                else:
+                    row[column_id] = value
+
+        #  Save the pivot.
+        pivot_columns.append(cursor_column)
+        cursor_row += 1
+
+    #  Remaining rows only contain the constant column (if they are not zero).
+    is_consistent = True
+    for row_id in range(cursor_row, row_count):
+        if len(work[row_id]) != 0:
+            is_consistent = False
+            break
+
+    return pivot_columns, work[:cursor_row], is_consistent
+
+
+def _reduce_rows_modulo_with_numpy(rows, column_count, prime):
+    """Reduce integer rows to the reduced row echelon form modulo a prime (with NumPy).
+
+    Note:
+      [1] The rows are eliminated in a dense 64-bit integer array. Since the
+          primes fit in 31 bits, no product overflows.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :type prime: int
+    :param rows: The integer rows.
+    :param column_count: The count of columns.
+    :param prime: The prime.
+    :rtype : (list[int], list[dict[int, int]], bool)
+    :return: A tuple (pivot columns, pivot rows, whether the equations are consistent modulo the prime).
+    """
+
+    #  Get the residues.
+    row_count = len(rows)
+    work = _numpy.zeros((row_count, column_count), dtype=_numpy.int64)
+    for row_id in range(0, row_count):
+        row = rows[row_id]
+        for column_id in row:
+            work[row_id, column_id] = row[column_id] % prime
+
+    #  Initialize the pivot columns container.
+    pivot_columns = []
+
+    cursor_row = 0
+    for cursor_column in range(0, column_count - 1):
+        if cursor_row >= row_count:
+            break
+
+        #  Find a row that has a non-zero item in current column.
+        candidates = _numpy.flatnonzero(work[cursor_row:, cursor_column])
+        if len(candidates) == 0:
+            continue
+
+        #  Exchange the pivot row with current row and make the pivot one (items
+        #  before current column are all zero).
+        pivot_row_id = cursor_row + int(candidates[0])
+        if pivot_row_id != cursor_row:
+            work[[cursor_row, pivot_row_id]] = work[[pivot_row_id, cursor_row]]
+        inverse = pow(int(work[cursor_row, cursor_column]), prime - 2, prime)
+        if inverse != 1:
+            work[cursor_row, cursor_column:] = work[cursor_row, cursor_column:] * inverse % prime
+        pivot_tail = work[cursor_row, cursor_column:]
+
+        #  Eliminate all other rows.
+        factors = work[:, cursor_column].copy()
+        factors[cursor_row] = 0
+        other_ids = _numpy.flatnonzero(factors)
+        if len(other_ids) != 0:
+            work[other_ids, cursor_column:] = \
+                (work[other_ids, cursor_column:] - factors[other_ids, None] * pivot_tail[None, :]) % prime
+
+        #  Save the pivot.
+        pivot_columns.append(cursor_column)
+        cursor_row += 1
+
+    #  Remaining rows only contain the constant column (if they are not zero).
+    is_consistent = not bool(work[cursor_row:, column_count - 1].any())
+
+    #  Convert the pivot rows to sparse rows.
+    pivot_rows = []
+    for row in work[:cursor_row].tolist():
+        pivot_rows.append(dict([(column_id, row[column_id]) for column_id in range(0, column_count) if row[column_id] != 0]))
+
+    return pivot_columns, pivot_rows, is_consistent
+
+
+def _reduce_rows_modulo(rows, column_count, prime):
+    """Reduce integer rows to the reduced row echelon form modulo a prime.
+
+    Note:
+      [1] NumPy is used if it is available and the matrix is large enough.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :type prime: int
+    :param rows: The integer rows.
+    :param column_count: The count of columns.
+    :param prime: The prime.
+    :rtype : (list[int], list[dict[int, int]], bool)
+    :return: A tuple (pivot columns, pivot rows, whether the equations are consistent modulo the prime).
+    """
+
+    if _numpy is not None and len(rows) * column_count >= _NUMPY_MINIMUM_ITEM_COUNT:
+        return _reduce_rows_modulo_with_numpy(rows, column_count, prime)
+
+    return _reduce_rows_modulo_natively(rows, column_count, prime)
+
+
+def _reconstruct_rational(value, modulus):
+    """Reconstruct a rational number from its residue.
+
+    Note:
+      [1] The result n / d satisfies n = value * d (mod modulus), and both
+          2 * n^2 and 2 * d^2 are less than the modulus (so it is unique).
+
+    :type value: int
+    :type modulus: int
+    :param value: The residue.
+    :param modulus: The modulus.
+    :rtype : fractions.Fraction | None
+    :return: The rational number (None if it can't be reconstructed).
+    """
+
+    #  Run the extended Euclidean algorithm until the remainder is small enough.
+    r0, r1 = modulus, value % modulus
+    s0, s1 = 0, 1
+    while 2 * r1 * r1 >= modulus:
+        quotient = r0 // r1
+        r0, r1 = r1, r0 - quotient * r1
+        s0, s1 = s1, s0 - quotient * s1
+
+    #  Check the denominator.
+    if s1 == 0 or 2 * s1 * s1 >= modulus or _integer.gcd(r1, s1) != 1:
+        return None
+
+    if s1 < 0:
+        return _fractions.Fraction(-r1, -s1)
+
+    return _fractions.Fraction(r1, s1)
+
+
+def _get_squared_hadamard_bound(rows):
+    """Get the square of an upper bound of the absolute value of all minors of integer rows.
+
+    :type rows: list[dict[int, int]]
+    :param rows: The integer rows.
+    :rtype : int
+    :return: The bound.
+    """
+
+    bound = 1
+    for row in rows:
+        squared_norm = 0
+        for column_id in row:
+            squared_norm += row[column_id] * row[column_id]
+        if squared_norm != 0:
+            bound *= squared_norm
+
+    return bound
+
+
+def _verify(rows, column_count, pivot_columns, reduced_rows):
+    """Verify a reduced row echelon form against the origin rows.
+
+    Note:
+      [1] Each free column f gives a kernel vector (1 at f, -R[p][f] at each
+          pivot column p). The vector may only be non-zero at pivot columns
+          before f, which means that column f is a combination of the pivot
+          columns before it. If all kernel vectors are in the kernel of the
+          origin rows, the rank can't be less than the count of pivots, which
+          is never more than the rank (a rank never grows modulo a prime). So
+          the pivot columns are the ones that the elimination over the
+          rationals would choose, and the reduced row echelon form is the
+          exact one.
+      [2] The particular solution (R[p][c] at each pivot column p, where c is
+          the constant column) is verified in the same way.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :type pivot_columns: list[int]
+    :type reduced_rows: list[dict[int, fractions.Fraction]]
+    :param rows: The integer rows.
+    :param column_count: The count of columns.
+    :param pivot_columns: The pivot columns.
+    :param reduced_rows: The pivot rows of the reduced row echelon form.
+    :rtype : bool
+    :return: True if the reduced row echelon form is the exact one.
+    """
+
+    unknown_count = column_count - 1
+
+    #  Map each pivot column to its row.
+    pivot_rows = {}
+    for row_id in range(0, len(pivot_columns)):
+        pivot_rows[pivot_columns[row_id]] = row_id
+
+    #  Build the kernel vectors (scaled to integers) and the particular solution.
+    vectors = []
+    for column_id in range(0, column_count):
+        if column_id in pivot_rows:
+            continue
+
+        #  Get the items of the vector (at pivot columns).
+        items = []
+        denominator_lcm = 1
+        for row_id in range(0, len(pivot_columns)):
+            item = reduced_rows[row_id].get(column_id, 0)
+            if item == 0:
+                continue
+            if column_id != unknown_count and pivot_columns[row_id] > column_id:
+                return False
+            items.append((pivot_columns[row_id], item))
+            denominator_lcm = _integer.lcm(denominator_lcm, item.denominator)
+
+        vector = {}
+        for pivot_column, item in items:
+            vector[pivot_column] = int(-item * denominator_lcm)
+        vector[column_id] = denominator_lcm
+        vectors.append(vector)
+
+    #  Check each origin row (the constant column is moved to the left side).
+    for row in rows:
+        for vector in vectors:
+            sum_value = 0
+            for column_id in row:
+                if column_id in vector:
+                    sum_value += row[column_id] * vector[column_id]
+            if sum_value != 0:
+                return False
+
+    return True
+
+
+def reduce_integer_rows(rows, column_count):
+    """Reduce integer rows to the reduced row echelon form with multi-modular elimination.
+
+    Note:
+      [1] The origin rows are not changed.
+      [2] The last column is treated as the constant column and is never used
+          as a pivot column. Pivot columns are chosen from left to right, so the
+          result is the same as the one of bce.math.bareiss.reduce_integer_rows().
+      [3] A prime whose pivot columns differ from the best pivot columns seen
+          so far (the most pivots, and then the leftmost ones) is unlucky and
+          is skipped. If a better prime appears, the residues are dropped.
+      [4] Primes are added until the reconstructed form passes the verification
+          (see _verify()). Once the product of the primes exceeds twice the
+          squared Hadamard bound of the rows, the reconstruction is guaranteed
+          to be correct, so the elimination gives up if it still fails.
+      [5] The items are reconstructed after the count of primes grows by a
+          quarter, so the reconstructing cost stays below the eliminating cost
+          (at most a quarter of the primes are more than needed).
+      [6] Consistent equations can look inconsistent modulo an unlucky prime
+          (the rank of the coefficient columns drops but the rank of all
+          columns doesn't), so such a prime is skipped like other unlucky
+          primes. The elimination gives up only after several primes agree
+          that the equations are inconsistent.
+
+    :type rows: list[dict[int, int]]
+    :type column_count: int
+    :param rows: The integer rows.
+    :param column_count: The count of columns.
+    :rtype : (list[int], list[dict[int, fractions.Fraction]]) | None
+    :return: A tuple (pivot columns, pivot rows) or None if the equations seem to be inconsistent or
+             the form can't be reconstructed.
+    """
+
+    limit = 2 * _get_squared_hadamard_bound(rows)
+
+    #  Initialize the residues (of items at non-pivot columns).
+    best_pivot_columns = None
+    residues = None
+    modulus = 1
+
+    #  The position of the item that failed to be reconstructed last time.
+    failed_position = None
+
+    #  Count of combined primes (and the count at which the items are reconstructed next time).
+    prime_count = 0
+    checkpoint = 1
+
+    #  Count of primes modulo which the equations are inconsistent.
+    inconsistent_count = 0
+
+    prime_id = 0
+    while modulus <= limit:
+        prime = _get_prime(prime_id)
+        prime_id += 1
+
+        pivot_columns, pivot_rows, is_consistent = _reduce_rows_modulo(rows, column_count, prime)
+        if not is_consistent:
+            #  Skip the prime unless enough primes agree.
+            inconsistent_count += 1
+            if inconsistent_count >= _INCONSISTENT_PRIME_COUNT_LIMIT:
+                return None
+            continue
+
+        #  Drop the pivot items (they are always one).
+        for row_id in range(0, len(pivot_columns)):
+            del pivot_rows[row_id][pivot_columns[row_id]]
+
+        if best_pivot_columns is None or \
+                len(pivot_columns) > len(best_pivot_columns) or \
+                (len(pivot_columns) == len(best_pivot_columns) and pivot_columns < best_pivot_columns):
+            #  Drop the residues of the unlucky primes.
+            best_pivot_columns = pivot_columns
+            residues = pivot_rows
+            modulus = prime
+            failed_position = None
+            prime_count = 1
+            checkpoint = 1
+        elif pivot_columns != best_pivot_columns:
+            #  Skip the unlucky prime.
+            continue
+        else:
+            #  Combine the residues with the Chinese remainder theorem.
+            inverse = pow(modulus % prime, prime - 2, prime)
+            for row_id in range(0, len(residues)):
+                combined = residues[row_id]
+                row = pivot_rows[row_id]
+                for column_id in set(combined) | set(row):
+                    origin = combined.get(column_id, 0)
+                    value = origin + modulus * ((row.get(column_id, 0) - origin) * inverse % prime)
+                    if value == 0:
+                        combined.pop(column_id, None)
+                    else:
+                        combined[column_id] = value
+            modulus *= prime
+            prime_count += 1
+
+        #  Reconstruct only at checkpoints (reconstructing is much more expensive than combining).
+        if prime_count < checkpoint and modulus <= limit:
+            continue
+        checkpoint = prime_count + max(1, prime_count // 4)
+
+        #  Skip reconstructing all items if the item that failed last time still fails.
+        if failed_position is not None:
+            row_id, column_id = failed_position
+            if _reconstruct_rational(residues[row_id].get(column_id, 0), modulus) is None:
+                continue
+            failed_position = None
+
+        #  Reconstruct the rational numbers.
+        reduced_rows = []
+        denominator = 1
+        for row_id in range(0, len(residues)):
+            combined = residues[row_id]
+            reduced_row = {best_pivot_columns[row_id]: _fractions.Fraction(1)}
+            for column_id in combined:
+                #  Most items share their denominator (the determinant of the pivot
+                #  columns), so try the known denominator first.
+                numerator = combined[column_id] * denominator % modulus
+                if 2 * numerator > modulus:
+                    numerator -= modulus
+                if 2 * numerator * numerator < modulus and 2 * denominator * denominator < modulus:
+                    item = _fractions.Fraction(numerator, denominator)
+                else:
+                    item = _reconstruct_rational(combined[column_id], modulus)
+                    if item is None:
+                        failed_position = (row_id, column_id)
+                        break
+                    denominator = _integer.lcm(denominator, item.denominator)
+                if item != 0:
+                    reduced_row[column_id] = item
+            if failed_position is not None:
+                break
+            reduced_rows.append(reduced_row)
+
+        if failed_position is None and _verify(rows, column_count, best_pivot_columns, reduced_rows):
+            return best_pivot_columns, reduced_rows
+
+    return None
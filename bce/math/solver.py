@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+#
+#  NOTE:
+#    Solvers of equations whose coefficients are all rational numbers (see
+#    bce.math.equation.solve_equations()). This module doesn't import SymPy,
+#    so the option modules can refer to the solvers.
+#
+
+#  Fraction-free (Bareiss) elimination on native integers.
+SOLVER_BAREISS = "bareiss"
+
+#  Multi-modular elimination with Chinese remainder reconstruction.
+SOLVER_MODULAR = "modular"
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.math.integer as _math_integer
+import itertools as _itertools
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+#
+#  NOTE:
+#    In this module, all numbers should be native Python integers. A row is a
+#    list of (a, x) pairs, and it is satisfied if the sum of a * x is zero.
+#
+
+#  Rows whose sum of absolute products may reach this limit are checked with exact integers.
+_INT64_SUM_LIMIT = float(1 << 62)
+
+#  Minimum count of terms to use NumPy (packing small batches costs more than it saves).
+_NUMPY_MINIMUM_TERM_COUNT = 256
+
+
+def is_numpy_available():
+    """Get whether NumPy is available.
+
+    :rtype : bool
+    :return: True if so.
+    """
+
+    return _numpy is not None
+
+
+def normalize_rational_row(terms):
+    """Convert a row with rational terms to an equivalent integer row.
+
+    Note:
+      [1] The products of the terms are scaled by the least common multiple
+          of their denominators, which doesn't change whether their sum is
+          zero.
+
+    :type terms: list
+    :param terms: The terms (each term is a tuple (a, x) of native integers or SymPy objects).
+    :rtype : list[(int, int)] | None
+    :return: The integer row (None if there is a term that isn't rational).
+    """
+
+    #  Get the rational parts of each term.
+    parts = []
+    scale = 1
+    for a, x in terms:
+        a_parts = _math_integer.get_rational_parts(a)
+        if a_parts is None:
+            return None
+
+        x_parts = _math_integer.get_rational_parts(x)
+        if x_parts is None:
+            return None
+
+        denominator = a_parts[1] * x_parts[1]
+        if denominator != 1:
+            scale = _math_integer.lcm(scale, denominator)
+        parts.append((a_parts[0], x_parts[0], denominator))
+
+    #  Most rows have no fraction at all.
+    if scale == 1:
+        return [(a_numerator, x_numerator) for a_numerator, x_numerator, _ in parts]
+
+    return [(a_numerator * (scale // denominator), x_numerator) for a_numerator, x_numerator, denominator in parts]
+
+
+def _check_rows_exactly(rows):
+    """Check whether each row is satisfied (with exact integers).
+
+    :type rows: list[list[(int, int)]]
+    :param rows: The rows.
+    :rtype : list[bool]
+    :return: Whether each row is satisfied.
+    """
+
+    return [sum([a * x for a, x in row]) == 0 for row in rows]
+
+
+def _check_rows_with_numpy(rows):
+    """Check whether each row is satisfied (with NumPy 64-bit integers).
+
+    Note:
+      [1] All rows are packed into one array and summed segment by segment,
+          so the whole batch is checked with a few array operations.
+      [2] If a value doesn't fit in 64-bit integers, the batch is checked
+          with exact integers. Rows whose sum may overflow are checked with
+          exact integers.
+
+    :type rows: list[list[(int, int)]]
+    :param rows: The rows.
+    :rtype : list[bool]
+    :return: Whether each row is satisfied.
+    """
+
+    #  Empty rows are always satisfied (and reduceat() can't handle empty segments).
+    packed_ids = [row_id for row_id in range(0, len(rows)) if len(rows[row_id]) != 0]
+    if len(packed_ids) == 0:
+        return [True] * len(rows)
+
+    #  Pack the rows.
+    try:
+        terms = _numpy.array(
+            list(_itertools.chain.from_iterable([rows[row_id] for row_id in packed_ids])),
+            dtype=_numpy.int64
+        )
+    except OverflowError:
+        return _check_rows_exactly(rows)
+
+    lengths = _numpy.array([len(rows[row_id]) for row_id in packed_ids], dtype=_numpy.int64)
+    starts = _numpy.concatenate(([0], _numpy.cumsum(lengths)[:-1]))
+
+    #  Get the bound of each row sum (in floating point).
+    bounds = _numpy.add.reduceat(_numpy.abs(terms[:, 0] * 1.0) * _numpy.abs(terms[:, 1] * 1.0), starts)
+
+    #  Get whether the sum of each row is zero.
+    zero_flags = (_numpy.add.reduceat(terms[:, 0] * terms[:, 1], starts) == 0).tolist()
+
+    satisfied = [True] * len(rows)
+    for offset in range(0, len(packed_ids)):
+        satisfied[packed_ids[offset]] = zero_flags[offset]
+
+    #  Check the rows whose sum may overflow with exact integers.
+    for offset in _numpy.nonzero(bounds >= _INT64_SUM_LIMIT)[0].tolist():
+        row_id = packed_ids[offset]
+        satisfied[row_id] = (sum([a * x for a, x in rows[row_id]]) == 0)
+
+    return satisfied
+
+
+def check_integer_rows(rows, use_numpy=False):
+    """Check whether each row is satisfied.
+
+    Note:
+      [1] NumPy is used only if it is requested, available and the batch is
+          large enough. The results are exact either way.
+      [2] NumPy is not used by default. The rows are built from Python objects,
+          and packing them into arrays costs more than summing them with native
+          integers (about 2x as slow in benchmarks).
+
+    :type rows: list[list[(int, int)]]
+    :type use_numpy: bool
+    :param rows: The rows (each row is a list of tuples (a, x)).
+    :param use_numpy: Whether NumPy can be used.
+    :rtype : list[bool]
+    :return: Whether the sum of a * x of each row is zero.
+    """
+
+    if use_numpy and _numpy is not None and sum([len(row) for row in rows]) >= _NUMPY_MINIMUM_TERM_COUNT:
+        return _check_rows_with_numpy(rows)
+
+    return _check_rows_exactly(rows)
@@ -5,11 +5,14 @@
 #  found in the license.txt file.
 #
 
-import copy as _copy
+import hashlib as _hashlib
 
 #  The option template.
 _OPTION_TEMPLATE = {}
 
+#  Types of option values which are fingerprinted by their contents.
+_PLAIN_VALUE_TYPES = (type(None), bool, int, float, str)
+
 
 def register_option_pair(key, default_value):
     """Register an option pair (key => default value).
@@ -22,14 +25,66 @@ def register_option_pair(key, default_value):
     _OPTION_TEMPLATE[key] = default_value
 
 
-class Option:
-    """The option."""
+def _get_value_fingerprint(value):
+    """Get the fingerprint of an option value.
+
+    Note:
+      [1] Plain values and dictionaries of plain values are fingerprinted by
+          their contents. Other objects (such as parser implementations) are
+          fingerprinted by their identities.
+
+    :param value: The option value.
+    :rtype : str
+    :return: The fingerprint.
+    """
+
+    if type(value) in _PLAIN_VALUE_TYPES:
+        return repr(value)
 
-    def __init__(self):
-        """Initialize the object."""
+    if type(value) is dict:
+        items = []
+        for item_key in value:
+            item_value = value[item_key]
+            if type(item_key) not in _PLAIN_VALUE_TYPES or type(item_value) not in _PLAIN_VALUE_TYPES:
+                break
+            items.append(repr(item_key) + ":" + repr(item_value))
+        else:
+            items.sort()
+            return "{" + ",".join(items) + "}"
 
-        #  Copy options from the template.
-        self.__opt = _copy.deepcopy(_OPTION_TEMPLATE)
+    return "<%s.%s@%x>" % (type(value).__module__, type(value).__name__, id(value))
+
+
+class OptionSnapshot:
+    """Immutable and hashable snapshot of options.
+
+    Note:
+      [1] A snapshot can be used anywhere an Option object is read (all option
+          wrapper getters work on it), but it can't be changed. Use
+          with_changes() to derive a new snapshot.
+      [2] Derived snapshots share all unchanged option values (and their
+          fingerprints) with the snapshot they were derived from.
+      [3] Option values must not be changed in place once they were put into a
+          snapshot.
+    """
+
+    def __init__(self, values, value_fingerprints=None):
+        """Initialize the object.
+
+        :type values: dict
+        :type value_fingerprints: dict[str, str] | None
+        :param values: The option values (the snapshot takes the ownership).
+        :param value_fingerprints: The fingerprints of the option values (computed if None).
+        """
+
+        if value_fingerprints is None:
+            value_fingerprints = {}
+            for key in values:
+                value_fingerprints[key] = _get_value_fingerprint(values[key])
+
+        self.__opt = values
+        self.__fps = value_fingerprints
+        self.__fp = None
 
     def has_option(self, key):
         """Get whether a key of an option is valid.
@@ -41,30 +96,168 @@ class Option:
 
         return key in self.__opt
 
-    def __assert_option(self, key):
-        """Assert a key of an option exists.
+    def get_option_value(self, key):
+        """Get the value of an option.
 
         :type key: str
         :param key: The option key.
+        :return: The value of the option.
         :raise KeyError: Raise this exception if the key is invalid.
         """
 
-        if not self.has_option(key):
+        try:
+            return self.__opt[key]
+        except KeyError:
             raise KeyError("No such option.")
 
+    # noinspection PyMethodMayBeStatic
+    def set_option_value(self, key, value):
+        """Set the value of an option (not supported).
+
+        :type key: str
+        :param key: The option key.
+        :param value: The option value.
+        :raise TypeError: Always raise this exception.
+        """
+
+        raise TypeError("Option snapshots are immutable, use with_changes() instead.")
+
+    def with_changes(self, changes):
+        """Derive a new snapshot with some options changed.
+
+        :type changes: dict
+        :param changes: The changed options (option key => new value).
+        :rtype : OptionSnapshot
+        :return: The new snapshot.
+        :raise KeyError: Raise this exception if some key is invalid.
+        """
+
+        values = dict(self.__opt)
+        value_fingerprints = dict(self.__fps)
+        for key in changes:
+            if key not in values:
+                raise KeyError("No such option.")
+            values[key] = changes[key]
+            value_fingerprints[key] = _get_value_fingerprint(changes[key])
+
+        return OptionSnapshot(values, value_fingerprints)
+
+    def _get_values(self):
+        """Get the option values (for Option objects only, the values must not be changed).
+
+        :rtype : dict
+        :return: The option values.
+        """
+
+        return self.__opt
+
+    def to_option(self):
+        """Create a mutable option object from the snapshot.
+
+        :rtype : Option
+        :return: The option object.
+        """
+
+        return Option(self)
+
+    def get_fingerprint(self):
+        """Get the fingerprint of the snapshot.
+
+        Note:
+          [1] Snapshots with equal option values have the same fingerprint. The
+              fingerprints of snapshots containing objects (such as parser
+              implementations) are only stable within one process.
+
+        :rtype : str
+        :return: The fingerprint (a hexadecimal digest).
+        """
+
+        if self.__fp is None:
+            digest = _hashlib.sha1()
+            for key in sorted(self.__fps.keys()):
+                digest.update((key + "=" + self.__fps[key] + "\n").encode("utf-8"))
+            self.__fp = digest.hexdigest()
+
+        return self.__fp
+
+    def __hash__(self):
+        """Get the hash value of the snapshot.
+
+        :rtype : int
+        :return: The hash value.
+        """
+
+        return hash(self.get_fingerprint())
+
+    def __eq__(self, other):
+        """Get whether two snapshots are equal.
+
+        :param other: The other object.
+        :rtype : bool
+        :return: True if so.
+        """
+
+        return isinstance(other, OptionSnapshot) and self.get_fingerprint() == other.get_fingerprint()
+
+    def __ne__(self, other):
+        """Get whether two snapshots are not equal.
+
+        :param other: The other object.
+        :rtype : bool
+        :return: True if so.
+        """
+
+        return not self.__eq__(other)
+
+
+class Option:
+    """The option.
+
+    Note:
+      [1] Option values are shared with the template (or the snapshot the
+          object was created from) instead of being copied. Replace option
+          values with set_option_value() instead of changing them in place.
+    """
+
+    def __init__(self, snapshot=None):
+        """Initialize the object.
+
+        :type snapshot: OptionSnapshot | None
+        :param snapshot: The snapshot to initialize from (None if the defaults are to be used).
+        """
+
+        if snapshot is None:
+            #  Copy options from the template.
+            self.__opt = dict(_OPTION_TEMPLATE)
+            self.__snapshot = None
+        else:
+            #  Share the options with the snapshot (and copy them on the first write).
+            self.__opt = snapshot._get_values()
+            self.__snapshot = snapshot
+
+    def has_option(self, key):
+        """Get whether a key of an option is valid.
+
+        :type key: str
+        :param key: The option key.
+        :return: True if so.
+        """
+
+        return key in self.__opt
+
     def get_option_value(self, key):
         """Get the value of an option.
 
         :type key: str
         :param key: The option key.
         :return: The value of the option.
+        :raise KeyError: Raise this exception if the key is invalid.
         """
 
-        #  Check the key.
-        self.__assert_option(key)
-
-        #  Get and return the value.
-        return self.__opt[key]
+        try:
+            return self.__opt[key]
+        except KeyError:
+            raise KeyError("No such option.")
 
     def set_option_value(self, key, value):
         """Set the value of an option.
@@ -72,10 +265,34 @@ class Option:
         :type key: str
         :param key: The option key.
         :param value: The option value.
+        :raise KeyError: Raise this exception if the key is invalid.
         """
 
         #  Check the key.
-        self.__assert_option(key)
+        if key not in self.__opt:
+            raise KeyError("No such option.")
+
+        #  Stop sharing the options with the snapshot.
+        if self.__snapshot is not None:
+            self.__opt = dict(self.__opt)
+            self.__snapshot = None
 
         #  Set the value.
         self.__opt[key] = value
+
+    def snapshot(self):
+        """Take an immutable snapshot of the options.
+
+        Note:
+          [1] Taking snapshots repeatedly without changing the options in
+              between returns the same snapshot.
+
+        :rtype : OptionSnapshot
+        :return: The snapshot.
+        """
+
+        if self.__snapshot is None:
+            #  The snapshot takes the ownership, so copy the options on the next write.
+            self.__snapshot = OptionSnapshot(self.__opt)
+
+        return self.__snapshot
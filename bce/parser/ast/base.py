@@ -6,8 +6,25 @@
 #
 
 
-class ASTNodeBase:
-    """Base class for AST nodes."""
+class ASTNodeBase(object):
+    """Base class for AST nodes.
+
+    Note:
+      [1] Nodes are slotted. Frequently used properties are stored in slots
+          (declared in __slots__ of the sub-classes and mapped from property
+          keys by _PROPERTY_SLOTS). Other properties are stored in a dictionary
+          that is created only when it is needed.
+      [2] Slotted properties always exist (they are initialized with their
+          default values by the constructors) and can't be removed.
+    """
+
+    __slots__ = ("__node_type", "__properties", "__children", "__parent", "_src_text_starting", "_src_text_ending")
+
+    #  Property key => slot name.
+    _PROPERTY_SLOTS = {
+        "src_text_starting": "_src_text_starting",
+        "src_text_ending": "_src_text_ending"
+    }
 
     def __init__(self, node_type):
         """Initialize the AST node.
@@ -17,9 +34,11 @@ class ASTNodeBase:
         """
 
         self.__node_type = node_type
-        self.__properties = {}
-        self.__children = []
+        self.__properties = None
+        self.__children = None
         self.__parent = None
+        self._src_text_starting = -1
+        self._src_text_ending = -1
 
     def __len__(self):
         """Get the children count.
@@ -28,6 +47,9 @@ class ASTNodeBase:
         :return: The count.
         """
 
+        if self.__children is None:
+            return 0
+
         return len(self.__children)
 
     def get_node_type(self):
@@ -47,6 +69,14 @@ class ASTNodeBase:
         :param value: The value of the property.
         """
 
+        slot_name = self._PROPERTY_SLOTS.get(key)
+        if slot_name is not None:
+            setattr(self, slot_name, value)
+            return
+
+        if self.__properties is None:
+            self.__properties = {}
+
         self.__properties[key] = value
 
     def has_property(self, key):
@@ -58,7 +88,10 @@ class ASTNodeBase:
         :return: True if the property exists. Otherwise, return False.
         """
 
-        return key in self.__properties
+        if key in self._PROPERTY_SLOTS:
+            return True
+
+        return self.__properties is not None and key in self.__properties
 
     def get_property(self, key, default=None):
         """Get the value of specified property.
@@ -69,20 +102,42 @@ class ASTNodeBase:
         :return: The value of the property.
         """
 
-        if self.has_property(key):
+        slot_name = self._PROPERTY_SLOTS.get(key)
+        if slot_name is not None:
+            return getattr(self, slot_name)
+
+        if self.__properties is not None and key in self.__properties:
             return self.__properties[key]
         else:
             return default
 
+    def get_property_keys(self):
+        """Get the keys of all properties.
+
+        :rtype : list[str]
+        :return: A list that contains all keys.
+        """
+
+        #  Get keys of the slotted properties.
+        r = list(self._PROPERTY_SLOTS.keys())
+
+        #  Get keys of other properties.
+        if self.__properties is not None:
+            r.extend(self.__properties.keys())
+
+        return r
+
     def remove_property(self, key):
         """Remove a property.
 
         :type key: str
         :param key: The key of the property.
-        :raise KeyError: Raise when the key is invalid.
+        :raise KeyError: Raise when the key is invalid or the property is slotted.
         """
 
         #  Check the key.
+        if key in self._PROPERTY_SLOTS:
+            raise KeyError("Slotted property can't be removed.")
         if not self.has_property(key):
             raise KeyError("Invalid property key.")
 
@@ -96,6 +151,9 @@ class ASTNodeBase:
         :param child_node: The child node.
         """
 
+        if self.__children is None:
+            self.__children = []
+
         self.__children.append(child_node)
 
     def __getitem__(self, idx):
@@ -107,6 +165,9 @@ class ASTNodeBase:
         :return: The child node.
         """
 
+        if self.__children is None:
+            raise IndexError("The node has no child.")
+
         return self.__children[idx]
 
     def __setitem__(self, idx, new_node):
@@ -118,6 +179,9 @@ class ASTNodeBase:
         :param new_node: The new child node.
         """
 
+        if self.__children is None:
+            raise IndexError("The node has no child.")
+
         self.__children[idx] = new_node
 
     def __delitem__(self, idx):
@@ -127,6 +191,9 @@ class ASTNodeBase:
         :param idx: The index.
         """
 
+        if self.__children is None:
+            raise IndexError("The node has no child.")
+
         self.__children.pop(idx)
 
     def get_parent_node(self):
@@ -154,7 +221,7 @@ class ASTNodeBase:
         :param pos: The position.
         """
 
-        self.set_property("src_text_starting", pos)
+        self._src_text_starting = pos
 
     def register_ending_position_in_source_text(self, pos):
         """Register the ending position of current node in the source text.
@@ -163,7 +230,7 @@ class ASTNodeBase:
         :param pos: The position.
         """
 
-        self.set_property("src_text_ending", pos)
+        self._src_text_ending = pos
 
     def get_starting_position_in_source_text(self):
         """Get the starting position of current node in the source text.
@@ -172,7 +239,7 @@ class ASTNodeBase:
         :return: The position (if the position hasn't been registered, return -1).
         """
 
-        return self.get_property("src_text_starting", -1)
+        return self._src_text_starting
 
     def get_ending_position_in_source_text(self):
         """Get the ending position of current node in the source text.
@@ -181,7 +248,7 @@ class ASTNodeBase:
         :return: The position (if the position hasn't been registered, return -1).
         """
 
-        return self.get_property("src_text_ending", -1)
+        return self._src_text_ending
 
     def register_source_text_range(self, starting_pos, ending_pos):
         """Register the starting position and the ending position of current node in the source text.
@@ -221,10 +288,7 @@ class ASTNodeBase:
                                                self.get_ending_position_in_source_text() + 1])
 
         #  Print the properties.
-        properties = []
-        for prop_name in self.__properties:
-            properties.append(prop_name)
-        print("Properties: %s" % str(properties))
+        print("Properties: %s" % str(self.get_property_keys()))
 
         #  Print the children count.
         print("Children Count: %d" % len(self))
@@ -22,9 +22,26 @@ STATUS_SOLID = 3
 STATUS_AQUEOUS = 4
 
 
+def _get_property_slots(extra_slots):
+    """Get the property slots mapping of a node class.
+
+    :type extra_slots: dict[str, str]
+    :param extra_slots: The property slots declared by the node class.
+    :rtype : dict[str, str]
+    :return: The mapping that contains the property slots of the base class.
+    """
+
+    r = dict(_ast_base.ASTNodeBase._PROPERTY_SLOTS)
+    r.update(extra_slots)
+
+    return r
+
+
 class _ASTNodeBaseML(_ast_base.ASTNodeBase):
     """Base class for molecule AST nodes."""
 
+    __slots__ = ()
+
     def __init__(self, node_type, parent_node=None):
         """Initialize the node.
 
@@ -84,7 +101,9 @@ class _ASTNodeBaseML(_ast_base.ASTNodeBase):
 
 
 class _ASTNodeWithPrefix(_ast_base.ASTNodeBase):
-    """Protocols for nodes which have prefix number."""
+    """Protocols for nodes which have prefix number (stored in the "_prefix" slot of the node class)."""
+
+    __slots__ = ()
 
     def get_prefix_number(self):
         """Get the prefix number.
@@ -92,7 +111,7 @@ class _ASTNodeWithPrefix(_ast_base.ASTNodeBase):
         :return: The number.
         """
 
-        return self.get_property("prefix", _math_constant.ONE)
+        return self._prefix
 
     def set_prefix_number(self, value):
         """Set the prefix number.
@@ -100,11 +119,14 @@ class _ASTNodeWithPrefix(_ast_base.ASTNodeBase):
         :param value: The number.
         """
 
-        self.set_property("prefix", value)
+        self._prefix = value
 
 
 class _ASTNodeWithSuffix(_ast_base.ASTNodeBase):
-    """Protocols for nodes which have suffix number and electronics."""
+    """Protocols for nodes which have suffix number and electronics (stored in the "_suffix_number" slot of the
+    node class)."""
+
+    __slots__ = ()
 
     def get_suffix_number(self):
         """Get the suffix number.
@@ -112,7 +134,7 @@ class _ASTNodeWithSuffix(_ast_base.ASTNodeBase):
         :return: The number.
         """
 
-        return self.get_property("suffix_number", _math_constant.ONE)
+        return self._suffix_number
 
     def set_suffix_number(self, value):
         """Set the suffix number.
@@ -120,11 +142,14 @@ class _ASTNodeWithSuffix(_ast_base.ASTNodeBase):
         :param value: The number.
         """
 
-        self.set_property("suffix_number", value)
+        self._suffix_number = value
 
 
 class _ASTNodeWithRightParenthesis(_ast_base.ASTNodeBase):
-    """Protocols for nodes which have to save the position of its right parenthesis."""
+    """Protocols for nodes which have to save the position of its right parenthesis
+    (stored in the "_right_parenthesis_position" slot of the node class)."""
+
+    __slots__ = ()
 
     def set_right_parenthesis_position(self, pos):
         """Set the position of the right parenthesis.
@@ -133,7 +158,7 @@ class _ASTNodeWithRightParenthesis(_ast_base.ASTNodeBase):
         :param pos: The position.
         """
 
-        self.set_property("right_parenthesis_position", pos)
+        self._right_parenthesis_position = pos
 
     def get_right_parenthesis_position(self):
         """Get the position of the right parenthesis.
@@ -142,11 +167,13 @@ class _ASTNodeWithRightParenthesis(_ast_base.ASTNodeBase):
         :return: The position.
         """
 
-        return self.get_property("right_parenthesis_position", -1)
+        return self._right_parenthesis_position
 
 
 class _ASTNodeWithStatus(_ast_base.ASTNodeBase):
-    """Protocols for nodes which have to save status."""
+    """Protocols for nodes which have to save status (stored in the "_status_id" slot of the node class)."""
+
+    __slots__ = ()
 
     def clear_status(self):
         """Clear molecule status."""
@@ -160,7 +187,7 @@ class _ASTNodeWithStatus(_ast_base.ASTNodeBase):
         :param status_id: The status identifier.
         """
 
-        self.set_property("status_id", status_id)
+        self._status_id = status_id
 
     def get_status(self):
         """Get molecule status.
@@ -169,7 +196,7 @@ class _ASTNodeWithStatus(_ast_base.ASTNodeBase):
         :return: The status identifier.
         """
 
-        return self.get_property("status_id", None)
+        return self._status_id
 
     def is_undefined_status(self):
         """Get whether the substance status is undefined.
@@ -220,6 +247,13 @@ class _ASTNodeWithStatus(_ast_base.ASTNodeBase):
 class ASTNodeHydrateGroup(_ASTNodeBaseML, _ASTNodeWithPrefix, _ASTNodeWithStatus):
     """AST node class for hydrate groups."""
 
+    __slots__ = ("_prefix", "_status_id")
+
+    _PROPERTY_SLOTS = _get_property_slots({
+        "prefix": "_prefix",
+        "status_id": "_status_id"
+    })
+
     def __init__(self, parent_node=None):
         """Initialize the node.
 
@@ -228,11 +262,21 @@ class ASTNodeHydrateGroup(_ASTNodeBaseML, _ASTNodeWithPrefix, _ASTNodeWithStatus
         """
 
         _ASTNodeBaseML.__init__(self, AST_TYPE_HYDRATE_GROUP, parent_node)
+        self._prefix = _math_constant.ONE
+        self._status_id = None
 
 
 class ASTNodeMolecule(_ASTNodeBaseML, _ASTNodeWithPrefix, _ASTNodeWithStatus):
     """AST node class for molecules."""
 
+    __slots__ = ("_prefix", "_status_id", "_electronic_count")
+
+    _PROPERTY_SLOTS = _get_property_slots({
+        "prefix": "_prefix",
+        "status_id": "_status_id",
+        "electronic_count": "_electronic_count"
+    })
+
     def __init__(self, parent_node=None):
         """Initialize the node.
 
@@ -241,6 +285,9 @@ class ASTNodeMolecule(_ASTNodeBaseML, _ASTNodeWithPrefix, _ASTNodeWithStatus):
         """
 
         _ASTNodeBaseML.__init__(self, AST_TYPE_MOLECULE, parent_node)
+        self._prefix = _math_constant.ONE
+        self._status_id = None
+        self._electronic_count = _math_constant.ZERO
 
     def set_electronic_count(self, value):
         """Set the electronic count.
@@ -248,7 +295,7 @@ class ASTNodeMolecule(_ASTNodeBaseML, _ASTNodeWithPrefix, _ASTNodeWithStatus):
         :param value: The new count.
         """
 
-        self.set_property("electronic_count", value)
+        self._electronic_count = value
 
     def get_electronic_count(self):
         """Get the electronic count.
@@ -256,12 +303,19 @@ class ASTNodeMolecule(_ASTNodeBaseML, _ASTNodeWithPrefix, _ASTNodeWithStatus):
         :return: The count.
         """
 
-        return self.get_property("electronic_count", _math_constant.ZERO)
+        return self._electronic_count
 
 
 class ASTNodeAtom(_ASTNodeBaseML, _ASTNodeWithSuffix):
     """AST node class for atoms."""
 
+    __slots__ = ("_suffix_number", "_atom_symbol")
+
+    _PROPERTY_SLOTS = _get_property_slots({
+        "suffix_number": "_suffix_number",
+        "atom_symbol": "_atom_symbol"
+    })
+
     def __init__(self, atom_symbol, parent_node=None):
         """Initialize the node.
 
@@ -272,7 +326,8 @@ class ASTNodeAtom(_ASTNodeBaseML, _ASTNodeWithSuffix):
         """
 
         _ASTNodeBaseML.__init__(self, AST_TYPE_ATOM, parent_node)
-        self.set_property("atom_symbol", atom_symbol)
+        self._suffix_number = _math_constant.ONE
+        self._atom_symbol = atom_symbol
 
     def get_atom_symbol(self):
         """Get the atom symbol.
@@ -281,12 +336,20 @@ class ASTNodeAtom(_ASTNodeBaseML, _ASTNodeWithSuffix):
         :return: The symbol.
         """
 
-        return self.get_property("atom_symbol")
+        return self._atom_symbol
 
 
 class ASTNodeParenthesisWrapper(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWithRightParenthesis):
     """AST node class for parenthesis wrappers."""
 
+    __slots__ = ("_suffix_number", "_right_parenthesis_position", "_inner_node")
+
+    _PROPERTY_SLOTS = _get_property_slots({
+        "suffix_number": "_suffix_number",
+        "right_parenthesis_position": "_right_parenthesis_position",
+        "inner_node": "_inner_node"
+    })
+
     def __init__(self, inner_node, parent_node=None):
         """Initialize the node.
 
@@ -297,7 +360,9 @@ class ASTNodeParenthesisWrapper(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWith
         """
 
         _ASTNodeBaseML.__init__(self, AST_TYPE_PARENTHESIS, parent_node)
-        self.set_property("inner_node", inner_node)
+        self._suffix_number = _math_constant.ONE
+        self._right_parenthesis_position = -1
+        self._inner_node = inner_node
 
     def get_inner_node(self):
         """Get the inner node.
@@ -306,7 +371,7 @@ class ASTNodeParenthesisWrapper(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWith
         :return: The node.
         """
 
-        return self.get_property("inner_node")
+        return self._inner_node
 
     def set_inner_node(self, new_node):
         """Set the inner node.
@@ -315,12 +380,20 @@ class ASTNodeParenthesisWrapper(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWith
         :param new_node: The node.
         """
 
-        self.set_property("inner_node", new_node)
+        self._inner_node = new_node
 
 
 class ASTNodeAbbreviation(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWithRightParenthesis):
     """AST node class for abbreviation descriptors."""
 
+    __slots__ = ("_suffix_number", "_right_parenthesis_position", "_abbr_symbol")
+
+    _PROPERTY_SLOTS = _get_property_slots({
+        "suffix_number": "_suffix_number",
+        "right_parenthesis_position": "_right_parenthesis_position",
+        "abbr_symbol": "_abbr_symbol"
+    })
+
     def __init__(self, abbreviation_symbol, parent_node=None):
         """Initialize the node.
 
@@ -331,7 +404,9 @@ class ASTNodeAbbreviation(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWithRightP
         """
 
         _ASTNodeBaseML.__init__(self, AST_TYPE_ABBREVIATION, parent_node)
-        self.set_property("abbr_symbol", abbreviation_symbol)
+        self._suffix_number = _math_constant.ONE
+        self._right_parenthesis_position = -1
+        self._abbr_symbol = abbreviation_symbol
 
     def get_abbreviation_symbol(self):
         """Get the abbreviation symbol.
@@ -340,4 +415,4 @@ class ASTNodeAbbreviation(_ASTNodeBaseML, _ASTNodeWithSuffix, _ASTNodeWithRightP
         :return: The symbol.
         """
 
-        return self.get_property("abbr_symbol")
+        return self._abbr_symbol
@@ -5,12 +5,13 @@
 #  found in the license.txt file.
 #
 
+import bce.instrumentation.probe as _inst_probe
+import bce.instrumentation.stage as _inst_stage
 import bce.parser.cexp.token as _cexp_token
 import bce.parser.cexp.parser as _cexp_parser
 import bce.parser.cexp.substitution as _cexp_substitution
 import bce.parser.interface.cexp_parser as _cexp_interface
 import bce.parser.interface.printer as _interface_printer
-import bce.parser.cexp.printer_mathml as _cexp_printer_mathml
 import bce.parser.cexp.printer_text as _cexp_printer_text
 
 
@@ -38,10 +39,21 @@ class ChemicalEquationParserImplementation(_cexp_interface.ChemicalEquationParse
         """
 
         #  Tokenize.
-        token_list = _cexp_token.tokenize(expression, option)
+        token_list = _inst_probe.run_stage(
+            option,
+            _inst_stage.STAGE_CEXP_TOKENIZE,
+            expression,
+            _cexp_token.tokenize,
+            expression,
+            option
+        )
 
         #  Parse.
-        cexp_object = _cexp_parser.parse(
+        cexp_object = _inst_probe.run_stage(
+            option,
+            _inst_stage.STAGE_CEXP_PARSE,
+            expression,
+            _cexp_parser.parse,
             expression,
             token_list,
             option,
@@ -94,6 +106,9 @@ class ChemicalEquationParserImplementation(_cexp_interface.ChemicalEquationParse
         if printer_type == _interface_printer.PRINTER_TYPE_TEXT:
             return _cexp_printer_text.print_cexp(cexp_object, molecule_parser, mexp_parser)
         elif printer_type == _interface_printer.PRINTER_TYPE_MATHML:
+            #  Import the MathML printer on first use.
+            import bce.parser.cexp.printer_mathml as _cexp_printer_mathml
+
             return _cexp_printer_mathml.print_cexp(
                 cexp_object,
                 molecule_parser,
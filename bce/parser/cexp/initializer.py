@@ -5,16 +5,29 @@
 #  found in the license.txt file.
 #
 
-import bce.parser.cexp.implementation as _cexp_impl
+import bce.locale.registry as _l10n_reg
 import bce.parser.cexp.l10n as _cexp_l10n
 import bce.parser.interface.option as _interface_opt
 
 
+def _create_parser():
+    """Create the CEXP parser implementation.
+
+    :rtype : bce.parser.cexp.implementation.ChemicalEquationParserImplementation
+    :return: The parser implementation.
+    """
+
+    #  Import the implementation on first use (it imports SymPy).
+    import bce.parser.cexp.implementation as _cexp_impl
+
+    return _cexp_impl.ChemicalEquationParserImplementation()
+
+
 def initialize_module():
     """Initialize the module."""
 
-    #  Setup the localization module.
-    _cexp_l10n.setup_localization()
+    #  Setup the localization module (message trees are built on first use).
+    _l10n_reg.register_message_tree_loader(_cexp_l10n.setup_localization)
 
     #  Register the parser implementation.
-    _interface_opt.register_default_cexp_parser(_cexp_impl.ChemicalEquationParserImplementation())
+    _interface_opt.register_default_cexp_parser(_interface_opt.LazyParserImplementation(_create_parser))
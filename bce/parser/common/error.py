@@ -87,7 +87,47 @@ class TracebackItem:
             underline_char * (self.__e_pos - self.__s_pos + 1),
             left_margin_str,
             start_pos_margin_str,
-            self.__txt
+            self.get_text()
+        )
+
+
+class DeferredTracebackItem(TracebackItem):
+    """Traceback description whose message is localized on demand."""
+
+    def __init__(self, expression, start_pos, end_pos, message_key, options, replace_map=None):
+        """Initialize the class.
+
+        :type expression: str
+        :type start_pos: int
+        :type end_pos: int
+        :type message_key: str
+        :type options: bce.option.Option
+        :type replace_map: dict | None
+        :param expression: The expression.
+        :param start_pos: The starting position.
+        :param end_pos: The end position.
+        :param message_key: The key path of the error message.
+        :param options: The options.
+        :param replace_map: The replace map.
+        """
+
+        TracebackItem.__init__(self, expression, start_pos, end_pos, None)
+
+        self.__key = message_key
+        self.__opt = options
+        self.__replace_map = replace_map
+
+    def get_text(self):
+        """Get the error message text.
+
+        :rtype : str
+        :return: The text.
+        """
+
+        return _l10n_reg.get_message(
+            _l10n_opt.OptionWrapper(self.__opt).get_language_id(),
+            self.__key,
+            replace_map=self.__replace_map
         )
 
 
@@ -173,6 +213,31 @@ class Error(Exception):
             _l10n_reg.apply_replace_map(msg, replace_map)
         ))
 
+    def push_deferred_traceback(self, expression, start_pos, end_pos, message_key, replace_map=None):
+        """Push a traceback item whose message is localized only when the error is
+        presented.
+
+        :type expression: str
+        :type start_pos: int
+        :type end_pos: int
+        :type message_key: str
+        :type replace_map: dict | None
+        :param expression: The expression.
+        :param start_pos: The starting position.
+        :param end_pos: The end position.
+        :param message_key: The key path of the message.
+        :param replace_map: The replace map.
+        """
+
+        self.push_traceback_raw(DeferredTracebackItem(
+            expression,
+            start_pos,
+            end_pos,
+            message_key,
+            self.__opt,
+            replace_map=replace_map
+        ))
+
     def pop_traceback(self):
         """Pop off a item from the traceback stack and return it.
 
@@ -210,7 +275,7 @@ class Error(Exception):
             lang_id,
             "parser.common.error.description"
         ) + "\n\n"
-        s += " " * (left_margin + indent) + self.__description
+        s += " " * (left_margin + indent) + self.get_description()
 
         #  Write traceback items if have.
         if len(self.__traceback) != 0:
@@ -227,3 +292,46 @@ class Error(Exception):
                 i -= 1
 
         return s
+
+
+class DeferredError(Error):
+    """Parser error whose description is localized on demand.
+
+    Note:
+      [1] Only the error code, the message keys, the replace maps and the raw
+          positions are saved when the error is created. The messages are
+          looked up (and the traceback is rendered) when the error is
+          presented, so creating the error is cheap.
+    """
+
+    def __init__(self, error_code, description_key, options, replace_map=None):
+        """Initialize the class with specific error code and description key.
+
+        :type error_code: str
+        :type description_key: str
+        :type options: bce.option.Option
+        :type replace_map: dict | None
+        :param error_code: The error code.
+        :param description_key: The key path of the description.
+        :param options: The options.
+        :param replace_map: The replace map of the description.
+        """
+
+        Error.__init__(self, error_code, None, options)
+
+        self.__key = description_key
+        self.__opt = options
+        self.__replace_map = replace_map
+
+    def get_description(self):
+        """Get the description.
+
+        :rtype : str
+        :return: The description.
+        """
+
+        return _l10n_reg.get_message(
+            _l10n_opt.OptionWrapper(self.__opt).get_language_id(),
+            self.__key,
+            replace_map=self.__replace_map
+        )
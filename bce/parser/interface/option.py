@@ -13,6 +13,51 @@ OPT_KEY_MOLECULE_PARSER_IMPLEMENTATION = "parser.implementation.molecule"
 OPT_KEY_CEXP_PARSER_IMPLEMENTATION = "parser.implementation.cexp"
 
 
+class LazyParserImplementation:
+    """Parser implementation that is created on first use.
+
+    Note:
+      [1] Registering default parsers in this form keeps "import bce" from
+          importing the parsers (and SymPy) until a parser is really used.
+      [2] The implementation is created only once and shared by all option
+          objects.
+    """
+
+    def __init__(self, factory):
+        """Initialize the object.
+
+        :type factory: () -> object
+        :param factory: A function that creates the parser implementation.
+        """
+
+        self.__factory = factory
+        self.__impl = None
+
+    def get_implementation(self):
+        """Get the parser implementation (and create it if needed).
+
+        :return: The parser implementation.
+        """
+
+        if self.__impl is None:
+            self.__impl = self.__factory()
+
+        return self.__impl
+
+
+def _resolve_parser(value):
+    """Resolve a parser implementation from its option value.
+
+    :param value: The option value.
+    :return: The parser implementation.
+    """
+
+    if isinstance(value, LazyParserImplementation):
+        return value.get_implementation()
+
+    return value
+
+
 class OptionWrapper:
     """Option operations wrapper."""
 
@@ -32,7 +77,7 @@ class OptionWrapper:
         :return: The parser implementation.
         """
 
-        return self.__opt.get_option_value(OPT_KEY_MEXP_PARSER_IMPLEMENTATION)
+        return _resolve_parser(self.__opt.get_option_value(OPT_KEY_MEXP_PARSER_IMPLEMENTATION))
 
     def set_mexp_parser(self, parser_impl):
         """Set the MEXP parser.
@@ -50,7 +95,7 @@ class OptionWrapper:
         :return: The parser implementation.
         """
 
-        return self.__opt.get_option_value(OPT_KEY_MOLECULE_PARSER_IMPLEMENTATION)
+        return _resolve_parser(self.__opt.get_option_value(OPT_KEY_MOLECULE_PARSER_IMPLEMENTATION))
 
     def set_molecule_parser(self, parser_impl):
         """Set the molecule parser.
@@ -68,7 +113,7 @@ class OptionWrapper:
         :return: The parser implementation.
         """
 
-        return self.__opt.get_option_value(OPT_KEY_CEXP_PARSER_IMPLEMENTATION)
+        return _resolve_parser(self.__opt.get_option_value(OPT_KEY_CEXP_PARSER_IMPLEMENTATION))
 
     def set_cexp_parser(self, parser_impl):
         """Set the CEXP parser.
@@ -83,7 +128,7 @@ class OptionWrapper:
 def register_default_mexp_parser(parser_impl):
     """Register default MEXP parser.
 
-    :type parser_impl: bce.parser.interface.mexp_parser.MathExpressionParserInterface
+    :type parser_impl: bce.parser.interface.mexp_parser.MathExpressionParserInterface | LazyParserImplementation
     :param parser_impl: The parser implementation.
     """
 
@@ -93,7 +138,7 @@ def register_default_mexp_parser(parser_impl):
 def register_default_molecule_parser(parser_impl):
     """Register default molecule parser.
 
-    :type parser_impl: bce.parser.interface.molecule_parser.MoleculeParserInterface
+    :type parser_impl: bce.parser.interface.molecule_parser.MoleculeParserInterface | LazyParserImplementation
     :param parser_impl: The parser implementation.
     """
 
@@ -103,7 +148,7 @@ def register_default_molecule_parser(parser_impl):
 def register_default_cexp_parser(parser_impl):
     """Register the default CEXP parser.
 
-    :type parser_impl: bce.parser.interface.cexp_parser.ChemicalEquationParserInterface
+    :type parser_impl: bce.parser.interface.cexp_parser.ChemicalEquationParserInterface | LazyParserImplementation
     :param parser_impl: The parser implementation.
     """
 
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.parser.mexp.option as _mexp_opt
+import collections as _collections
+import threading as _threading
+
+
+class ExpressionCache:
+    """LRU cache of evaluated math expressions.
+
+    Note:
+      [1] The evaluated values are SymPy objects, which are immutable, so they
+          are shared by all callers directly.
+      [2] Only successful evaluations are cached. Errors depend on the language
+          option and are raised again each time.
+      [3] Values are cached per evaluation mode, since the modes may give
+          different forms of the same value.
+      [4] The cache is thread-safe.
+    """
+
+    def __init__(self, capacity=4096):
+        """Initialize the cache.
+
+        :type capacity: int
+        :param capacity: The maximum count of cached expressions.
+        """
+
+        if capacity < 1:
+            raise ValueError("Invalid capacity.")
+
+        self.__cap = capacity
+        self.__data = _collections.OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = _threading.Lock()
+
+    def __len__(self):
+        """Get the count of cached expressions.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return len(self.__data)
+
+    def get_capacity(self):
+        """Get the maximum count of cached expressions.
+
+        :rtype : int
+        :return: The capacity.
+        """
+
+        return self.__cap
+
+    def get_hit_count(self):
+        """Get the count of cache hits.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__hits
+
+    def get_miss_count(self):
+        """Get the count of cache misses.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__misses
+
+    def clear(self):
+        """Remove all cached expressions and reset the counters."""
+
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def lookup(
+            self,
+            expression,
+            protected_header_enabled=False,
+            protected_header_prefix="X",
+            evaluation_mode=_mexp_opt.EVALUATION_MODE_STEPWISE
+    ):
+        """Look up the evaluated value of an expression.
+
+        :type expression: str
+        :type protected_header_enabled: bool
+        :type protected_header_prefix: str
+        :type evaluation_mode: int
+        :param expression: The expression.
+        :param protected_header_enabled: Whether the protected headers are enabled.
+        :param protected_header_prefix: The prefix of the protected headers.
+        :param evaluation_mode: The evaluation mode.
+        :return: The value (None if not found).
+        """
+
+        key = (expression, protected_header_prefix if protected_header_enabled else None, evaluation_mode)
+
+        with self.__lock:
+            value = self.__data.pop(key, None)
+            if value is None:
+                self.__misses += 1
+                return None
+
+            #  Mark the value as the most recently used one.
+            self.__data[key] = value
+            self.__hits += 1
+
+        return value
+
+    def store(
+            self,
+            expression,
+            value,
+            protected_header_enabled=False,
+            protected_header_prefix="X",
+            evaluation_mode=_mexp_opt.EVALUATION_MODE_STEPWISE
+    ):
+        """Store the evaluated value of an expression.
+
+        :type expression: str
+        :type protected_header_enabled: bool
+        :type protected_header_prefix: str
+        :type evaluation_mode: int
+        :param expression: The expression.
+        :param value: The value.
+        :param protected_header_enabled: Whether the protected headers are enabled.
+        :param protected_header_prefix: The prefix of the protected headers.
+        :param evaluation_mode: The evaluation mode.
+        """
+
+        key = (expression, protected_header_prefix if protected_header_enabled else None, evaluation_mode)
+
+        with self.__lock:
+            self.__data.pop(key, None)
+            self.__data[key] = value
+            while len(self.__data) > self.__cap:
+                self.__data.popitem(last=False)
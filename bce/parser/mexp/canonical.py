@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import sympy as _sympy
+
+
+def canonicalize(value):
+    """Canonicalize a value cheaply (without simplifying it).
+
+    Note:
+      [1] Rational numbers are already in canonical form. Other values are
+          written as a fraction of two expanded polynomials with no common
+          factors, which is unique for rational functions.
+
+    :param value: The value.
+    :return: The canonicalized value.
+    """
+
+    if value.is_Rational:
+        return value
+
+    return _sympy.cancel(value)
+
+
+def is_zero(value):
+    """Check whether a canonicalized value equals to zero.
+
+    :param value: The value.
+    :rtype : bool | None
+    :return: The result (None if it can't be decided).
+    """
+
+    result = value.is_zero
+    if result is None:
+        #  Fall back to the full simplification.
+        result = value.simplify().is_zero
+
+    return result
+
+
+def is_negative(value):
+    """Check whether a canonicalized value is negative.
+
+    :param value: The value.
+    :rtype : bool | None
+    :return: The result (None if it can't be decided).
+    """
+
+    result = value.is_negative
+    if result is None:
+        #  Fall back to the full simplification.
+        result = value.simplify().is_negative
+
+    return result
@@ -5,6 +5,7 @@
 #  found in the license.txt file.
 #
 
+import bce.parser.mexp.canonical as _mexp_canonical
 import sympy as _sympy
 
 #  Error codes.
@@ -62,11 +63,13 @@ class _MathFunctionBase:
         return self.__argc
 
     # noinspection PyMethodMayBeStatic
-    def invoke(self, arguments):
+    def invoke(self, arguments, deferred_simplify=False):
         """Invoke the function.
 
         :type arguments: list
+        :type deferred_simplify: bool
         :param arguments: The arguments.
+        :param deferred_simplify: Whether the result is only canonicalized (instead of being simplified).
         :rtype : (int, object)
         :return: A tuple contains the error code and the detailed result.
         """
@@ -85,11 +88,13 @@ class MathFunctionPower(_MathFunctionBase):
 
         _MathFunctionBase.__init__(self, "pow", None, 2)
 
-    def invoke(self, arguments):
+    def invoke(self, arguments, deferred_simplify=False):
         """Invoke the function.
 
         :type arguments: list
+        :type deferred_simplify: bool
         :param arguments: The arguments.
+        :param deferred_simplify: Whether the result is only canonicalized (instead of being simplified).
         :rtype : (int, object)
         :return: A tuple contains the error code and the detailed result.
         """
@@ -104,12 +109,17 @@ class MathFunctionPower(_MathFunctionBase):
                 }
             )
 
-        #  Get the base and the exponent.
-        base_value = arguments[0].simplify()
-        exp_value = arguments[1].simplify()
-
-        #  Check the domain.
-        if base_value.is_zero and exp_value.is_negative:
+        #  Get the base and the exponent and check the domain.
+        if deferred_simplify:
+            base_value = arguments[0]
+            exp_value = arguments[1]
+            is_out_of_domain = _mexp_canonical.is_zero(base_value) and _mexp_canonical.is_negative(exp_value)
+        else:
+            base_value = arguments[0].simplify()
+            exp_value = arguments[1].simplify()
+            is_out_of_domain = base_value.is_zero and exp_value.is_negative
+
+        if is_out_of_domain:
             return (
                 ERROR_DOMAIN,
                 {
@@ -118,7 +128,10 @@ class MathFunctionPower(_MathFunctionBase):
             )
 
         #  Calculate.
-        result = (base_value ** exp_value).simplify()
+        if deferred_simplify:
+            result = _mexp_canonical.canonicalize(base_value ** exp_value)
+        else:
+            result = (base_value ** exp_value).simplify()
 
         return (
             ERROR_SUCCESS,
@@ -134,11 +147,13 @@ class MathFunctionSquareRoot(_MathFunctionBase):
 
         _MathFunctionBase.__init__(self, "sqrt", "sqrt", 1)
 
-    def invoke(self, arguments):
+    def invoke(self, arguments, deferred_simplify=False):
         """Invoke the function.
 
         :type arguments: list
+        :type deferred_simplify: bool
         :param arguments: The arguments.
+        :param deferred_simplify: Whether the result is only canonicalized (instead of being simplified).
         :rtype : (int, object)
         :return: A tuple contains the error code and the detailed result.
         """
@@ -153,11 +168,15 @@ class MathFunctionSquareRoot(_MathFunctionBase):
                 }
             )
 
-        #  Get the base.
-        base_value = arguments[0].simplify()
+        #  Get the base and check the domain.
+        if deferred_simplify:
+            base_value = arguments[0]
+            is_out_of_domain = _mexp_canonical.is_negative(base_value)
+        else:
+            base_value = arguments[0].simplify()
+            is_out_of_domain = base_value.is_negative
 
-        #  Check the domain.
-        if base_value.is_negative:
+        if is_out_of_domain:
             return (
                 ERROR_DOMAIN,
                 {
@@ -166,7 +185,10 @@ class MathFunctionSquareRoot(_MathFunctionBase):
             )
 
         #  Calculate.
-        result = _sympy.sqrt(base_value).simplify()
+        if deferred_simplify:
+            result = _mexp_canonical.canonicalize(_sympy.sqrt(base_value))
+        else:
+            result = _sympy.sqrt(base_value).simplify()
 
         return (
             ERROR_SUCCESS,
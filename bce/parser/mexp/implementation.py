@@ -5,11 +5,14 @@
 #  found in the license.txt file.
 #
 
+import bce.instrumentation.probe as _inst_probe
+import bce.instrumentation.stage as _inst_stage
 import bce.parser.interface.mexp_parser as _mexp_interface
 import bce.parser.interface.printer as _interface_printer
+import bce.parser.mexp.cache as _mexp_cache
+import bce.parser.mexp.option as _mexp_opt
 import bce.parser.mexp.token as _mexp_token
 import bce.parser.mexp.parser as _mexp_parser
-import bce.parser.mexp.printer_mathml as _mexp_printer_mathml
 import bce.parser.mexp.printer_text as _mexp_printer_text
 import bce.parser.mexp.rpn as _mexp_rpn
 
@@ -17,11 +20,29 @@ import bce.parser.mexp.rpn as _mexp_rpn
 class MathExpressionParserImplementation(_mexp_interface.MathExpressionParserInterface):
     """Implementation of math expression parser."""
 
-    def __init__(self):
-        """Initialize the object."""
+    def __init__(self, cache_capacity=4096):
+        """Initialize the object.
+
+        :type cache_capacity: int
+        :param cache_capacity: The capacity of the evaluation cache (0 if the cache is to be disabled).
+        """
 
         _mexp_interface.MathExpressionParserInterface.__init__(self)
 
+        if cache_capacity > 0:
+            self.__cache = _mexp_cache.ExpressionCache(cache_capacity)
+        else:
+            self.__cache = None
+
+    def get_cache(self):
+        """Get the evaluation cache.
+
+        :rtype : bce.parser.mexp.cache.ExpressionCache | None
+        :return: The cache (None if the cache is disabled).
+        """
+
+        return self.__cache
+
     def parse(self, expression, options, protected_header_enabled=False, protected_header_prefix="X"):
         """Parse an expression.
 
@@ -36,6 +57,20 @@ class MathExpressionParserImplementation(_mexp_interface.MathExpressionParserInt
         :return: The calculated value.
         """
 
+        #  Get the evaluation mode.
+        evaluation_mode = _mexp_opt.OptionWrapper(options).get_evaluation_mode()
+
+        #  Try to get the value from the cache.
+        if self.__cache is not None:
+            result = self.__cache.lookup(
+                expression,
+                protected_header_enabled=protected_header_enabled,
+                protected_header_prefix=protected_header_prefix,
+                evaluation_mode=evaluation_mode
+            )
+            if result is not None:
+                return result
+
         #  Tokenize.
         token_list = _mexp_token.tokenize(expression, options)
 
@@ -49,7 +84,25 @@ class MathExpressionParserImplementation(_mexp_interface.MathExpressionParserInt
         )
 
         #  Evaluate.
-        result = _mexp_rpn.calculate_rpn(expression, rpn_token_list, options)
+        result = _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_MEXP_EVALUATE,
+            expression,
+            _mexp_rpn.calculate_rpn,
+            expression,
+            rpn_token_list,
+            options
+        )
+
+        #  Save the value to the cache.
+        if self.__cache is not None:
+            self.__cache.store(
+                expression,
+                result,
+                protected_header_enabled=protected_header_enabled,
+                protected_header_prefix=protected_header_prefix,
+                evaluation_mode=evaluation_mode
+            )
 
         return result
 
@@ -90,6 +143,9 @@ class MathExpressionParserImplementation(_mexp_interface.MathExpressionParserInt
         if printer_type == _interface_printer.PRINTER_TYPE_TEXT:
             return _mexp_printer_text.print_mexp(value)
         elif printer_type == _interface_printer.PRINTER_TYPE_MATHML:
+            #  Import the MathML printer on first use.
+            import bce.parser.mexp.printer_mathml as _mexp_printer_mathml
+
             return _mexp_printer_mathml.print_mexp(
                 value,
                 protected_header_enabled=protected_header_enabled,
@@ -5,16 +5,33 @@
 #  found in the license.txt file.
 #
 
+import bce.locale.registry as _l10n_reg
 import bce.parser.interface.option as _interface_opt
-import bce.parser.mexp.implementation as _mexp_impl
 import bce.parser.mexp.l10n as _mexp_l10n
+import bce.parser.mexp.option as _mexp_opt
+
+
+def _create_parser():
+    """Create the MEXP parser implementation.
+
+    :rtype : bce.parser.mexp.implementation.MathExpressionParserImplementation
+    :return: The parser implementation.
+    """
+
+    #  Import the implementation on first use (it imports SymPy).
+    import bce.parser.mexp.implementation as _mexp_impl
+
+    return _mexp_impl.MathExpressionParserImplementation()
 
 
 def initialize_module():
     """Initialize the module."""
 
-    #  Setup the localization module.
-    _mexp_l10n.setup_localization()
+    #  Initialize the global option.
+    _mexp_opt.initialize_global_option()
+
+    #  Setup the localization module (message trees are built on first use).
+    _l10n_reg.register_message_tree_loader(_mexp_l10n.setup_localization)
 
     #  Register the parser implementation.
-    _interface_opt.register_default_mexp_parser(_mexp_impl.MathExpressionParserImplementation())
+    _interface_opt.register_default_mexp_parser(_interface_opt.LazyParserImplementation(_create_parser))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.option as _opt
+
+#  Option keys.
+OPT_KEY_EVALUATION_MODE = "parser.mexp.evaluation_mode"
+
+#  Evaluation modes.
+EVALUATION_MODE_STEPWISE = 0
+EVALUATION_MODE_DEFERRED = 1
+
+
+class OptionWrapper:
+    """Option operations wrapper."""
+
+    def __init__(self, opt):
+        """Initialize the wrapper.
+
+        :type opt: bce.option.Option
+        :param opt: The option object.
+        """
+
+        self.__opt = opt
+
+    def get_evaluation_mode(self):
+        """Get the evaluation mode.
+
+        :rtype : int
+        :return: The mode (one of EVALUATION_MODE_* constants).
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_EVALUATION_MODE)
+
+    def set_evaluation_mode(self, mode):
+        """Set the evaluation mode.
+
+        Note:
+          [1] EVALUATION_MODE_STEPWISE simplifies the value after each operator.
+          [2] EVALUATION_MODE_DEFERRED only canonicalizes the value after each
+              operator and simplifies the final value once. The values are
+              equal to the ones of the stepwise mode, but they may be printed
+              in different (but equivalent) forms.
+
+        :type mode: int
+        :param mode: The mode (one of EVALUATION_MODE_* constants).
+        """
+
+        self.__opt.set_option_value(OPT_KEY_EVALUATION_MODE, mode)
+
+
+def initialize_global_option():
+    """Initialize global options."""
+
+    _opt.register_option_pair(OPT_KEY_EVALUATION_MODE, EVALUATION_MODE_STEPWISE)
@@ -9,8 +9,10 @@ import bce.base.stack as _adt_stack
 import bce.locale.option as _l10n_opt
 import bce.locale.registry as _l10n_reg
 import bce.parser.common.error as _cm_error
+import bce.parser.mexp.canonical as _mexp_canonical
 import bce.parser.mexp.error as _mexp_errors
 import bce.parser.mexp.function as _mexp_functions
+import bce.parser.mexp.option as _mexp_opt
 import bce.utils.sympy_converter as _util_sympy_cnv
 import sympy as _sympy
 
@@ -18,6 +20,11 @@ import sympy as _sympy
 def calculate_rpn(expression, rpn_token_list, options):
     """Calculate the value of a RPN token list.
 
+    Note:
+      [1] In the deferred evaluation mode, intermediate values are only
+          canonicalized (see bce.parser.mexp.canonical) and the final value is
+          simplified once. Zero and sign checks are still done exactly.
+
     :type expression: str
     :type rpn_token_list: list[bce.parser.mexp.token.Token]
     :type options: bce.option.Option
@@ -34,6 +41,13 @@ def calculate_rpn(expression, rpn_token_list, options):
     #  Get the language ID.
     lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
 
+    #  Get the evaluation mode.
+    deferred = (_mexp_opt.OptionWrapper(options).get_evaluation_mode() == _mexp_opt.EVALUATION_MODE_DEFERRED)
+    if deferred:
+        reduce_value = _mexp_canonical.canonicalize
+    else:
+        reduce_value = _sympy.simplify
+
     #  Initialize the operand stack.
     calc_stack = _adt_stack.Stack()
 
@@ -53,7 +67,7 @@ def calculate_rpn(expression, rpn_token_list, options):
             num1 = calc_stack.pop()
 
             #  Calculate.
-            result = (num1 + num2).simplify()
+            result = reduce_value(num1 + num2)
 
             #  Push the result onto the stack.
             calc_stack.push(result)
@@ -63,7 +77,7 @@ def calculate_rpn(expression, rpn_token_list, options):
             num1 = calc_stack.pop()
 
             #  Calculate.
-            result = (num1 - num2).simplify()
+            result = reduce_value(num1 - num2)
 
             #  Do minus and push the result onto the stack.
             calc_stack.push(result)
@@ -73,7 +87,7 @@ def calculate_rpn(expression, rpn_token_list, options):
             num1 = calc_stack.pop()
 
             #  Calculate.
-            result = (num1 * num2).simplify()
+            result = reduce_value(num1 * num2)
 
             #  Push the result onto the stack.
             calc_stack.push(result)
@@ -82,11 +96,16 @@ def calculate_rpn(expression, rpn_token_list, options):
             num2 = calc_stack.pop()
             num1 = calc_stack.pop()
 
-            #  Simplify before checking.
-            num2 = num2.simplify()
+            #  Check whether the rhs equals to zero.
+            if deferred:
+                is_divisor_zero = _mexp_canonical.is_zero(num2)
+            else:
+                #  Simplify before checking.
+                num2 = num2.simplify()
+                is_divisor_zero = num2.is_zero
 
             #  Raise an error if the rhs equals to zero.
-            if num2.is_zero:
+            if is_divisor_zero:
                 err = _cm_error.Error(
                     _mexp_errors.MEXP_RPN_EVALUATION_DIVIDE_ZERO,
                     _l10n_reg.get_message(
@@ -107,7 +126,7 @@ def calculate_rpn(expression, rpn_token_list, options):
                 raise err
 
             #  Calculate.
-            result = (num1 / num2).simplify()
+            result = reduce_value(num1 / num2)
 
             #  Push the result onto the stack.
             calc_stack.push(result)
@@ -116,12 +135,17 @@ def calculate_rpn(expression, rpn_token_list, options):
             num2 = calc_stack.pop()
             num1 = calc_stack.pop()
 
-            #  Simplify before checking.
-            num1 = num1.simplify()
-            num2 = num2.simplify()
+            #  Check the signs of the operands.
+            if deferred:
+                is_invalid = _mexp_canonical.is_negative(num2) and _mexp_canonical.is_zero(num1)
+            else:
+                #  Simplify before checking.
+                num1 = num1.simplify()
+                num2 = num2.simplify()
+                is_invalid = num2.is_negative and num1.is_zero
 
             #  For a ^ b, when b < 0, a != 0.
-            if num2.is_negative and num1.is_zero:
+            if is_invalid:
                 err = _cm_error.Error(
                     _mexp_errors.MEXP_RPN_EVALUATION_DIVIDE_ZERO,
                     _l10n_reg.get_message(
@@ -142,7 +166,7 @@ def calculate_rpn(expression, rpn_token_list, options):
                 raise err
 
             #  Calculate.
-            result = (num1 ** num2).simplify()
+            result = reduce_value(num1 ** num2)
 
             #  Push the result onto the stack.
             calc_stack.push(result)
@@ -151,7 +175,7 @@ def calculate_rpn(expression, rpn_token_list, options):
             num1 = calc_stack.pop()
 
             #  Calculate.
-            result = (-num1).simplify()
+            result = reduce_value(-num1)
 
             #  Push the result onto the stack.
             calc_stack.push(result)
@@ -167,7 +191,7 @@ def calculate_rpn(expression, rpn_token_list, options):
                 arguments.insert(0, calc_stack.pop())
 
             #  Invoke.
-            error_code, result = fn_object.invoke(arguments)
+            error_code, result = fn_object.invoke(arguments, deferred_simplify=deferred)
 
             #  Handle the error code and the result.
             if error_code == _mexp_functions.ERROR_SUCCESS:
@@ -213,4 +237,8 @@ def calculate_rpn(expression, rpn_token_list, options):
     if len(calc_stack) > 1:
         raise RuntimeError("BUG: Too many items in the stack after calculation.")
 
+    #  Simplify the final value (in the deferred evaluation mode).
+    if deferred:
+        return calc_stack.top().simplify()
+
     return calc_stack.top()
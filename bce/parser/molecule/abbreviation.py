@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.database.bundled.abbreviation as _bundled_abbreviation
+import bce.database.bundled.abbreviation_atoms as _bundled_abbreviation_atoms
+import bce.parser.mexp.option as _mexp_opt
+
+
+class AbbreviationTable:
+    """Compiled abbreviation table (abbreviation symbol => atoms dictionary).
+
+    Note:
+      [1] Bundled abbreviations whose expansions weren't changed are resolved
+          from the pre-compiled bundled table directly.
+      [2] Other abbreviations are compiled when they are used for the first
+          time. Parsing errors are never saved, so they are raised (with full
+          tracebacks) every time the abbreviation is used.
+      [3] A table is bound to one abbreviation mapping. A new table is created
+          each time the mapping is set.
+    """
+
+    def __init__(self, mapping):
+        """Initialize the table.
+
+        :type mapping: dict[str, str]
+        :param mapping: The abbreviation mapping (it must not be changed later).
+        """
+
+        self.__mapping = mapping
+        self.__compiled = {}
+
+    def get_expression(self, symbol):
+        """Get the expression of an abbreviation.
+
+        :type symbol: str
+        :param symbol: The abbreviation symbol.
+        :rtype : str | None
+        :return: The expression (None if the abbreviation doesn't exist).
+        """
+
+        return self.__mapping.get(symbol)
+
+    def lookup(
+            self,
+            symbol,
+            mexp_protected_header_enabled=False,
+            mexp_protected_header_prefix="X",
+            mexp_evaluation_mode=_mexp_opt.EVALUATION_MODE_STEPWISE
+    ):
+        """Look up the compiled atoms dictionary of an abbreviation.
+
+        :type symbol: str
+        :type mexp_protected_header_enabled: bool
+        :type mexp_protected_header_prefix: str
+        :type mexp_evaluation_mode: int
+        :param symbol: The abbreviation symbol.
+        :param mexp_protected_header_enabled: Whether the MEXP protected headers are enabled.
+        :param mexp_protected_header_prefix: The prefix of the MEXP protected headers.
+        :param mexp_evaluation_mode: The MEXP evaluation mode.
+        :rtype : dict | None
+        :return: The atoms dictionary (None if the abbreviation hasn't been compiled).
+        """
+
+        key = (symbol, mexp_protected_header_enabled, mexp_protected_header_prefix, mexp_evaluation_mode)
+        if key in self.__compiled:
+            return self.__compiled[key]
+
+        #  Try the pre-compiled bundled table.
+        expression = self.__mapping.get(symbol)
+        if expression is None or _bundled_abbreviation.ABBREVIATION_DATABASE.get(symbol) != expression:
+            return None
+
+        #  The atom counts are kept as native integers (the merging utility accepts them directly).
+        atoms = dict(_bundled_abbreviation_atoms.ABBREVIATION_ATOMS_DATABASE[symbol])
+        self.__compiled[key] = atoms
+
+        return atoms
+
+    def store(
+            self,
+            symbol,
+            atoms,
+            mexp_protected_header_enabled=False,
+            mexp_protected_header_prefix="X",
+            mexp_evaluation_mode=_mexp_opt.EVALUATION_MODE_STEPWISE
+    ):
+        """Save the compiled atoms dictionary of an abbreviation.
+
+        :type symbol: str
+        :type atoms: dict
+        :type mexp_protected_header_enabled: bool
+        :type mexp_protected_header_prefix: str
+        :type mexp_evaluation_mode: int
+        :param symbol: The abbreviation symbol.
+        :param atoms: The atoms dictionary.
+        :param mexp_protected_header_enabled: Whether the MEXP protected headers are enabled.
+        :param mexp_protected_header_prefix: The prefix of the MEXP protected headers.
+        :param mexp_evaluation_mode: The MEXP evaluation mode.
+        """
+
+        key = (symbol, mexp_protected_header_enabled, mexp_protected_header_prefix, mexp_evaluation_mode)
+        self.__compiled[key] = atoms
@@ -5,46 +5,44 @@
 #  found in the license.txt file.
 #
 
-import bce.parser.ast.molecule as _ast_base
+import bce.parser.molecule.ast_traversal as _ml_ast_traversal
+import collections as _collections
 
 
 def do_bfs(root_node, reverse_order=True):
     """Do BFS on specified AST tree.
 
-    :type root_node: _ast_base._ASTNodeBaseML
+    Note:
+      [1] New codes should use the iterators in bce.parser.molecule.ast_traversal
+          (iterate_reversed_bfs() yields the nodes in the same order as this
+          function with reverse_order=True).
+
+    :type root_node: bce.parser.ast.molecule._ASTNodeBaseML
     :type reverse_order: bool
     :param root_node: The root node.
     :param reverse_order: Set to True if you want to iterate from leaves to the root. Otherwise, set to False.
-    :rtype : list[_ast_base._ASTNodeBaseML]
+    :rtype : list[bce.parser.ast.molecule._ASTNodeBaseML]
     :return: A list that contains the BFS result.
     """
 
     #  Initialize the BFS queue.
-    queue = [root_node]
-    """:type : list[_ml_ast_base._ASTNodeBaseML]"""
+    queue = _collections.deque([root_node])
 
     #  Initialize the result container.
     r = []
-    """:type : list[_ml_ast_base._ASTNodeBaseML]"""
+    """:type : list[bce.parser.ast.molecule._ASTNodeBaseML]"""
 
     while len(queue) != 0:
         #  Pop the first item off from the queue.
-        front_node = queue.pop(0)
+        front_node = queue.popleft()
 
         #  Insert the item to the result.
-        if reverse_order:
-            r.insert(0, front_node)
-        else:
-            r.append(front_node)
+        r.append(front_node)
 
         #  Add children.
-        if front_node.is_hydrate_group() or front_node.is_molecule():
-            for child_id in range(0, len(front_node)):
-                queue.append(front_node[child_id])
-        elif front_node.is_parenthesis():
-            assert isinstance(front_node, _ast_base.ASTNodeParenthesisWrapper)
-            queue.append(front_node.get_inner_node())
-        else:
-            pass
+        queue.extend(_ml_ast_traversal.get_children(front_node))
+
+    if reverse_order:
+        r.reverse()
 
     return r
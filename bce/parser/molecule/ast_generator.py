@@ -10,7 +10,7 @@ import bce.locale.registry as _l10n_reg
 import bce.math.constant as _math_cst
 import bce.parser.ast.molecule as _ml_ast_base
 import bce.parser.common.error as _cm_error
-import bce.parser.molecule.ast_bfs as _ml_ast_bfs
+import bce.parser.molecule.ast_traversal as _ml_ast_traversal
 import bce.parser.molecule.error as _ml_error
 
 #  States of the state machine.
@@ -598,48 +598,40 @@ def generate_ast(expression, token_list, options):
     #  Get the ending position.
     ending_pos = token_list[-1].get_position() - 1
 
-    #  Initialize the parenthesis-mismatched flag.
-    mismatch_flag = False
-
-    #  Pre-create an error.
-    err = _cm_error.Error(
-        _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
-        _l10n_reg.get_message(
-            lang_id,
-            "parser.molecule.error.parenthesis_mismatch.description"
-        ),
-        options
-    )
+    #  Initialize the error (created when the first mismatched parenthesis is met).
+    err = None
 
     while node is not None:
         #  Register the ending position of current working node.
         node.register_ending_position_in_source_text(ending_pos)
 
-        #  Mark the error flag and add an error description if current node is a parenthesis node.
+        #  Add an error description if current node is a parenthesis node.
         if node.is_parenthesis():
-            mismatch_flag = True
-            err.push_traceback(
+            if err is None:
+                err = _cm_error.DeferredError(
+                    _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
+                    "parser.molecule.error.parenthesis_mismatch.description",
+                    options
+                )
+            err.push_deferred_traceback(
                 expression,
                 node.get_starting_position_in_source_text(),
                 node.get_starting_position_in_source_text(),
-                _l10n_reg.get_message(
-                    lang_id,
-                    "parser.molecule.error.parenthesis_mismatch.right"
-                )
+                "parser.molecule.error.parenthesis_mismatch.right"
             )
 
         #  Go to parent node.
         node = node.get_parent_node()
 
     #  Raise an error if we have met at least 1 parenthesis node.
-    if mismatch_flag:
+    if err is not None:
         raise err
 
     #  Now, we have constructed the whole AST, but we got a lot of useless hydrate group node.
     #  So we have to remove them (all hydrate groups nodes which have only 1 child).
 
     #  Get iterate order.
-    unpack_order = _ml_ast_bfs.do_bfs(root, True)
+    unpack_order = _ml_ast_traversal.iterate_reversed_bfs(root)
 
     #  Initialize unpacked node container.
     unpacked = {}
@@ -9,14 +9,41 @@ import bce.locale.option as _l10n_opt
 import bce.locale.registry as _l10n_reg
 import bce.parser.common.error as _cm_error
 import bce.parser.interface.option as _interface_opt
-import bce.parser.molecule.ast_bfs as _ml_ast_bfs
+import bce.parser.mexp.option as _mexp_opt
+import bce.parser.molecule.ast_traversal as _ml_ast_traversal
 import bce.parser.molecule.error as _ml_error
 import bce.parser.molecule.option as _ml_opt
 import bce.parser.ast.molecule as _ast_base
+import sympy as _sympy
+
+
+def _to_native_integer(value):
+    """Try to convert a value to a native integer.
+
+    :param value: The value (a native integer or a SymPy object).
+    :rtype : int | None
+    :return: The native integer (None if the value isn't an integer).
+    """
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+
+    if getattr(value, "is_Integer", False) is True:
+        return int(value)
+
+    return None
 
 
 class MergeUtil:
-    """Merge utility."""
+    """Merge utility.
+
+    Note:
+      [1] Integer coefficients are kept as native integers, so ordinary formulas
+          never touch SymPy arithmetic. A coefficient is promoted to a SymPy
+          object only when a symbolic (or fractional) operand appears, and is
+          demoted again if it simplifies to an integer.
+      [2] get_data() always returns SymPy objects.
+    """
 
     def __init__(self):
         """Initialize the class."""
@@ -54,6 +81,10 @@ class MergeUtil:
         :param coeff: The coefficient.
         """
 
+        native = _to_native_integer(coeff)
+        if native is not None:
+            coeff = native
+
         for key in self.__data:
             self.__data[key] = self.__data[key] * coeff
 
@@ -65,6 +96,10 @@ class MergeUtil:
         :param value: The coefficient.
         """
 
+        native = _to_native_integer(value)
+        if native is not None:
+            value = native
+
         if key in self.__data:
             self.__data[key] = self.__data[key] + value
         else:
@@ -78,6 +113,10 @@ class MergeUtil:
         :param coeff: The merge coefficient.
         """
 
+        native = _to_native_integer(coeff)
+        if native is not None:
+            coeff = native
+
         for key in another.__data:
             self.add(key, another.__data[key] * coeff)
 
@@ -93,14 +132,26 @@ class MergeUtil:
 
         #  Simplify the coefficient of each atom.
         for key in self.__data:
-            #  Do simplifying.
-            val = self.__data[key].simplify()
+            val = self.__data[key]
+
+            if isinstance(val, int):
+                #  Native integers are always simplified.
+                is_zero = (val == 0)
+            else:
+                #  Do simplifying.
+                val = val.simplify()
+                is_zero = val.is_zero
+
+                #  Demote to native integer if possible.
+                native = _to_native_integer(val)
+                if native is not None:
+                    val = native
 
             #  Save the simplified value.
             self.__data[key] = val
 
             #  Put the atom into the eliminated atoms list if its coefficient equals to 0.
-            if val.is_zero:
+            if is_zero:
                 r.append(key)
 
         #  Remove atoms that is in the eliminated atoms list from the atom dictionary.
@@ -115,7 +166,15 @@ class MergeUtil:
         :rtype : dict
         :return: The data.
         """
-        return self.__data
+
+        r = {}
+        for key in self.__data:
+            val = self.__data[key]
+            if isinstance(val, int):
+                val = _sympy.Integer(val)
+            r[key] = val
+
+        return r
 
 
 def _macro_simplify(expression, mu_obj, node, options):
@@ -131,47 +190,34 @@ def _macro_simplify(expression, mu_obj, node, options):
     :param options: The options.
     """
 
-    #  Get the language ID.
-    lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
-
     #  Simplify.
     removed = mu_obj.simplify()
 
-    #  Pre-create an atom-eliminated error.
-    err = _cm_error.Error(
+    #  Get the eliminated elements (electrons can be eliminated).
+    eliminated = [symbol for symbol in removed if symbol != "e"]
+    if len(eliminated) == 0:
+        return
+
+    #  Create an atom-eliminated error (messages are localized only when the error is presented).
+    err = _cm_error.DeferredError(
         _ml_error.MOLECULE_ELEMENT_ELIMINATED,
-        _l10n_reg.get_message(
-            lang_id,
-            "parser.molecule.error.element_eliminated.description"
-        ),
+        "parser.molecule.error.element_eliminated.description",
         options
     )
 
-    #  Initialize the error flag.
-    flag = False
-
-    for symbol in removed:
-        if symbol != "e":
-            #  Mark the flag.
-            flag = True
-
-            #  Add a description.
-            err.push_traceback(
-                expression,
-                node.get_starting_position_in_source_text(),
-                node.get_ending_position_in_source_text(),
-                _l10n_reg.get_message(
-                    lang_id,
-                    "parser.molecule.error.element_eliminated.message",
-                    replace_map={
-                        "$1": symbol
-                    }
-                )
-            )
+    for symbol in eliminated:
+        #  Add a description.
+        err.push_deferred_traceback(
+            expression,
+            node.get_starting_position_in_source_text(),
+            node.get_ending_position_in_source_text(),
+            "parser.molecule.error.element_eliminated.message",
+            replace_map={
+                "$1": symbol
+            }
+        )
 
-    #  Raise the error if the flag was marked.
-    if flag:
-        raise err
+    raise err
 
 
 def parse_ast(expression, root_node, options, mexp_protected_header_enabled=False, mexp_protected_header_prefix="X"):
@@ -201,7 +247,7 @@ def parse_ast(expression, root_node, options, mexp_protected_header_enabled=Fals
     lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
 
     #  Get the iteration order.
-    work_list = _ml_ast_bfs.do_bfs(root_node, True)
+    work_list = _ml_ast_traversal.iterate_reversed_bfs(root_node)
 
     #  Initialize the parsed node container.
     parsed = {}
@@ -367,11 +413,12 @@ def parse_ast(expression, root_node, options, mexp_protected_header_enabled=Fals
                 )
                 raise err
 
-            #  Get the abbreviation mapping.
-            abbr_mapping = molecule_opt.get_abbreviation_mapping()
+            #  Get the abbreviation expression.
+            abbr_table = molecule_opt.get_abbreviation_table()
+            abbr_expression = abbr_table.get_expression(abbr_symbol)
 
             #  Check the existence.
-            if abbr_symbol not in abbr_mapping:
+            if abbr_expression is None:
                 err = _cm_error.Error(
                     _ml_error.MOLECULE_UNSUPPORTED_ABBREVIATION,
                     _l10n_reg.get_message(
@@ -391,23 +438,39 @@ def parse_ast(expression, root_node, options, mexp_protected_header_enabled=Fals
                 )
                 raise err
 
-            abbr_expression = abbr_mapping[abbr_symbol]
+            #  Try to get the compiled atoms dictionary (MEXPs in the expression are evaluated in current mode).
+            abbr_evaluation_mode = _mexp_opt.OptionWrapper(options).get_evaluation_mode()
+            abbr_resolved = abbr_table.lookup(
+                abbr_symbol,
+                mexp_protected_header_enabled=mexp_protected_header_enabled,
+                mexp_protected_header_prefix=mexp_protected_header_prefix,
+                mexp_evaluation_mode=abbr_evaluation_mode
+            )
 
             try:
-                abbr_parser = if_opt.get_molecule_parser()
-                abbr_ast_root = abbr_parser.parse_expression(
-                    abbr_expression,
-                    options,
-                    mexp_protected_header_enabled=mexp_protected_header_enabled,
-                    mexp_protected_header_prefix=mexp_protected_header_prefix
-                )
-                abbr_resolved = abbr_parser.parse_ast(
-                    abbr_expression,
-                    abbr_ast_root,
-                    options,
-                    mexp_protected_header_enabled=mexp_protected_header_enabled,
-                    mexp_protected_header_prefix=mexp_protected_header_prefix
-                )
+                if abbr_resolved is None:
+                    #  Compile the abbreviation.
+                    abbr_parser = if_opt.get_molecule_parser()
+                    abbr_ast_root = abbr_parser.parse_expression(
+                        abbr_expression,
+                        options,
+                        mexp_protected_header_enabled=mexp_protected_header_enabled,
+                        mexp_protected_header_prefix=mexp_protected_header_prefix
+                    )
+                    abbr_resolved = abbr_parser.parse_ast(
+                        abbr_expression,
+                        abbr_ast_root,
+                        options,
+                        mexp_protected_header_enabled=mexp_protected_header_enabled,
+                        mexp_protected_header_prefix=mexp_protected_header_prefix
+                    )
+                    abbr_table.store(
+                        abbr_symbol,
+                        abbr_resolved,
+                        mexp_protected_header_enabled=mexp_protected_header_enabled,
+                        mexp_protected_header_prefix=mexp_protected_header_prefix,
+                        mexp_evaluation_mode=abbr_evaluation_mode
+                    )
             except _cm_error.Error as err:
                 err.push_traceback(
                     abbr_expression,
@@ -8,7 +8,7 @@
 import bce.math.constant as _math_constant
 import bce.parser.interface.printer as _interface_printer
 import bce.parser.ast.molecule as _ml_ast_base
-import bce.parser.molecule.ast_bfs as _ml_ast_bfs
+import bce.parser.molecule.ast_traversal as _ml_ast_traversal
 import bce.dom.mathml.all as _mathml
 
 
@@ -174,7 +174,7 @@ def print_ast(
     """
 
     #  Get the printing order.
-    work_order = _ml_ast_bfs.do_bfs(root_node, True)
+    work_order = _ml_ast_traversal.iterate_post_order(root_node)
 
     #  Initialize the printed result container.
     printed = {}
@@ -8,7 +8,7 @@
 import bce.math.constant as _math_cst
 import bce.parser.ast.molecule as _ml_ast_base
 import bce.parser.interface.printer as _interface_printer
-import bce.parser.molecule.ast_bfs as _ml_ast_bfs
+import bce.parser.molecule.ast_traversal as _ml_ast_traversal
 
 
 def _print_operand(operand_value, mexp_parser):
@@ -88,7 +88,7 @@ def print_ast(root_node, mexp_parser):
     """
 
     #  Get the printing order.
-    work_order = _ml_ast_bfs.do_bfs(root_node, True)
+    work_order = _ml_ast_traversal.iterate_post_order(root_node)
 
     #  Initialize the printing result container.
     printed = {}
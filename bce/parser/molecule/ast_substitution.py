@@ -7,7 +7,7 @@
 
 import bce.parser.ast.molecule as _ast_base
 import bce.parser.interface.molecule_parser as _ml_interface
-import bce.parser.molecule.ast_bfs as _ast_bfs
+import bce.parser.molecule.ast_traversal as _ast_traversal
 import sympy as _sympy
 
 _PROPERTY_KEY_SUBSTITUTION_ERROR_RAISED = "__bce.parser.molecule.ast_substitution_SubstitutionErrorRaised"
@@ -35,8 +35,8 @@ def substitute_ast(root_node, subst_map):
     :return: The root node of the new AST.
     """
 
-    #  Get the BFS order (from the leaves to the root).
-    work_order = _ast_bfs.do_bfs(root_node, True)
+    #  Get the reversed BFS order (from the leaves to the root).
+    work_order = _ast_traversal.iterate_reversed_bfs(root_node)
 
     #  Initialize the substituted data container.
     substituted = {}
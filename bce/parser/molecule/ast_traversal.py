@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.parser.ast.molecule as _ast_base
+
+
+def get_children(node):
+    """Get the children of an AST node.
+
+    :type node: bce.parser.ast.molecule._ASTNodeBaseML
+    :param node: The node.
+    :rtype : list[bce.parser.ast.molecule._ASTNodeBaseML]
+    :return: The children (in the order of the source text).
+    """
+
+    if node.is_hydrate_group() or node.is_molecule():
+        return [node[child_id] for child_id in range(0, len(node))]
+
+    if node.is_parenthesis():
+        assert isinstance(node, _ast_base.ASTNodeParenthesisWrapper)
+        return [node.get_inner_node()]
+
+    return []
+
+
+def iterate_pre_order(root_node):
+    """Iterate an AST from the root to the leaves (pre-order, depth-first).
+
+    Note:
+      [1] The children of a node are got before the node is yielded, so changing
+          the children links of yielded nodes doesn't affect the iteration.
+
+    :type root_node: bce.parser.ast.molecule._ASTNodeBaseML
+    :param root_node: The root node.
+    :rtype : collections.Iterable[bce.parser.ast.molecule._ASTNodeBaseML]
+    :return: An iterator over the nodes.
+    """
+
+    #  Initialize the stack.
+    stack = [root_node]
+
+    while len(stack) != 0:
+        work_node = stack.pop()
+        children = get_children(work_node)
+
+        yield work_node
+
+        #  Push the children (in reversed order, so that the first child would be popped first).
+        stack.extend(reversed(children))
+
+
+def iterate_post_order(root_node):
+    """Iterate an AST from the leaves to the root (post-order, depth-first).
+
+    Note:
+      [1] Each node is yielded after all of its children, so results of the
+          children are always ready when the node is processed.
+      [2] The children of a node are got before its children are yielded, so
+          changing the children links of yielded nodes doesn't affect the
+          iteration.
+
+    :type root_node: bce.parser.ast.molecule._ASTNodeBaseML
+    :param root_node: The root node.
+    :rtype : collections.Iterable[bce.parser.ast.molecule._ASTNodeBaseML]
+    :return: An iterator over the nodes.
+    """
+
+    #  Initialize the stack (each item is a tuple (node, whether the children of the node were pushed)).
+    stack = [(root_node, False)]
+
+    while len(stack) != 0:
+        work_node, expanded = stack.pop()
+
+        if expanded:
+            yield work_node
+        else:
+            #  Visit the node again after all its children.
+            stack.append((work_node, True))
+
+            #  Push the children (in reversed order, so that the first child would be popped first).
+            for child in reversed(get_children(work_node)):
+                stack.append((child, False))
+
+
+def iterate_reversed_bfs(root_node):
+    """Iterate an AST from the leaves to the root (in reversed BFS order).
+
+    Note:
+      [1] Each node is yielded after all of its children, and the order is the
+          same as the result of bce.parser.molecule.ast_bfs.do_bfs() with
+          reverse_order=True.
+          Consumers that may raise errors use this order, since it decides
+          which error is reported when a molecule has several errors.
+      [2] The order starts from the deepest level, so all levels are collected
+          before the first node is yielded. Each level is dropped once its
+          nodes were yielded.
+      [3] The children of all nodes are got before any node is yielded, so
+          changing the children links of yielded nodes doesn't affect the
+          iteration.
+
+    :type root_node: bce.parser.ast.molecule._ASTNodeBaseML
+    :param root_node: The root node.
+    :rtype : collections.Iterable[bce.parser.ast.molecule._ASTNodeBaseML]
+    :return: An iterator over the nodes.
+    """
+
+    #  Collect the levels (each level contains the children of the nodes in previous level, in order).
+    levels = [[root_node]]
+    while True:
+        next_level = []
+        for node in levels[-1]:
+            next_level.extend(get_children(node))
+
+        if len(next_level) == 0:
+            break
+
+        levels.append(next_level)
+
+    #  Yield the levels from the deepest one.
+    while len(levels) != 0:
+        level = levels.pop()
+        for node in reversed(level):
+            yield node
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.parser.ast.molecule as _ast_base
+import bce.parser.molecule.ast_traversal as _ml_ast_traversal
+import collections as _collections
+import threading as _threading
+
+#  Property key of the cache entry that an AST root node was cloned from.
+PROPERTY_KEY_CACHE_ENTRY = "ml_cache_entry"
+
+
+def clone_ast(root_node):
+    """Clone an AST.
+
+    Note:
+      [1] All nodes are cloned, while the property values (such as the prefix
+          numbers, which are immutable SymPy objects) are shared.
+
+    :type root_node: bce.parser.ast.molecule.ASTNodeHydrateGroup | bce.parser.ast.molecule.ASTNodeMolecule
+    :param root_node: The root node of the AST.
+    :rtype : bce.parser.ast.molecule.ASTNodeHydrateGroup | bce.parser.ast.molecule.ASTNodeMolecule
+    :return: The root node of the cloned AST.
+    """
+
+    #  Initialize the cloned nodes container.
+    cloned = {}
+
+    #  Clone nodes from the leaves to the root.
+    for work_node in _ml_ast_traversal.iterate_post_order(root_node):
+        #  Create the node.
+        if work_node.is_hydrate_group():
+            new_node = _ast_base.ASTNodeHydrateGroup()
+        elif work_node.is_molecule():
+            new_node = _ast_base.ASTNodeMolecule()
+        elif work_node.is_atom():
+            assert isinstance(work_node, _ast_base.ASTNodeAtom)
+            new_node = _ast_base.ASTNodeAtom(work_node.get_atom_symbol())
+        elif work_node.is_parenthesis():
+            assert isinstance(work_node, _ast_base.ASTNodeParenthesisWrapper)
+            new_node = _ast_base.ASTNodeParenthesisWrapper(None)
+        elif work_node.is_abbreviation():
+            assert isinstance(work_node, _ast_base.ASTNodeAbbreviation)
+            new_node = _ast_base.ASTNodeAbbreviation(work_node.get_abbreviation_symbol())
+        else:
+            raise RuntimeError("BUG: Unhandled AST node type.")
+
+        #  Copy the properties (except the cache entry mark).
+        for key in work_node.get_property_keys():
+            if key != PROPERTY_KEY_CACHE_ENTRY:
+                new_node.set_property(key, work_node.get_property(key))
+
+        #  Link the cloned children.
+        if work_node.is_hydrate_group() or work_node.is_molecule():
+            for child_id in range(0, len(work_node)):
+                child_node = cloned[id(work_node[child_id])]
+                child_node.set_parent_node(new_node)
+                new_node.append_child(child_node)
+        elif work_node.is_parenthesis():
+            inner_node = cloned[id(work_node.get_inner_node())]
+            inner_node.set_parent_node(new_node)
+            new_node.set_inner_node(inner_node)
+
+        cloned[id(work_node)] = new_node
+
+    return cloned[id(root_node)]
+
+
+class MoleculeCacheEntry:
+    """Cached parsing result of a molecule expression."""
+
+    def __init__(self, key, ast_root):
+        """Initialize the entry.
+
+        :type key: tuple
+        :type ast_root: bce.parser.ast.molecule.ASTNodeHydrateGroup | bce.parser.ast.molecule.ASTNodeMolecule
+        :param key: The key.
+        :param ast_root: The root node of the AST (the entry takes the ownership).
+        """
+
+        self.__key = key
+        self.__ast = ast_root
+        self.__atoms = {}
+
+    def get_key(self):
+        """Get the key.
+
+        :rtype : tuple
+        :return: The key.
+        """
+
+        return self.__key
+
+    def get_ast(self):
+        """Get a private copy of the AST.
+
+        :rtype : bce.parser.ast.molecule.ASTNodeHydrateGroup | bce.parser.ast.molecule.ASTNodeMolecule
+        :return: The root node of the copy.
+        """
+
+        ast_root = clone_ast(self.__ast)
+        ast_root.set_property(PROPERTY_KEY_CACHE_ENTRY, self)
+
+        return ast_root
+
+    def get_atoms_dictionary(self, prefix_number):
+        """Get the cached atoms dictionary.
+
+        :param prefix_number: The prefix number of the root node.
+        :rtype : dict | None
+        :return: A copy of the dictionary (None if not cached).
+        """
+
+        atoms = self.__atoms.get(prefix_number)
+        if atoms is None:
+            return None
+
+        return dict(atoms)
+
+    def set_atoms_dictionary(self, prefix_number, atoms):
+        """Set the cached atoms dictionary.
+
+        :type atoms: dict
+        :param prefix_number: The prefix number of the root node.
+        :param atoms: The atoms dictionary.
+        """
+
+        self.__atoms[prefix_number] = dict(atoms)
+
+
+class MoleculeCache:
+    """LRU cache of parsed molecule expressions.
+
+    Note:
+      [1] Each caller gets its own copy of the cached AST, so changing the AST
+          (e.g. the printers change the prefix number of the root node
+          temporarily) never affects the cache.
+      [2] The atoms dictionary is cached per prefix number of the root node.
+          Only the prefix number of the root node is expected to be changed
+          between parse_expression() and parse_ast().
+      [3] The cache is thread-safe.
+    """
+
+    def __init__(self, capacity=4096):
+        """Initialize the cache.
+
+        :type capacity: int
+        :param capacity: The maximum count of cached expressions.
+        """
+
+        if capacity < 1:
+            raise ValueError("Invalid capacity.")
+
+        self.__cap = capacity
+        self.__data = _collections.OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = _threading.Lock()
+
+    def __len__(self):
+        """Get the count of cached expressions.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return len(self.__data)
+
+    def get_capacity(self):
+        """Get the maximum count of cached expressions.
+
+        :rtype : int
+        :return: The capacity.
+        """
+
+        return self.__cap
+
+    def get_hit_count(self):
+        """Get the count of cache hits.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__hits
+
+    def get_miss_count(self):
+        """Get the count of cache misses.
+
+        :rtype : int
+        :return: The count.
+        """
+
+        return self.__misses
+
+    def clear(self):
+        """Remove all cached expressions and reset the counters."""
+
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def lookup(self, key):
+        """Look up a cache entry.
+
+        :type key: tuple
+        :param key: The key.
+        :rtype : MoleculeCacheEntry | None
+        :return: The entry (None if not found).
+        """
+
+        with self.__lock:
+            entry = self.__data.pop(key, None)
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            #  Mark the entry as the most recently used one.
+            self.__data[key] = entry
+            self.__hits += 1
+
+        return entry
+
+    def store(self, key, ast_root):
+        """Store the AST of an expression.
+
+        :type key: tuple
+        :type ast_root: bce.parser.ast.molecule.ASTNodeHydrateGroup | bce.parser.ast.molecule.ASTNodeMolecule
+        :param key: The key.
+        :param ast_root: The root node of the AST (will be cloned).
+        :rtype : MoleculeCacheEntry
+        :return: The new entry.
+        """
+
+        entry = MoleculeCacheEntry(key, clone_ast(ast_root))
+
+        with self.__lock:
+            self.__data.pop(key, None)
+            self.__data[key] = entry
+            while len(self.__data) > self.__cap:
+                self.__data.popitem(last=False)
+
+        return entry
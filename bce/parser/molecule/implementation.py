@@ -5,24 +5,75 @@
 #  found in the license.txt file.
 #
 
+import bce.instrumentation.probe as _inst_probe
+import bce.instrumentation.stage as _inst_stage
 import bce.parser.interface.molecule_parser as _ml_interface
+import bce.parser.interface.option as _interface_opt
 import bce.parser.interface.printer as _interface_printer
+import bce.parser.mexp.option as _mexp_opt
+import bce.parser.molecule.cache as _ml_cache
+import bce.parser.molecule.option as _ml_opt
 import bce.parser.molecule.token as _ml_token
 import bce.parser.molecule.ast_generator as _ml_ast_generator
 import bce.parser.molecule.ast_parser as _ml_ast_parser
-import bce.parser.molecule.ast_printer_mathml as _ml_ast_printer_mathml
 import bce.parser.molecule.ast_printer_text as _ml_ast_printer_text
 import bce.parser.molecule.ast_substitution as _ml_ast_substitution
 
 
+def _get_cache_key(expression, options, mexp_protected_header_enabled, mexp_protected_header_prefix):
+    """Get the cache key of an expression.
+
+    :type expression: str
+    :type options: bce.option.Option
+    :type mexp_protected_header_enabled: bool
+    :type mexp_protected_header_prefix: str
+    :param expression: The expression.
+    :param options: The options.
+    :param mexp_protected_header_enabled: Whether the MEXP protected headers are enabled.
+    :param mexp_protected_header_prefix: The prefix of the MEXP protected headers.
+    :rtype : tuple
+    :return: The key.
+    """
+
+    if_opt = _interface_opt.OptionWrapper(options)
+
+    return (
+        expression,
+        _ml_opt.OptionWrapper(options).get_abbreviation_mapping_version(),
+        mexp_protected_header_enabled,
+        mexp_protected_header_prefix if mexp_protected_header_enabled else None,
+        _mexp_opt.OptionWrapper(options).get_evaluation_mode(),
+        id(if_opt.get_mexp_parser()),
+        id(if_opt.get_molecule_parser())
+    )
+
+
 class MoleculeParserImplementation(_ml_interface.MoleculeParserInterface):
     """Implementation of molecule parser."""
 
-    def __init__(self):
-        """Initialize."""
+    def __init__(self, cache_capacity=4096):
+        """Initialize.
+
+        :type cache_capacity: int
+        :param cache_capacity: The capacity of the parsing cache (0 if the cache is to be disabled).
+        """
 
         _ml_interface.MoleculeParserInterface.__init__(self)
 
+        if cache_capacity > 0:
+            self.__cache = _ml_cache.MoleculeCache(cache_capacity)
+        else:
+            self.__cache = None
+
+    def get_cache(self):
+        """Get the parsing cache.
+
+        :rtype : bce.parser.molecule.cache.MoleculeCache | None
+        :return: The cache (None if the cache is disabled).
+        """
+
+        return self.__cache
+
     def parse_expression(
             self,
             expression,
@@ -44,16 +95,51 @@ class MoleculeParserImplementation(_ml_interface.MoleculeParserInterface):
         :return: The root node of the AST.
         """
 
+        #  Try to get the AST from the cache.
+        cache_key = None
+        if self.__cache is not None:
+            cache_key = _get_cache_key(
+                expression,
+                options,
+                mexp_protected_header_enabled,
+                mexp_protected_header_prefix
+            )
+            cache_entry = self.__cache.lookup(cache_key)
+            if cache_entry is not None:
+                return cache_entry.get_ast()
+
         #  Tokenize.
-        token_list = _ml_token.tokenize(
+        if _ml_opt.OptionWrapper(options).get_tokenizer() == _ml_opt.TOKENIZER_TABLE_DRIVEN:
+            tokenizer = _ml_token.tokenize_table_driven
+        else:
+            tokenizer = _ml_token.tokenize
+
+        token_list = _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_MOLECULE_TOKENIZE,
+            expression,
+            tokenizer,
             expression,
             options,
             mexp_protected_header_enabled=mexp_protected_header_enabled,
             mexp_protected_header_prefix=mexp_protected_header_prefix
         )
-        
+
         #  Generate the AST.
-        ast_root = _ml_ast_generator.generate_ast(expression, token_list, options)
+        ast_root = _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_MOLECULE_AST_GENERATE,
+            expression,
+            _ml_ast_generator.generate_ast,
+            expression,
+            token_list,
+            options
+        )
+
+        #  Save the AST to the cache.
+        if self.__cache is not None:
+            cache_entry = self.__cache.store(cache_key, ast_root)
+            ast_root.set_property(_ml_cache.PROPERTY_KEY_CACHE_ENTRY, cache_entry)
 
         return ast_root
 
@@ -81,7 +167,28 @@ class MoleculeParserImplementation(_ml_interface.MoleculeParserInterface):
         :return: The parsed element dictionary.
         """
 
-        return _ml_ast_parser.parse_ast(
+        #  Try to get the atoms dictionary from the cache entry that the AST was got from.
+        cache_entry = None
+        if self.__cache is not None:
+            cache_entry = ast_root.get_property(_ml_cache.PROPERTY_KEY_CACHE_ENTRY)
+            if cache_entry is not None and cache_entry.get_key() != _get_cache_key(
+                expression,
+                option,
+                mexp_protected_header_enabled,
+                mexp_protected_header_prefix
+            ):
+                cache_entry = None
+
+        if cache_entry is not None:
+            atoms = cache_entry.get_atoms_dictionary(ast_root.get_prefix_number())
+            if atoms is not None:
+                return atoms
+
+        atoms = _inst_probe.run_stage(
+            option,
+            _inst_stage.STAGE_MOLECULE_AST_FOLD,
+            expression,
+            _ml_ast_parser.parse_ast,
             expression,
             ast_root,
             option,
@@ -89,6 +196,12 @@ class MoleculeParserImplementation(_ml_interface.MoleculeParserInterface):
             mexp_protected_header_prefix=mexp_protected_header_prefix
         )
 
+        #  Save the atoms dictionary to the cache entry.
+        if cache_entry is not None:
+            cache_entry.set_atoms_dictionary(ast_root.get_prefix_number(), atoms)
+
+        return atoms
+
     def substitute(self, ast_root, substitute_map=None):
         """Substitute a ast_root.
 
@@ -135,6 +248,9 @@ class MoleculeParserImplementation(_ml_interface.MoleculeParserInterface):
                 mexp_parser
             )
         elif printer_type == _interface_printer.PRINTER_TYPE_MATHML:
+            #  Import the MathML printer on first use.
+            import bce.parser.molecule.ast_printer_mathml as _ml_ast_printer_mathml
+
             return _ml_ast_printer_mathml.print_ast(
                 ast_root,
                 mexp_parser,
@@ -5,20 +5,33 @@
 #  found in the license.txt file.
 #
 
+import bce.locale.registry as _l10n_reg
 import bce.parser.interface.option as _interface_opt
-import bce.parser.molecule.implementation as _ml_impl
 import bce.parser.molecule.l10n as _ml_l10n
 import bce.parser.molecule.option as _ml_opt
 
 
+def _create_parser():
+    """Create the molecule parser implementation.
+
+    :rtype : bce.parser.molecule.implementation.MoleculeParserImplementation
+    :return: The parser implementation.
+    """
+
+    #  Import the implementation on first use (it imports SymPy).
+    import bce.parser.molecule.implementation as _ml_impl
+
+    return _ml_impl.MoleculeParserImplementation()
+
+
 def initialize_module():
     """Initialize the module."""
 
     #  Initialize the global option.
     _ml_opt.initialize_global_option()
 
-    #  Setup the localization module.
-    _ml_l10n.setup_localization()
+    #  Setup the localization module (message trees are built on first use).
+    _l10n_reg.register_message_tree_loader(_ml_l10n.setup_localization)
 
     #  Register the parser implementation.
-    _interface_opt.register_default_molecule_parser(_ml_impl.MoleculeParserImplementation())
+    _interface_opt.register_default_molecule_parser(_interface_opt.LazyParserImplementation(_create_parser))
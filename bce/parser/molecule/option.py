@@ -6,9 +6,21 @@
 #
 
 import bce.option as _opt
+import bce.parser.molecule.abbreviation as _ml_abbreviation
+import itertools as _itertools
 
 #  Option keys.
 OPT_KEY_ABBREVIATION_MAPPING = "parser.molecule.abbreviation_mapping"
+OPT_KEY_ABBREVIATION_MAPPING_VERSION = "parser.molecule.abbreviation_mapping_version"
+OPT_KEY_ABBREVIATION_TABLE = "parser.molecule.abbreviation_table"
+OPT_KEY_TOKENIZER = "parser.molecule.tokenizer"
+
+#  Tokenizers.
+TOKENIZER_SCANNER = 0
+TOKENIZER_TABLE_DRIVEN = 1
+
+#  Version generator of abbreviation mappings.
+_abbreviation_mapping_versions = _itertools.count(1)
 
 
 class OptionWrapper:
@@ -26,23 +38,77 @@ class OptionWrapper:
     def get_abbreviation_mapping(self):
         """Get the abbreviation mapping.
 
+        Note:
+          [1] The mapping is shared by options (and snapshots), so a copy is
+              returned. Changing the copy doesn't change the options, call
+              set_abbreviation_mapping() with the changed copy instead.
+
         :rtype : dict[str, str]
-        :return: The mapping.
+        :return: A copy of the mapping.
         """
 
-        return self.__opt.get_option_value(OPT_KEY_ABBREVIATION_MAPPING)
+        return dict(self.__opt.get_option_value(OPT_KEY_ABBREVIATION_MAPPING))
 
     def set_abbreviation_mapping(self, mapping):
         """Set the abbreviation mapping.
 
+        Note:
+          [1] The mapping is copied, so changing it later doesn't change the
+              options (call this method again instead).
+          [2] Each call assigns a new version and a new compiled abbreviation
+              table to the mapping.
+
         :type mapping: dict[str, str]
         :param mapping: The mapping.
         """
 
+        mapping = dict(mapping)
         self.__opt.set_option_value(OPT_KEY_ABBREVIATION_MAPPING, mapping)
+        self.__opt.set_option_value(OPT_KEY_ABBREVIATION_MAPPING_VERSION, next(_abbreviation_mapping_versions))
+        self.__opt.set_option_value(OPT_KEY_ABBREVIATION_TABLE, _ml_abbreviation.AbbreviationTable(mapping))
+
+    def get_abbreviation_mapping_version(self):
+        """Get the version of the abbreviation mapping.
+
+        :rtype : int
+        :return: The version.
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_ABBREVIATION_MAPPING_VERSION)
+
+    def get_abbreviation_table(self):
+        """Get the compiled abbreviation table.
+
+        :rtype : bce.parser.molecule.abbreviation.AbbreviationTable
+        :return: The table.
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_ABBREVIATION_TABLE)
+
+    def get_tokenizer(self):
+        """Get the tokenizer.
+
+        :rtype : int
+        :return: The tokenizer (one of TOKENIZER_* constants).
+        """
+
+        return self.__opt.get_option_value(OPT_KEY_TOKENIZER)
+
+    def set_tokenizer(self, tokenizer):
+        """Set the tokenizer.
+
+        :type tokenizer: int
+        :param tokenizer: The tokenizer (one of TOKENIZER_* constants).
+        """
+
+        self.__opt.set_option_value(OPT_KEY_TOKENIZER, tokenizer)
 
 
 def initialize_global_option():
     """Initialize global options."""
 
-    _opt.register_option_pair(OPT_KEY_ABBREVIATION_MAPPING, {})
+    default_mapping = {}
+    _opt.register_option_pair(OPT_KEY_ABBREVIATION_MAPPING, default_mapping)
+    _opt.register_option_pair(OPT_KEY_ABBREVIATION_MAPPING_VERSION, 0)
+    _opt.register_option_pair(OPT_KEY_ABBREVIATION_TABLE, _ml_abbreviation.AbbreviationTable(default_mapping))
+    _opt.register_option_pair(OPT_KEY_TOKENIZER, TOKENIZER_SCANNER)
@@ -11,6 +11,7 @@ import bce.parser.common.token as _cm_token
 import bce.parser.common.error as _cm_error
 import bce.parser.interface.option as _interface_opt
 import bce.parser.molecule.error as _ml_error
+import re as _re
 import sympy as _sympy
 
 #  Token types.
@@ -564,6 +565,229 @@ def create_negative_electronic_flag_token(idx=-1, pos=-1):
     return Token("e-", TOKEN_TYPE_ELECTRONIC, TOKEN_SUBTYPE_EL_FLAG_NEGATIVE, idx, pos)
 
 
+def _raise_abbreviation_mismatch(expression, cur_pos, options):
+    """Raise an error for an abbreviation that has no ']'.
+
+    :type expression: str
+    :type cur_pos: int
+    :type options: bce.option.Option
+    :param expression: The expression.
+    :param cur_pos: The position of the '['.
+    :param options: The options.
+    :raise bce.parser.common.error.Error: Always raise.
+    """
+
+    lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
+
+    err = _cm_error.Error(
+        _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
+        _l10n_reg.get_message(
+            lang_id,
+            "parser.molecule.error.parenthesis_mismatch.description"
+        ),
+        options
+    )
+    err.push_traceback(
+        expression,
+        cur_pos,
+        cur_pos,
+        _l10n_reg.get_message(
+            lang_id,
+            "parser.molecule.error.parenthesis_mismatch.right"
+        )
+    )
+    raise err
+
+
+def _raise_unrecognized_token(expression, cur_pos, options):
+    """Raise an error for a character that can't be tokenized.
+
+    :type expression: str
+    :type cur_pos: int
+    :type options: bce.option.Option
+    :param expression: The expression.
+    :param cur_pos: The position of the character.
+    :param options: The options.
+    :raise bce.parser.common.error.Error: Always raise.
+    """
+
+    lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
+
+    err = _cm_error.Error(
+        _ml_error.MOLECULE_UNRECOGNIZED_TOKEN,
+        _l10n_reg.get_message(
+            lang_id,
+            "parser.molecule.error.unrecognized_token.description"
+        ),
+        options
+    )
+    err.push_traceback(
+        expression,
+        cur_pos,
+        cur_pos,
+        _l10n_reg.get_message(
+            lang_id,
+            "parser.molecule.error.unrecognized_token.message"
+        )
+    )
+    raise err
+
+
+def _read_mexp_operand_token(
+        expression,
+        cur_pos,
+        token_id,
+        options,
+        mexp_protected_header_enabled=False,
+        mexp_protected_header_prefix="X"
+):
+    """Read a math expression operand token (starts with '{').
+
+    :type expression: str
+    :type cur_pos: int
+    :type token_id: int
+    :type options: bce.option.Option
+    :type mexp_protected_header_enabled: bool
+    :type mexp_protected_header_prefix: str
+    :param expression: The expression.
+    :param cur_pos: The position of the '{'.
+    :param token_id: The index of the token.
+    :param options: The options.
+    :param mexp_protected_header_enabled: Whether the MEXP protected headers are enabled.
+    :param mexp_protected_header_prefix: The prefix of the MEXP protected headers.
+    :rtype : (Token, int)
+    :return: A tuple (token, next position).
+    :raise bce.parser.common.error.Error: Raise when a parser error occurred.
+    """
+
+    #  Initialize.
+    lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
+    if_opt = _interface_opt.OptionWrapper(options)
+    end_pos = len(expression)
+
+    #  Simulate a parenthesis stack to find the end '}'.
+    p_mexp = 0
+
+    #  Searching the end '}'.
+    search_end = -1
+    search_pos = cur_pos + 1
+
+    while search_pos < end_pos:
+        search_ch = expression[search_pos]
+
+        if search_ch == "(" or search_ch == "[" or search_ch == "{":
+            #  If current character is a left parenthesis, push it onto the stack.
+            p_mexp += 1
+        elif search_ch == ")" or search_ch == "]" or search_ch == "}":
+            #  When we meet a right parenthesis and there's no left parenthesis in the stack.
+            #  The parenthesis we met should be the end '}'.
+            if p_mexp == 0:
+                #  Raise an error if the parenthesis isn't '}'.
+                if search_ch != "}":
+                    err = _cm_error.Error(
+                        _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
+                        _l10n_reg.get_message(
+                            lang_id,
+                            "parser.molecule.error.parenthesis_mismatch.description"
+                        ),
+                        options
+                    )
+                    err.push_traceback(
+                        expression,
+                        search_pos,
+                        search_pos,
+                        _l10n_reg.get_message(
+                            lang_id,
+                            "parser.molecule.error.parenthesis_mismatch.incorrect",
+                            replace_map={
+                                "$1": "}"
+                            }
+                        )
+                    )
+                    raise err
+
+                #  Set the end position.
+                search_end = search_pos + 1
+
+                break
+
+            #  Pop the parenthesis off from the stack.
+            p_mexp -= 1
+        else:
+            pass
+
+        #  Go to next searching position.
+        search_pos += 1
+
+    #  Raise an error if we can't find the end '}'.
+    if search_end == -1:
+        err = _cm_error.Error(
+            _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
+            _l10n_reg.get_message(
+                lang_id,
+                "parser.molecule.error.parenthesis_mismatch.description"
+            ),
+            options
+        )
+        err.push_traceback(
+            expression,
+            cur_pos,
+            cur_pos,
+            _l10n_reg.get_message(
+                lang_id,
+                "parser.molecule.error.parenthesis_mismatch.right"
+            )
+        )
+        raise err
+
+    #  Raise an error if the math expression has no content.
+    if cur_pos + 2 == search_end:
+        err = _cm_error.Error(
+            _ml_error.MOLECULE_NO_CONTENT,
+            _l10n_reg.get_message(
+                lang_id,
+                "parser.molecule.error.no_content.description"
+            ),
+            options
+        )
+        err.push_traceback(
+            expression,
+            cur_pos,
+            cur_pos + 1,
+            _l10n_reg.get_message(
+                lang_id,
+                "parser.molecule.error.no_content.inside"
+            )
+        )
+        raise err
+
+    #  Get the expression.
+    mexp_expr = expression[cur_pos:search_end]
+
+    #  Evaluate the expression.
+    try:
+        ev_value = if_opt.get_mexp_parser().parse(
+            mexp_expr,
+            options,
+            protected_header_enabled=mexp_protected_header_enabled,
+            protected_header_prefix=mexp_protected_header_prefix
+        )
+    except _cm_error.Error as err:
+        err.push_traceback(
+            expression,
+            cur_pos,
+            search_end - 1,
+            _l10n_reg.get_message(
+                lang_id,
+                "parser.molecule.error.parsing_mexp.message"
+            )
+        )
+        raise err
+
+    #  Create a math expression token.
+    return create_mexp_operand_token(mexp_expr, ev_value, token_id, cur_pos), search_end
+
+
 def tokenize(expression, options, mexp_protected_header_enabled=False, mexp_protected_header_prefix="X"):
     """Tokenize a molecule expression.
 
@@ -581,8 +805,6 @@ def tokenize(expression, options, mexp_protected_header_enabled=False, mexp_prot
     """
 
     #  Initialize.
-    lang_id = _l10n_opt.OptionWrapper(options).get_language_id()
-    if_opt = _interface_opt.OptionWrapper(options)
     result = []
     cur_pos = 0
     end_pos = len(expression)
@@ -718,24 +940,7 @@ def tokenize(expression, options, mexp_protected_header_enabled=False, mexp_prot
 
             #  Raise an error if we can't find the ']'.
             if search_end == -1:
-                err = _cm_error.Error(
-                    _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.parenthesis_mismatch.description"
-                    ),
-                    options
-                )
-                err.push_traceback(
-                    expression,
-                    cur_pos,
-                    cur_pos,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.parenthesis_mismatch.right"
-                    )
-                )
-                raise err
+                _raise_abbreviation_mismatch(expression, cur_pos, options)
 
             #  Create an abbreviation token.
             result.append(create_abbreviation_token(expression[cur_pos:search_end], len(result), cur_pos))
@@ -747,130 +952,15 @@ def tokenize(expression, options, mexp_protected_header_enabled=False, mexp_prot
 
         #  Read a math expression if current character is '{'.
         if cur_ch == "{":
-            #  Simulate a parenthesis stack to find the end '}'.
-            p_mexp = 0
-
-            #  Searching the end '}'.
-            search_end = -1
-            search_pos = cur_pos + 1
-
-            while search_pos < end_pos:
-                search_ch = expression[search_pos]
-
-                if search_ch == "(" or search_ch == "[" or search_ch == "{":
-                    #  If current character is a left parenthesis, push it onto the stack.
-                    p_mexp += 1
-                elif search_ch == ")" or search_ch == "]" or search_ch == "}":
-                    #  When we meet a right parenthesis and there's no left parenthesis in the stack.
-                    #  The parenthesis we met should be the end '}'.
-                    if p_mexp == 0:
-                        #  Raise an error if the parenthesis isn't '}'.
-                        if search_ch != "}":
-                            err = _cm_error.Error(
-                                _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
-                                _l10n_reg.get_message(
-                                    lang_id,
-                                    "parser.molecule.error.parenthesis_mismatch.description"
-                                ),
-                                options
-                            )
-                            err.push_traceback(
-                                expression,
-                                search_pos,
-                                search_pos,
-                                _l10n_reg.get_message(
-                                    lang_id,
-                                    "parser.molecule.error.parenthesis_mismatch.incorrect",
-                                    replace_map={
-                                        "$1": "}"
-                                    }
-                                )
-                            )
-                            raise err
-
-                        #  Set the end position.
-                        search_end = search_pos + 1
-
-                        break
-
-                    #  Pop the parenthesis off from the stack.
-                    p_mexp -= 1
-                else:
-                    pass
-
-                #  Go to next searching position.
-                search_pos += 1
-
-            #  Raise an error if we can't find the end '}'.
-            if search_end == -1:
-                err = _cm_error.Error(
-                    _ml_error.MOLECULE_PARENTHESIS_MISMATCH,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.parenthesis_mismatch.description"
-                    ),
-                    options
-                )
-                err.push_traceback(
-                    expression,
-                    cur_pos,
-                    cur_pos,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.parenthesis_mismatch.right"
-                    )
-                )
-                raise err
-
-            #  Raise an error if the math expression has no content.
-            if cur_pos + 2 == search_end:
-                err = _cm_error.Error(
-                    _ml_error.MOLECULE_NO_CONTENT,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.no_content.description"
-                    ),
-                    options
-                )
-                err.push_traceback(
-                    expression,
-                    cur_pos,
-                    cur_pos + 1,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.no_content.inside"
-                    )
-                )
-                raise err
-
-            #  Get the expression.
-            mexp_expr = expression[cur_pos:search_end]
-
-            #  Evaluate the expression.
-            try:
-                ev_value = if_opt.get_mexp_parser().parse(
-                    mexp_expr,
-                    options,
-                    protected_header_enabled=mexp_protected_header_enabled,
-                    protected_header_prefix=mexp_protected_header_prefix
-                )
-            except _cm_error.Error as err:
-                err.push_traceback(
-                    expression,
-                    cur_pos,
-                    search_end - 1,
-                    _l10n_reg.get_message(
-                        lang_id,
-                        "parser.molecule.error.parsing_mexp.message"
-                    )
-                )
-                raise err
-
-            #  Create a math expression token.
-            result.append(create_mexp_operand_token(mexp_expr, ev_value, len(result), cur_pos))
-
-            #  Go to next position.
-            cur_pos = search_end
+            token, cur_pos = _read_mexp_operand_token(
+                expression,
+                cur_pos,
+                len(result),
+                options,
+                mexp_protected_header_enabled=mexp_protected_header_enabled,
+                mexp_protected_header_prefix=mexp_protected_header_prefix
+            )
+            result.append(token)
 
             continue
 
@@ -911,24 +1001,124 @@ def tokenize(expression, options, mexp_protected_header_enabled=False, mexp_prot
             continue
 
         #  Raise an error if current character can't be tokenized.
-        err = _cm_error.Error(
-            _ml_error.MOLECULE_UNRECOGNIZED_TOKEN,
-            _l10n_reg.get_message(
-                lang_id,
-                "parser.molecule.error.unrecognized_token.description"
-            ),
-            options
-        )
-        err.push_traceback(
-            expression,
-            cur_pos,
-            cur_pos,
-            _l10n_reg.get_message(
-                lang_id,
-                "parser.molecule.error.unrecognized_token.message"
+        _raise_unrecognized_token(expression, cur_pos, options)
+
+    #  Add an end token.
+    result.append(create_end_token(len(result), len(expression)))
+
+    return result
+
+
+#  Master pattern of the table-driven tokenizer (one group for each kind of token).
+_MASTER_PATTERN = _re.compile(
+    r"([0-9]+)|"
+    r"([A-Z][a-z]*)|"
+    r"(\.)|"
+    r"(\(g\))|"
+    r"(\(l\))|"
+    r"(\(s\))|"
+    r"(\(aq\))|"
+    r"(\()|"
+    r"(\))|"
+    r"(\[[^\]]*\])|"
+    r"(<)|"
+    r"(>)|"
+    r"(e\+)|"
+    r"(e-)"
+)
+
+#  Token types of the groups in the master pattern (a tuple (type, sub-type)).
+#  (The symbol of each token is exactly the matched text.)
+_MASTER_PATTERN_TOKEN_TYPES = [
+    None,
+    (TOKEN_TYPE_OPERAND, TOKEN_SUBTYPE_INTEGER),
+    (TOKEN_TYPE_SYMBOL, None),
+    (TOKEN_TYPE_HYDRATE_DOT, None),
+    (TOKEN_TYPE_STATUS, TOKEN_SUBTYPE_GAS),
+    (TOKEN_TYPE_STATUS, TOKEN_SUBTYPE_LIQUID),
+    (TOKEN_TYPE_STATUS, TOKEN_SUBTYPE_SOLID),
+    (TOKEN_TYPE_STATUS, TOKEN_SUBTYPE_AQUEOUS),
+    (TOKEN_TYPE_PARENTHESIS, TOKEN_SUBTYPE_PARENTHESIS_LEFT),
+    (TOKEN_TYPE_PARENTHESIS, TOKEN_SUBTYPE_PARENTHESIS_RIGHT),
+    (TOKEN_TYPE_ABBREVIATION, None),
+    (TOKEN_TYPE_ELECTRONIC, TOKEN_SUBTYPE_EL_BEGIN),
+    (TOKEN_TYPE_ELECTRONIC, TOKEN_SUBTYPE_EL_END),
+    (TOKEN_TYPE_ELECTRONIC, TOKEN_SUBTYPE_EL_FLAG_POSITIVE),
+    (TOKEN_TYPE_ELECTRONIC, TOKEN_SUBTYPE_EL_FLAG_NEGATIVE)
+]
+
+
+def tokenize_table_driven(expression, options, mexp_protected_header_enabled=False, mexp_protected_header_prefix="X"):
+    """Tokenize a molecule expression with the master pattern.
+
+    Note:
+      [1] This tokenizer produces the same tokens (and the same errors) as
+          tokenize().
+      [2] If a non-ASCII character that isn't matched by the master pattern is
+          met, the whole expression is passed to tokenize() since str.isdigit(),
+          str.isupper() and str.islower() also accept some non-ASCII characters.
+
+    :type expression: str
+    :type options: bce.option.Option
+    :type mexp_protected_header_enabled: bool
+    :type mexp_protected_header_prefix: str
+    :param expression: The expression.
+    :param options: The options.
+    :param mexp_protected_header_enabled: Whether the MEXP protected headers are enabled.
+    :param mexp_protected_header_prefix: The prefix of the MEXP protected headers.
+    :rtype : list[Token]
+    :return: The token list.
+    :raise bce.parser.common.error.Error: Raise when a parser error occurred.
+    """
+
+    #  Initialize.
+    result = []
+    cur_pos = 0
+    end_pos = len(expression)
+
+    while cur_pos < end_pos:
+        #  Read tokens until a character that isn't matched by the master pattern.
+        for match in _MASTER_PATTERN.finditer(expression, cur_pos):
+            if match.start() != cur_pos:
+                break
+
+            #  Create the token.
+            token_type, token_subtype = _MASTER_PATTERN_TOKEN_TYPES[match.lastindex]
+            result.append(Token(match.group(), token_type, token_subtype, len(result), cur_pos))
+
+            #  Go to next position.
+            cur_pos = match.end()
+
+        if cur_pos >= end_pos:
+            break
+
+        cur_ch = expression[cur_pos]
+
+        if ord(cur_ch) > 127:
+            #  Fall back to the character scanner.
+            return tokenize(
+                expression,
+                options,
+                mexp_protected_header_enabled=mexp_protected_header_enabled,
+                mexp_protected_header_prefix=mexp_protected_header_prefix
             )
-        )
-        raise err
+
+        if cur_ch == "{":
+            #  Read a math expression.
+            token, cur_pos = _read_mexp_operand_token(
+                expression,
+                cur_pos,
+                len(result),
+                options,
+                mexp_protected_header_enabled=mexp_protected_header_enabled,
+                mexp_protected_header_prefix=mexp_protected_header_prefix
+            )
+            result.append(token)
+        elif cur_ch == "[":
+            #  The ']' can't be found.
+            _raise_abbreviation_mismatch(expression, cur_pos, options)
+        else:
+            _raise_unrecognized_token(expression, cur_pos, options)
 
     #  Add an end token.
     result.append(create_end_token(len(result), len(expression)))
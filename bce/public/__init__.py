@@ -4,3 +4,40 @@
 #  Use of this source code is governed by a BSD-style license that can be
 #  found in the license.txt file.
 #
+
+import bce.utils.compatible as _utils_compatible
+import importlib as _importlib
+
+#  Modules that are imported on first access (see __getattr__()).
+_LAZY_MODULES = frozenset([
+    "api",
+    "cache",
+    "database",
+    "exception",
+    "instrumentation",
+    "option",
+    "printer",
+    "result",
+    "solver"
+])
+
+
+def __getattr__(name):
+    """Import a module on first access (PEP 562, Python 3.7+).
+
+    :type name: str
+    :param name: The attribute name.
+    :return: The module.
+    :raise AttributeError: Raise this exception if there is no such module.
+    """
+
+    if name in _LAZY_MODULES:
+        return _importlib.import_module("bce.public." + name)
+
+    raise AttributeError("module 'bce.public' has no attribute '%s'" % name)
+
+
+#  Import all modules eagerly on old Python runtimes (without PEP 562).
+if not _utils_compatible.is_module_getattr_supported():
+    for _module_name in sorted(_LAZY_MODULES):
+        _importlib.import_module("bce.public." + _module_name)
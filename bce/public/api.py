@@ -5,6 +5,8 @@
 #  found in the license.txt file.
 #
 
+import bce.instrumentation.probe as _inst_probe
+import bce.instrumentation.stage as _inst_stage
 import bce.logic.balancer.main as _lgc_bce_main
 import bce.logic.common.error as _lgc_cm_error
 import bce.parser.common.error as _ps_cm_error
@@ -13,9 +15,16 @@ import bce.parser.interface.option as _interface_opt
 import bce.parser.interface.printer as _interface_printer
 import bce.public.exception as _pub_exception
 import bce.public.printer as _pub_printer
+import bce.public.result as _pub_result
 import bce.utils.input_checker as _util_input_chk
+import itertools as _itertools
+import multiprocessing as _multiprocessing
+import timeit as _timeit
 import types as _types
 
+#  The context of parallel balancing workers (only available in worker processes).
+_PARALLEL_WORKER_CONTEXT = None
+
 
 def _print_cexp(
         cexp_object,
@@ -77,25 +86,34 @@ def _print_cexp(
     return everything
 
 
-def balance_chemical_equation(
+def _balance_chemical_equation_stages(
         expression,
         options,
+        cexp_parser,
+        molecule_parser,
+        mexp_parser,
         printer=_pub_printer.PRINTER_TEXT,
         unknown_header="X",
         callback_before_balance=None,
         callback_after_balance=None,
         callback_context=None
 ):
-    """Balance a chemical equation.
+    """Run the stages of balancing a chemical equation with resolved parsers.
 
     :type expression: str
     :type options: bce.option.Option
+    :type cexp_parser: bce.parser.interface.cexp_parser.ChemicalEquationParserInterface
+    :type molecule_parser: bce.parser.interface.molecule_parser.MoleculeParserInterface
+    :type mexp_parser: bce.parser.interface.mexp_parser.MathExpressionParserInterface
     :type printer: int
     :type unknown_header: str
     :type callback_before_balance: types.FunctionType | None
     :type callback_after_balance: types.FunctionType | None
     :param expression: The chemical equation.
     :param options: The options.
+    :param cexp_parser: The CEXP parser.
+    :param molecule_parser: The molecule parser.
+    :param mexp_parser: The MEXP parser.
     :param printer: The printer ID.
     :param unknown_header: The header of unknowns.
     :param callback_before_balance: Callback that will be called before balancing.
@@ -109,12 +127,6 @@ def balance_chemical_equation(
     if not _util_input_chk.check_input_expression_characters(expression):
         raise _pub_exception.InvalidCharacterException("Invalid character.")
 
-    #  Wrap the parser interface options.
-    if_opt = _interface_opt.OptionWrapper(options)
-
-    #  Get the CEXP parser.
-    cexp_parser = if_opt.get_cexp_parser()
-
     try:
         #  Parse the chemical equation.
         cexp_object = cexp_parser.parse(
@@ -140,18 +152,354 @@ def balance_chemical_equation(
             callback_after_balance(callback_context, cexp_object)
 
         #  Print.
-        return _print_cexp(
+        return _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_PRINT,
+            expression,
+            _print_cexp,
             cexp_object,
-            if_opt.get_cexp_parser(),
-            if_opt.get_molecule_parser(),
-            if_opt.get_mexp_parser(),
+            cexp_parser,
+            molecule_parser,
+            mexp_parser,
             printer=printer,
             unknown_header=unknown_header
         )
     except _ps_cm_error.Error as err:
-        raise _pub_exception.ParserErrorWrapper(err.to_string())
+        raise _pub_exception.ParserErrorWrapper(err.to_string(), error_code=err.get_error_code())
     except _lgc_cm_error.Error as err:
-        raise _pub_exception.LogicErrorWrapper(err.to_string())
+        raise _pub_exception.LogicErrorWrapper(err.to_string(), error_code=err.get_error_code())
+
+
+def _balance_chemical_equation(
+        expression,
+        options,
+        cexp_parser,
+        molecule_parser,
+        mexp_parser,
+        printer=_pub_printer.PRINTER_TEXT,
+        unknown_header="X",
+        callback_before_balance=None,
+        callback_after_balance=None,
+        callback_context=None
+):
+    """Balance a chemical equation with resolved parsers.
+
+    :type expression: str
+    :type options: bce.option.Option
+    :type cexp_parser: bce.parser.interface.cexp_parser.ChemicalEquationParserInterface
+    :type molecule_parser: bce.parser.interface.molecule_parser.MoleculeParserInterface
+    :type mexp_parser: bce.parser.interface.mexp_parser.MathExpressionParserInterface
+    :type printer: int
+    :type unknown_header: str
+    :type callback_before_balance: types.FunctionType | None
+    :type callback_after_balance: types.FunctionType | None
+    :param expression: The chemical equation.
+    :param options: The options.
+    :param cexp_parser: The CEXP parser.
+    :param molecule_parser: The molecule parser.
+    :param mexp_parser: The MEXP parser.
+    :param printer: The printer ID.
+    :param unknown_header: The header of unknowns.
+    :param callback_before_balance: Callback that will be called before balancing.
+    :param callback_after_balance: Callback that will be called after balancing.
+    :param callback_context: The callback context.
+    :rtype: str | dict[str, str]
+    :return: The balanced chemical equation.
+    """
+
+    return _inst_probe.run_stage(
+        options,
+        _inst_stage.STAGE_BALANCE,
+        expression,
+        _balance_chemical_equation_stages,
+        expression,
+        options,
+        cexp_parser,
+        molecule_parser,
+        mexp_parser,
+        printer=printer,
+        unknown_header=unknown_header,
+        callback_before_balance=callback_before_balance,
+        callback_after_balance=callback_after_balance,
+        callback_context=callback_context
+    )
+
+
+def balance_chemical_equation(
+        expression,
+        options,
+        printer=_pub_printer.PRINTER_TEXT,
+        unknown_header="X",
+        callback_before_balance=None,
+        callback_after_balance=None,
+        callback_context=None
+):
+    """Balance a chemical equation.
+
+    :type expression: str
+    :type options: bce.option.Option
+    :type printer: int
+    :type unknown_header: str
+    :type callback_before_balance: types.FunctionType | None
+    :type callback_after_balance: types.FunctionType | None
+    :param expression: The chemical equation.
+    :param options: The options.
+    :param printer: The printer ID.
+    :param unknown_header: The header of unknowns.
+    :param callback_before_balance: Callback that will be called before balancing.
+    :param callback_after_balance: Callback that will be called after balancing.
+    :param callback_context: The callback context.
+    :rtype: str | dict[str, str]
+    :return: The balanced chemical equation.
+    """
+
+    #  Wrap the parser interface options.
+    if_opt = _interface_opt.OptionWrapper(options)
+
+    return _balance_chemical_equation(
+        expression,
+        options,
+        if_opt.get_cexp_parser(),
+        if_opt.get_molecule_parser(),
+        if_opt.get_mexp_parser(),
+        printer=printer,
+        unknown_header=unknown_header,
+        callback_before_balance=callback_before_balance,
+        callback_after_balance=callback_after_balance,
+        callback_context=callback_context
+    )
+
+
+def balance_chemical_equations(
+        expressions,
+        options,
+        printer=_pub_printer.PRINTER_TEXT,
+        unknown_header="X",
+        callback_before_balance=None,
+        callback_after_balance=None,
+        callback_context=None
+):
+    """Balance a batch of chemical equations.
+
+    Note:
+      [1] The parsers are resolved from the options only once, so the options
+          shouldn't be changed until the batch is done.
+      [2] Errors are not raised. Instead, they are saved in the result of
+          each chemical equation.
+
+    :type expressions: collections.Iterable[str]
+    :type options: bce.option.Option
+    :type printer: int
+    :type unknown_header: str
+    :type callback_before_balance: types.FunctionType | None
+    :type callback_after_balance: types.FunctionType | None
+    :param expressions: The chemical equations.
+    :param options: The options.
+    :param printer: The printer ID.
+    :param unknown_header: The header of unknowns.
+    :param callback_before_balance: Callback that will be called before balancing.
+    :param callback_after_balance: Callback that will be called after balancing.
+    :param callback_context: The callback context.
+    :rtype : collections.Iterator[bce.public.result.BalanceResult]
+    :return: A generator that yields the result of each chemical equation (in input order).
+    """
+
+    #  Resolve the parsers.
+    if_opt = _interface_opt.OptionWrapper(options)
+    cexp_parser = if_opt.get_cexp_parser()
+    molecule_parser = if_opt.get_molecule_parser()
+    mexp_parser = if_opt.get_mexp_parser()
+
+    index = 0
+    for expression in expressions:
+        #  Initialize.
+        result = None
+        error = None
+
+        #  Balance.
+        time_begin = _timeit.default_timer()
+        try:
+            result = _balance_chemical_equation(
+                expression,
+                options,
+                cexp_parser,
+                molecule_parser,
+                mexp_parser,
+                printer=printer,
+                unknown_header=unknown_header,
+                callback_before_balance=callback_before_balance,
+                callback_after_balance=callback_after_balance,
+                callback_context=callback_context
+            )
+        except (
+            _pub_exception.InvalidCharacterException,
+            _pub_exception.ParserErrorWrapper,
+            _pub_exception.LogicErrorWrapper
+        ) as err:
+            error = err
+        time_end = _timeit.default_timer()
+
+        yield _pub_result.BalanceResult(
+            index,
+            expression,
+            result=result,
+            error=error,
+            elapsed_time=time_end - time_begin
+        )
+
+        index += 1
+
+
+def _parallel_worker_initialize(options, printer, unknown_header):
+    """Initialize a parallel balancing worker process.
+
+    :type options: bce.option.Option
+    :type printer: int
+    :type unknown_header: str
+    :param options: The options.
+    :param printer: The printer ID.
+    :param unknown_header: The header of unknowns.
+    """
+
+    global _PARALLEL_WORKER_CONTEXT
+
+    #  Resolve the parsers once for the whole life of the worker.
+    if_opt = _interface_opt.OptionWrapper(options)
+    _PARALLEL_WORKER_CONTEXT = (
+        options,
+        if_opt.get_cexp_parser(),
+        if_opt.get_molecule_parser(),
+        if_opt.get_mexp_parser(),
+        printer,
+        unknown_header
+    )
+
+
+def _parallel_worker_balance(expression):
+    """Balance a chemical equation in a parallel balancing worker process.
+
+    :type expression: str
+    :param expression: The chemical equation.
+    :rtype : (str | dict[str, str] | None, Exception | None, float)
+    :return: A tuple (result, error, elapsed time).
+    """
+
+    options, cexp_parser, molecule_parser, mexp_parser, printer, unknown_header = _PARALLEL_WORKER_CONTEXT
+
+    #  Initialize.
+    result = None
+    error = None
+
+    #  Balance.
+    time_begin = _timeit.default_timer()
+    try:
+        result = _balance_chemical_equation(
+            expression,
+            options,
+            cexp_parser,
+            molecule_parser,
+            mexp_parser,
+            printer=printer,
+            unknown_header=unknown_header
+        )
+    except (
+        _pub_exception.InvalidCharacterException,
+        _pub_exception.ParserErrorWrapper,
+        _pub_exception.LogicErrorWrapper
+    ) as err:
+        error = err
+    time_end = _timeit.default_timer()
+
+    return result, error, time_end - time_begin
+
+
+def balance_chemical_equations_parallel(
+        expressions,
+        options,
+        printer=_pub_printer.PRINTER_TEXT,
+        unknown_header="X",
+        worker_count=None,
+        chunk_size=16
+):
+    """Balance a batch of chemical equations with a pool of worker processes.
+
+    Note:
+      [1] Each worker process initializes its parsers once and balances many
+          chemical equations, so the start-up cost is paid only once per worker.
+      [2] The chemical equations are read from |expressions| window by window,
+          so the input never has to be loaded fully into memory. The next
+          window is submitted before the results of current window are
+          yielded, so the workers don't idle at window boundaries (and at most
+          two windows are kept in memory).
+      [3] Callbacks are not supported since they can't be sent to the workers.
+
+    :type expressions: collections.Iterable[str]
+    :type options: bce.option.Option
+    :type printer: int
+    :type unknown_header: str
+    :type worker_count: int | None
+    :type chunk_size: int
+    :param expressions: The chemical equations.
+    :param options: The options.
+    :param printer: The printer ID.
+    :param unknown_header: The header of unknowns.
+    :param worker_count: The count of worker processes (None if the count of CPUs should be used).
+    :param chunk_size: The count of chemical equations that are sent to a worker at a time.
+    :rtype : collections.Iterator[bce.public.result.BalanceResult]
+    :return: A generator that yields the result of each chemical equation (in input order).
+    """
+
+    #  Get the count of worker processes.
+    if worker_count is None:
+        worker_count = _multiprocessing.cpu_count()
+    if worker_count < 1:
+        raise ValueError("Invalid worker count.")
+    if chunk_size < 1:
+        raise ValueError("Invalid chunk size.")
+
+    #  Create the worker pool.
+    pool = _multiprocessing.Pool(
+        processes=worker_count,
+        initializer=_parallel_worker_initialize,
+        initargs=(options, printer, unknown_header)
+    )
+
+    #  Get the count of chemical equations that are read at a time.
+    window_size = worker_count * chunk_size * 4
+
+    source = iter(expressions)
+
+    def submit_window():
+        #  Read a window of chemical equations and submit them to the workers.
+        window = list(_itertools.islice(source, window_size))
+        if len(window) == 0:
+            return None
+
+        return window, pool.imap(_parallel_worker_balance, window, chunk_size)
+
+    try:
+        index = 0
+        current = submit_window()
+        while current is not None:
+            #  Submit the next window before draining current one.
+            following = submit_window()
+
+            window, window_results = current
+            for offset, (result, error, elapsed_time) in enumerate(window_results):
+                yield _pub_result.BalanceResult(
+                    index,
+                    window[offset],
+                    result=result,
+                    error=error,
+                    elapsed_time=elapsed_time
+                )
+
+                index += 1
+
+            current = following
+    finally:
+        pool.terminate()
+        pool.join()
 
 
 def is_chemical_equation_balanced(expression, options):
@@ -186,9 +534,74 @@ def is_chemical_equation_balanced(expression, options):
         #  Check whether the chemical equation is balanced.
         return _lgc_bce_main.check_chemical_equation(cexp_object)
     except _ps_cm_error.Error as err:
-        raise _pub_exception.ParserErrorWrapper(err.to_string())
+        raise _pub_exception.ParserErrorWrapper(err.to_string(), error_code=err.get_error_code())
     except _lgc_cm_error.Error as err:
-        raise _pub_exception.LogicErrorWrapper(err.to_string())
+        raise _pub_exception.LogicErrorWrapper(err.to_string(), error_code=err.get_error_code())
+
+
+def are_chemical_equations_balanced(expressions, options, batch_size=1024, use_numpy=False):
+    """Check whether each of a batch of chemical equations is balanced.
+
+    Note:
+      [1] The chemical equations are parsed one by one and checked batch by
+          batch (see bce.logic.balancer.main.check_chemical_equations()), so
+          the input never has to be loaded fully into memory.
+      [2] Errors are not raised. Instead, they are saved in the result of
+          each chemical equation.
+
+    :type expressions: collections.Iterable[str]
+    :type options: bce.option.Option
+    :type batch_size: int
+    :type use_numpy: bool
+    :param expressions: The chemical equations.
+    :param options: The options.
+    :param batch_size: The count of chemical equations that are checked at a time.
+    :param use_numpy: Whether NumPy can be used (if it is available).
+    :rtype : collections.Iterator[bce.public.result.CheckResult]
+    :return: A generator that yields the result of each chemical equation (in input order).
+    """
+
+    if batch_size < 1:
+        raise ValueError("Invalid batch size.")
+
+    #  Get the CEXP parser.
+    cexp_parser = _interface_opt.OptionWrapper(options).get_cexp_parser()
+
+    index = 0
+    source = iter(expressions)
+    while True:
+        #  Read and parse a batch of chemical equations.
+        batch = []
+        for expression in _itertools.islice(source, batch_size):
+            cexp_object = None
+            error = None
+            if not _util_input_chk.check_input_expression_characters(expression):
+                error = _pub_exception.InvalidCharacterException("Invalid character.")
+            else:
+                try:
+                    cexp_object = cexp_parser.parse(
+                        expression,
+                        options,
+                        mexp_protected_header_enabled=False
+                    )
+                except _ps_cm_error.Error as err:
+                    error = _pub_exception.ParserErrorWrapper(err.to_string(), error_code=err.get_error_code())
+            batch.append((expression, cexp_object, error))
+
+        if len(batch) == 0:
+            break
+
+        #  Check the parsed chemical equations.
+        parsed = [cexp_object for _, cexp_object, error in batch if error is None]
+        balanced = iter(_lgc_bce_main.check_chemical_equations(parsed, use_numpy=use_numpy))
+
+        for expression, cexp_object, error in batch:
+            if error is None:
+                yield _pub_result.CheckResult(index, expression, balanced=next(balanced))
+            else:
+                yield _pub_result.CheckResult(index, expression, error=error)
+
+            index += 1
 
 
 def substitute_chemical_equation(
@@ -237,7 +650,11 @@ def substitute_chemical_equation(
         )
 
         #  Print.
-        return _print_cexp(
+        return _inst_probe.run_stage(
+            options,
+            _inst_stage.STAGE_PRINT,
+            expression,
+            _print_cexp,
             cexp_object,
             if_opt.get_cexp_parser(),
             if_opt.get_molecule_parser(),
@@ -246,6 +663,6 @@ def substitute_chemical_equation(
             unknown_header=unknown_header
         )
     except _ps_cm_error.Error as err:
-        raise _pub_exception.ParserErrorWrapper(err.to_string())
+        raise _pub_exception.ParserErrorWrapper(err.to_string(), error_code=err.get_error_code())
     except _ps_cexp_interface.SubstituteError as err:
         raise _pub_exception.SubstitutionErrorWrapper(str(err))
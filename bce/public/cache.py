@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+# noinspection PyUnresolvedReferences
+from bce.logic.balancer.cache import SolutionCache as BalancerSolutionCache
@@ -6,13 +6,47 @@
 #
 
 
-class ParserErrorWrapper(Exception):
+class _ErrorWrapperWithCode(Exception):
+    """Base class of error wrappers that carry the error code of the wrapped error."""
+
+    def __init__(self, message, error_code=None):
+        """Initialize the error.
+
+        :type message: str
+        :type error_code: str | None
+        :param message: The error message.
+        :param error_code: The error code of the wrapped error (None if not available).
+        """
+
+        Exception.__init__(self, message)
+        self.__code = error_code
+
+    def __reduce__(self):
+        """Get the pickling information (keeps the error code across processes).
+
+        :rtype : tuple
+        :return: The information.
+        """
+
+        return self.__class__, (str(self), self.__code)
+
+    def get_error_code(self):
+        """Get the error code of the wrapped error.
+
+        :rtype : str | None
+        :return: The error code (None if not available).
+        """
+
+        return self.__code
+
+
+class ParserErrorWrapper(_ErrorWrapperWithCode):
     """Parser error."""
 
     pass
 
 
-class LogicErrorWrapper(Exception):
+class LogicErrorWrapper(_ErrorWrapperWithCode):
     """Logic error."""
 
     pass
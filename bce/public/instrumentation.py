@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.collector import CollectorInterface
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.collector import StageStatistics
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.collector import StatisticsCollector
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_BALANCE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_CEXP_TOKENIZE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_CEXP_PARSE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_MOLECULE_TOKENIZE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_MOLECULE_AST_GENERATE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_MOLECULE_AST_FOLD
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_MEXP_EVALUATE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_MATRIX_BUILD
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_SOLVE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_COEFFICIENT_GENERATE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_INTEGERIZE
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import STAGE_PRINT
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.stage import get_stages
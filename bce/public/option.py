@@ -5,6 +5,8 @@
 #  found in the license.txt file.
 #
 
+# noinspection PyUnresolvedReferences
+from bce.instrumentation.option import OptionWrapper as InstrumentationOptionWrapper
 # noinspection PyUnresolvedReferences
 from bce.locale.option import OptionWrapper as LocaleOptionWrapper
 # noinspection PyUnresolvedReferences
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+
+class BalanceResult:
+    """Result of balancing one chemical equation in a batch."""
+
+    def __init__(self, index, expression, result=None, error=None, elapsed_time=0.0):
+        """Initialize the object.
+
+        :type index: int
+        :type expression: str
+        :type result: str | dict[str, str] | None
+        :type error: Exception | None
+        :type elapsed_time: float
+        :param index: The index of the chemical equation in the batch.
+        :param expression: The chemical equation.
+        :param result: The balanced chemical equation (None if an error occurred).
+        :param error: The error (None if no error occurred).
+        :param elapsed_time: The elapsed wall time (in seconds).
+        """
+
+        self.__idx = index
+        self.__expr = expression
+        self.__result = result
+        self.__error = error
+        self.__time = elapsed_time
+
+    def get_index(self):
+        """Get the index of the chemical equation in the batch.
+
+        :rtype : int
+        :return: The index.
+        """
+
+        return self.__idx
+
+    def get_expression(self):
+        """Get the chemical equation.
+
+        :rtype : str
+        :return: The chemical equation.
+        """
+
+        return self.__expr
+
+    def is_succeeded(self):
+        """Get whether the chemical equation was balanced successfully.
+
+        :rtype : bool
+        :return: True if so.
+        """
+
+        return self.__error is None
+
+    def get_result(self):
+        """Get the balanced chemical equation.
+
+        :rtype : str | dict[str, str] | None
+        :return: The balanced chemical equation (None if an error occurred).
+        """
+
+        return self.__result
+
+    def get_error(self):
+        """Get the error.
+
+        :rtype : Exception | None
+        :return: The error (one of the exceptions in "bce.public.exception", None if no error occurred).
+        """
+
+        return self.__error
+
+    def get_elapsed_time(self):
+        """Get the elapsed wall time of balancing the chemical equation.
+
+        :rtype : float
+        :return: The time (in seconds).
+        """
+
+        return self.__time
+
+
+class CheckResult:
+    """Result of checking one chemical equation in a batch."""
+
+    def __init__(self, index, expression, balanced=None, error=None):
+        """Initialize the object.
+
+        :type index: int
+        :type expression: str
+        :type balanced: bool | None
+        :type error: Exception | None
+        :param index: The index of the chemical equation in the batch.
+        :param expression: The chemical equation.
+        :param balanced: Whether the chemical equation is balanced (None if an error occurred).
+        :param error: The error (None if no error occurred).
+        """
+
+        self.__idx = index
+        self.__expr = expression
+        self.__balanced = balanced
+        self.__error = error
+
+    def get_index(self):
+        """Get the index of the chemical equation in the batch.
+
+        :rtype : int
+        :return: The index.
+        """
+
+        return self.__idx
+
+    def get_expression(self):
+        """Get the chemical equation.
+
+        :rtype : str
+        :return: The chemical equation.
+        """
+
+        return self.__expr
+
+    def is_succeeded(self):
+        """Get whether the chemical equation was checked successfully.
+
+        :rtype : bool
+        :return: True if so.
+        """
+
+        return self.__error is None
+
+    def is_balanced(self):
+        """Get whether the chemical equation is balanced.
+
+        :rtype : bool | None
+        :return: True if so (None if an error occurred).
+        """
+
+        return self.__balanced
+
+    def get_error(self):
+        """Get the error.
+
+        :rtype : Exception | None
+        :return: The error (one of the exceptions in "bce.public.exception", None if no error occurred).
+        """
+
+        return self.__error
@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+# noinspection PyUnresolvedReferences
+from bce.math.solver import SOLVER_BAREISS
+# noinspection PyUnresolvedReferences
+from bce.math.solver import SOLVER_MODULAR
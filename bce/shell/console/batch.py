@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.public.api as _public_api
+import bce.public.exception as _public_exception
+import bce.public.printer as _public_printer
+import bce.shell.service.protocol as _service_protocol
+import bce.utils.file_io as _utils_file_io
+import json as _json
+import sys as _sys
+
+#
+#  Output format:
+#    [1] One JSON object per line (JSON Lines), in input order.
+#    [2] Record fields:
+#          "index"         - The index of the chemical equation (counted from 0 across all inputs).
+#          "input"         - The chemical equation.
+#          "status"        - "ok" or "error" (bce.shell.service.protocol.STATUS_* constants).
+#          "result"        - The balanced chemical equation (text, None if failed).
+#          "mathml"        - The balanced chemical equation (MathML, only if MathML output is enabled).
+#          "error"         - None, or an object {"type": <ERROR_TYPE_*>, "code": <str | None>, "message": <str>}.
+#          "elapsed_time"  - The elapsed wall time of balancing the chemical equation (in seconds).
+#
+
+#  Path that stands for the standard input.
+STDIN_PATH = "-"
+
+#  Count of records that are written at a time by default.
+DEFAULT_CHUNK_SIZE = 64
+
+
+def iterate_expressions(input_paths):
+    """Iterate the chemical equations in input files line by line.
+
+    Note:
+      [1] Zero-length expressions and comment lines are ignored.
+      [2] Only one line is kept in memory at a time, and each file is opened
+          only when the files before it were read.
+
+    :type input_paths: list[str]
+    :param input_paths: The paths of the input files (STDIN_PATH stands for the standard input).
+    :rtype : collections.Iterator[str]
+    :return: A generator that yields the expressions.
+    :raise IOError: Raise this exception if an input file can't be opened.
+    """
+
+    for input_path in input_paths:
+        if input_path == STDIN_PATH:
+            handler = _sys.stdin
+        else:
+            handler = _utils_file_io.open_text_file(input_path)
+
+        try:
+            for line in handler:
+                expression = line.strip().replace(" ", "")
+
+                #  Ignore zero-length expressions and comment lines.
+                if len(expression) == 0 or expression[0] == "#":
+                    continue
+
+                yield expression
+        finally:
+            if handler is not _sys.stdin:
+                handler.close()
+
+
+def _get_error_object(error):
+    """Get the JSON object of a balancing error.
+
+    :type error: Exception
+    :param error: The error (one of the exceptions in "bce.public.exception").
+    :rtype : dict
+    :return: The object.
+    """
+
+    if isinstance(error, _public_exception.InvalidCharacterException):
+        error_type = _service_protocol.ERROR_TYPE_INVALID_CHARACTER
+    elif isinstance(error, _public_exception.ParserErrorWrapper):
+        error_type = _service_protocol.ERROR_TYPE_PARSER
+    elif isinstance(error, _public_exception.LogicErrorWrapper):
+        error_type = _service_protocol.ERROR_TYPE_LOGIC
+    else:
+        error_type = _service_protocol.ERROR_TYPE_INTERNAL
+
+    get_error_code = getattr(error, "get_error_code", None)
+
+    return {
+        "type": error_type,
+        "code": get_error_code() if get_error_code is not None else None,
+        "message": str(error)
+    }
+
+
+def make_record(item, mathml_enabled=False):
+    """Make the output record of a balancing result.
+
+    :type item: bce.public.result.BalanceResult
+    :type mathml_enabled: bool
+    :param item: The balancing result.
+    :param mathml_enabled: Whether MathML output is enabled (the result is a printer bundle if so).
+    :rtype : dict
+    :return: The record.
+    """
+
+    record = {
+        "index": item.get_index(),
+        "input": item.get_expression(),
+        "elapsed_time": item.get_elapsed_time()
+    }
+
+    if item.is_succeeded():
+        record["status"] = _service_protocol.STATUS_OK
+        record["error"] = None
+        if mathml_enabled:
+            bundle = item.get_result()
+            record["result"] = bundle[_public_printer.PRINTER_KEY_TEXT]
+            record["mathml"] = bundle[_public_printer.PRINTER_KEY_MATHML]
+        else:
+            record["result"] = item.get_result()
+    else:
+        record["status"] = _service_protocol.STATUS_ERROR
+        record["error"] = _get_error_object(item.get_error())
+        record["result"] = None
+        if mathml_enabled:
+            record["mathml"] = None
+
+    return record
+
+
+def run_batch(
+        expressions,
+        options,
+        output=None,
+        mathml_enabled=False,
+        unknown_header="X",
+        worker_count=1,
+        chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Balance chemical equations and write the results in JSON Lines format.
+
+    Note:
+      [1] The results are written (and flushed) every |chunk_size| records, so
+          the memory usage doesn't grow with the count of chemical equations.
+
+    :type expressions: collections.Iterable[str]
+    :type options: bce.option.Option
+    :type mathml_enabled: bool
+    :type unknown_header: str
+    :type worker_count: int
+    :type chunk_size: int
+    :param expressions: The chemical equations.
+    :param options: The options.
+    :param output: The output stream (None if the standard output should be used).
+    :param mathml_enabled: Whether MathML output is enabled.
+    :param unknown_header: The header of unknowns.
+    :param worker_count: The count of worker processes (1 if balancing in current process).
+    :param chunk_size: The count of records that are written at a time.
+    :rtype : int
+    :return: The count of chemical equations that were balanced successfully.
+    """
+
+    if chunk_size < 1:
+        raise ValueError("Invalid chunk size.")
+
+    if output is None:
+        output = _sys.stdout
+
+    #  Get the printer ID.
+    if mathml_enabled:
+        printer_id = _public_printer.PRINTER_ALL
+    else:
+        printer_id = _public_printer.PRINTER_TEXT
+
+    #  Get the results generator.
+    if worker_count > 1:
+        results = _public_api.balance_chemical_equations_parallel(
+            expressions,
+            options,
+            printer=printer_id,
+            unknown_header=unknown_header,
+            worker_count=worker_count
+        )
+    else:
+        results = _public_api.balance_chemical_equations(
+            expressions,
+            options,
+            printer=printer_id,
+            unknown_header=unknown_header
+        )
+
+    succeeded = 0
+    chunk = []
+    for item in results:
+        if item.is_succeeded():
+            succeeded += 1
+
+        chunk.append(_json.dumps(make_record(item, mathml_enabled=mathml_enabled), sort_keys=True))
+
+        #  Write a chunk.
+        if len(chunk) >= chunk_size:
+            output.write("\n".join(chunk) + "\n")
+            output.flush()
+            del chunk[:]
+
+    #  Write the last chunk.
+    if len(chunk) != 0:
+        output.write("\n".join(chunk) + "\n")
+        output.flush()
+
+    return succeeded
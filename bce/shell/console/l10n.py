@@ -24,11 +24,20 @@ def setup_localization():
                     "invalid_unknown_header": {
                         "description": "Invalid unknown header."
                     },
+                    "invalid_jobs": {
+                        "description": "Invalid count of worker processes."
+                    },
                     "file_reading_error": {
                         "description": "Can't read file \"$1\"."
                     },
                     "file_corrupted": {
                         "description": "Corrupted file \"$1\"."
+                    },
+                    "service_error": {
+                        "description": "Can't serve at \"$1\" ($2)."
+                    },
+                    "invalid_batch_chunk_size": {
+                        "description": "Invalid count of records that are written at a time."
                     }
                 },
                 "command": {
@@ -39,11 +48,18 @@ def setup_localization():
                     "disable_error_correction": "Disable the error-correction feature.",
                     "disable_auto_arranging": "Disable the auto-arranging feature.",
                     "service_mode": "Start in service mode.",
+                    "service_address": "Set the address of the service (\"<host>:<port>\" or \"unix:<path>\").",
                     "unknown_header": "Set the header of unknown symbols.",
                     "load_abbreviations_file": "Load extra abbreviations from specified file.",
                     "language": "Set the software language." +
                                 "(Available: \"en_US\" [English(US)], \"zh_CN\", \"zh_Hans\" [Simplified Chinese])",
-                    "show_version": "Show the software version."
+                    "show_version": "Show the software version.",
+                    "jobs": "Balance chemical equations with specified count of worker processes " +
+                            "(results are printed in input order).",
+                    "batch": "Start in batch mode (results are printed in JSON Lines format).",
+                    "batch_input": "Read chemical equations from specified file in batch mode " +
+                                   "(can be repeated, \"-\" for the standard input).",
+                    "batch_chunk_size": "Set the count of records that are written at a time in batch mode."
                 },
                 "application": {
                     "banner": "BCE V$1.$2.$3",
@@ -65,11 +81,20 @@ def setup_localization():
                     "invalid_unknown_header": {
                         "description": "无效的未知量符号前缀。"
                     },
+                    "invalid_jobs": {
+                        "description": "无效的工作进程数量。"
+                    },
                     "file_reading_error": {
                         "description": "无法读取文件 \"$1\"。"
                     },
                     "file_corrupted": {
                         "description": "文件 \"$1\" 已损坏。"
+                    },
+                    "service_error": {
+                        "description": "无法在 \"$1\" 上提供服务 ($2)。"
+                    },
+                    "invalid_batch_chunk_size": {
+                        "description": "无效的单次写出记录数量。"
                     }
                 },
                 "command": {
@@ -80,11 +105,16 @@ def setup_localization():
                     "disable_error_correction": "禁用自动纠错特性。",
                     "disable_auto_arranging": "禁用自动分界特性。",
                     "service_mode": "从服务模式启动。",
+                    "service_address": "设置服务地址 (\"<主机>:<端口>\" 或 \"unix:<路径>\")。",
                     "unknown_header": "设置系统未知量符号前缀。",
                     "load_abbreviations_file": "从指定文件中读取额外(非自带的)的缩写符号。",
                     "language": "设置软件语言。" +
                                 "(可用选项: \"en_US\" [英语(美国)], \"zh_CN\", \"zh_Hans\" [中文(简体)])",
-                    "version": "显示软件版本。"
+                    "version": "显示软件版本。",
+                    "jobs": "使用指定数量的工作进程配平化学方程式（按输入顺序输出结果）。",
+                    "batch": "从批处理模式启动（以 JSON Lines 格式输出结果）。",
+                    "batch_input": "在批处理模式下从指定文件中读取化学方程式（可重复指定，\"-\" 表示标准输入）。",
+                    "batch_chunk_size": "设置批处理模式下单次写出的记录数量。"
                 },
                 "application": {
                     "banner": "BCE V$1.$2.$3",
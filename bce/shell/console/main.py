@@ -12,7 +12,10 @@ import bce.public.database as _public_db
 import bce.public.exception as _public_exception
 import bce.public.option as _public_option
 import bce.public.printer as _public_printer
+import bce.shell.console.batch as _shell_batch
 import bce.shell.console.l10n as _shell_l10n
+import bce.shell.service.protocol as _service_protocol
+import bce.shell.service.server as _service_server
 import bce.utils.compatible as _utils_compatible
 import bce.utils.file_io as _utils_file_io
 import bce.utils.input_checker as _utils_input_chk
@@ -21,6 +24,7 @@ import argparse as _argparse
 import copy as _copy
 import json as _json
 import signal as _signal
+import socket as _socket
 import sys as _sys
 
 
@@ -170,6 +174,72 @@ def main():
             "shell.console.command.language"
         )
     )
+    arg_parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        action="store",
+        type=int,
+        default=1,
+        help=_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.command.jobs"
+        )
+    )
+    arg_parser.add_argument(
+        "--service-mode",
+        dest="service_mode",
+        action="store_const",
+        const=True,
+        default=False,
+        help=_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.command.service_mode"
+        )
+    )
+    arg_parser.add_argument(
+        "--service-address",
+        dest="service_address",
+        action="store",
+        type=str,
+        default=_service_protocol.DEFAULT_ADDRESS,
+        help=_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.command.service_address"
+        )
+    )
+    arg_parser.add_argument(
+        "--batch",
+        dest="batch_mode",
+        action="store_const",
+        const=True,
+        default=False,
+        help=_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.command.batch"
+        )
+    )
+    arg_parser.add_argument(
+        "--batch-input",
+        dest="batch_inputs",
+        action="append",
+        type=str,
+        default=None,
+        help=_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.command.batch_input"
+        )
+    )
+    arg_parser.add_argument(
+        "--batch-chunk-size",
+        dest="batch_chunk_size",
+        action="store",
+        type=int,
+        default=_shell_batch.DEFAULT_CHUNK_SIZE,
+        help=_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.command.batch_chunk_size"
+        )
+    )
     arg_parser.add_argument(
         "--version",
         dest="show_version",
@@ -233,6 +303,22 @@ def main():
         ))
         _sys.exit(1)
 
+    #  Check the count of worker processes.
+    if args.jobs < 1:
+        print(_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.error.invalid_jobs.description"
+        ))
+        _sys.exit(1)
+
+    #  Check the count of records that are written at a time in batch mode.
+    if args.batch_chunk_size < 1:
+        print(_l10n_registry.get_message(
+            l10n_option.get_language_id(),
+            "shell.console.error.invalid_batch_chunk_size.description"
+        ))
+        _sys.exit(1)
+
     #  Initialize abbreviations.
     abbreviations = {}
 
@@ -311,22 +397,88 @@ def main():
     #  Set abbreviations in the option object.
     _public_option.MoleculeParserOptionWrapper(option).set_abbreviation_mapping(abbreviations)
 
-    while True:
-        #  Input a chemical equation / expression.
+    #  Get the printer ID.
+    printer_id = _public_printer.PRINTER_TEXT
+    if args.output_mathml:
+        printer_id = _public_printer.PRINTER_MATHML
+
+    #  Serve requests in service mode.
+    if args.service_mode:
         try:
-            expression = _utils_compatible.input_prompt(">> ").replace(" ", "")
-        except EOFError:
-            break
+            _service_server.serve(args.service_address, option, unknown_header=unknown_header)
+        except (ValueError, _socket.error) as err:
+            print(_l10n_registry.get_message(
+                l10n_option.get_language_id(),
+                "shell.console.error.service_error.description",
+                replace_map={
+                    "$1": args.service_address,
+                    "$2": str(err)
+                }
+            ))
+            _sys.exit(1)
 
-        #  Ignore zero-length expressions and comment lines.
-        if len(expression) == 0 or expression[0] == "#":
-            continue
+        _sys.exit(0)
+
+    #  Balance in batch mode.
+    if args.batch_mode:
+        batch_inputs = args.batch_inputs
+        if batch_inputs is None:
+            batch_inputs = [_shell_batch.STDIN_PATH]
+
+        #  Check whether the input files can be read (they are opened one by one later).
+        for batch_input in batch_inputs:
+            if batch_input == _shell_batch.STDIN_PATH:
+                continue
+            try:
+                _utils_file_io.open_text_file(batch_input).close()
+            except IOError:
+                _sys.stderr.write(_l10n_registry.get_message(
+                    l10n_option.get_language_id(),
+                    "shell.console.error.file_reading_error.description",
+                    replace_map={
+                        "$1": batch_input
+                    }
+                ) + "\n")
+                _sys.exit(1)
+
+        _shell_batch.run_batch(
+            _shell_batch.iterate_expressions(batch_inputs),
+            option,
+            mathml_enabled=args.output_mathml,
+            unknown_header=unknown_header,
+            worker_count=args.jobs,
+            chunk_size=args.batch_chunk_size
+        )
+
+        _sys.exit(0)
 
+    #  Balance with worker processes if needed.
+    if args.jobs > 1:
+        for item in _public_api.balance_chemical_equations_parallel(
+            read_expressions(),
+            option,
+            printer=printer_id,
+            unknown_header=unknown_header,
+            worker_count=args.jobs
+        ):
+            if item.is_succeeded():
+                print(item.get_result())
+            elif isinstance(item.get_error(), _public_exception.InvalidCharacterException):
+                print(_l10n_registry.get_message(
+                    l10n_option.get_language_id(),
+                    "shell.console.error.invalid_character.description"
+                ))
+            else:
+                print(str(item.get_error()))
+
+        #  Print an empty line.
+        print("")
+
+        _sys.exit(0)
+
+    for expression in read_expressions():
         #  Balance chemical equation / expression and print it out.
         try:
-            printer_id = _public_printer.PRINTER_TEXT
-            if args.output_mathml:
-                printer_id = _public_printer.PRINTER_MATHML
             cb_ctx = {
                 "symbols": set()
             }
@@ -357,6 +509,30 @@ def main():
     _sys.exit(0)
 
 
+def read_expressions():
+    """Read chemical equations / expressions from the standard input until EOF.
+
+    Note:
+      [1] Zero-length expressions and comment lines are ignored.
+
+    :rtype : collections.Iterator[str]
+    :return: A generator that yields the expressions.
+    """
+
+    while True:
+        #  Input a chemical equation / expression.
+        try:
+            expression = _utils_compatible.input_prompt(">> ").replace(" ", "")
+        except EOFError:
+            break
+
+        #  Ignore zero-length expressions and comment lines.
+        if len(expression) == 0 or expression[0] == "#":
+            continue
+
+        yield expression
+
+
 def callback_after_balancing(ctx, cexp_object):
     """Callback that will be called after balancing.
 
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.shell.service.protocol as _protocol
+import argparse as _argparse
+import itertools as _itertools
+import socket as _socket
+import sys as _sys
+
+
+class ServiceError(Exception):
+    """Error reported by the balancer service."""
+
+    def __init__(self, error_type, message):
+        """Initialize the error.
+
+        :type error_type: str
+        :type message: str
+        :param error_type: The error type (one of bce.shell.service.protocol.ERROR_TYPE_* constants).
+        :param message: The error message.
+        """
+
+        Exception.__init__(self, message)
+        self.__type = error_type
+
+    def get_error_type(self):
+        """Get the error type.
+
+        :rtype : str
+        :return: The error type (one of bce.shell.service.protocol.ERROR_TYPE_* constants).
+        """
+
+        return self.__type
+
+
+class ServiceClient:
+    """Client of the balancer service.
+
+    Note:
+      [1] One connection is kept and reused for all requests of the client.
+    """
+
+    def __init__(self, address=_protocol.DEFAULT_ADDRESS, timeout=None):
+        """Connect to the service.
+
+        :type address: str
+        :type timeout: float | None
+        :param address: The address (see bce.shell.service.protocol.parse_address()).
+        :param timeout: The timeout of socket operations (in seconds, None if operations never time out).
+        :raise ValueError: Raise this exception if the address is invalid.
+        :raise socket.error: Raise this exception if the service can't be connected.
+        """
+
+        is_unix, socket_address = _protocol.parse_address(address)
+        if is_unix:
+            # noinspection PyUnresolvedReferences
+            self.__sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+            self.__sock.settimeout(timeout)
+            self.__sock.connect(socket_address)
+        else:
+            self.__sock = _socket.create_connection(socket_address, timeout)
+
+        self.__reader = self.__sock.makefile("rb")
+        self.__ids = _itertools.count(1)
+
+    def close(self):
+        """Close the connection."""
+
+        self.__reader.close()
+        self.__sock.close()
+
+    def __enter__(self):
+        """Enter the context.
+
+        :rtype : ServiceClient
+        :return: The client.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit the context (and close the connection)."""
+
+        self.close()
+
+    def request(self, method, **fields):
+        """Send a request and wait for its response.
+
+        :type method: str
+        :param method: The method (one of bce.shell.service.protocol.METHOD_* constants).
+        :param fields: Other request fields.
+        :return: The result.
+        :raise ServiceError: Raise this exception if the service reports an error.
+        :raise IOError: Raise this exception if the connection was closed.
+        """
+
+        request_id = next(self.__ids)
+        request = dict(fields)
+        request["id"] = request_id
+        request["method"] = method
+        self.__sock.sendall(_protocol.encode_message(request))
+
+        line = self.__reader.readline()
+        if len(line) == 0:
+            raise IOError("The connection was closed by the service.")
+
+        response = _protocol.decode_message(line)
+        if response.get("id") != request_id:
+            raise IOError("Mismatched response.")
+
+        if response["status"] != _protocol.STATUS_OK:
+            raise ServiceError(response["error"]["type"], response["error"]["message"])
+
+        return response["result"]
+
+    def ping(self):
+        """Check whether the service is alive.
+
+        :rtype : str
+        :return: The version of the service.
+        """
+
+        return self.request(_protocol.METHOD_PING)["version"]
+
+    def balance(self, expression, printer=_protocol.PRINTER_TEXT, unknown_header=None):
+        """Balance a chemical equation.
+
+        :type expression: str
+        :type printer: str
+        :type unknown_header: str | None
+        :param expression: The chemical equation.
+        :param printer: The printer (one of bce.shell.service.protocol.PRINTER_* constants).
+        :param unknown_header: The header of unknowns (None if the one of the service should be used).
+        :rtype : str
+        :return: The balanced chemical equation.
+        """
+
+        fields = {
+            "expression": expression,
+            "printer": printer
+        }
+        if unknown_header is not None:
+            fields["unknown_header"] = unknown_header
+
+        return self.request(_protocol.METHOD_BALANCE, **fields)
+
+    def check(self, expression):
+        """Check whether a chemical equation is balanced.
+
+        :type expression: str
+        :param expression: The chemical equation.
+        :rtype : bool
+        :return: True if balanced.
+        """
+
+        return self.request(_protocol.METHOD_CHECK, expression=expression)
+
+    def substitute(self, expression, substitute_map, printer=_protocol.PRINTER_TEXT, unknown_header=None):
+        """Substitute a chemical equation.
+
+        :type expression: str
+        :type substitute_map: dict[str, str]
+        :type printer: str
+        :type unknown_header: str | None
+        :param expression: The chemical equation.
+        :param substitute_map: The substitution map (symbol => math expression).
+        :param printer: The printer (one of bce.shell.service.protocol.PRINTER_* constants).
+        :param unknown_header: The header of unknowns (None if the one of the service should be used).
+        :rtype : str
+        :return: The substituted chemical equation.
+        """
+
+        fields = {
+            "expression": expression,
+            "substitute_map": substitute_map,
+            "printer": printer
+        }
+        if unknown_header is not None:
+            fields["unknown_header"] = unknown_header
+
+        return self.request(_protocol.METHOD_SUBSTITUTE, **fields)
+
+
+def main():
+    """Main entry of the balancer service client.
+
+    Note:
+      [1] Chemical equations are read from the standard input (one per line)
+          and balanced by the service. Results are printed in input order.
+    """
+
+    arg_parser = _argparse.ArgumentParser(description="BCE - Chemical Equation Balancer (Service Client)")
+    arg_parser.add_argument(
+        "--address",
+        dest="address",
+        action="store",
+        type=str,
+        default=_protocol.DEFAULT_ADDRESS,
+        help="Set the service address (\"<host>:<port>\" or \"unix:<path>\")."
+    )
+    arg_parser.add_argument(
+        "--output-mathml",
+        dest="output_mathml",
+        action="store_const",
+        const=True,
+        default=False,
+        help="Show output in MathML format."
+    )
+    arg_parser.add_argument(
+        "--unknown-header",
+        dest="unknown_header",
+        action="store",
+        type=str,
+        default=None,
+        help="Set the header of unknown symbols."
+    )
+    args = arg_parser.parse_args()
+
+    #  Get the printer.
+    printer = _protocol.PRINTER_TEXT
+    if args.output_mathml:
+        printer = _protocol.PRINTER_MATHML
+
+    try:
+        client = ServiceClient(args.address)
+    except (ValueError, _socket.error) as err:
+        _sys.stderr.write("Can't connect to the service at \"%s\" (%s).\n" % (args.address, str(err)))
+        _sys.exit(1)
+
+    with client:
+        for line in _sys.stdin:
+            #  Ignore zero-length expressions and comment lines.
+            expression = line.strip().replace(" ", "")
+            if len(expression) == 0 or expression[0] == "#":
+                continue
+
+            try:
+                print(client.balance(expression, printer=printer, unknown_header=args.unknown_header))
+            except ServiceError as err:
+                print(str(err))
+
+    _sys.exit(0)
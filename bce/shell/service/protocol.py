@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import json as _json
+
+#
+#  Protocol:
+#    [1] Each message is a JSON object encoded in UTF-8 and terminated by a line
+#        feed. A connection may carry any count of requests, and responses are
+#        sent in request order.
+#    [2] Request fields:
+#          "id"              - Any JSON value, echoed in the response (optional).
+#          "method"          - One of METHOD_* constants.
+#          "expression"      - The chemical equation (not used by "ping").
+#          "printer"         - One of PRINTER_* constants (optional, "text" by default).
+#          "unknown_header"  - The header of unknowns (optional, the one of the server by default).
+#          "substitute_map"  - Symbol => math expression (only used by "substitute").
+#    [3] Response fields:
+#          "id"              - The ID of the request.
+#          "status"          - One of STATUS_* constants.
+#          "result"          - The result (only if succeeded).
+#          "error"           - An object {"type": <ERROR_TYPE_*>, "message": <str>} (only if failed).
+#
+
+#  Address of the service by default.
+DEFAULT_ADDRESS = "127.0.0.1:7391"
+
+#  Prefix of Unix domain socket addresses.
+UNIX_ADDRESS_PREFIX = "unix:"
+
+#  Methods.
+METHOD_BALANCE = "balance"
+METHOD_CHECK = "check"
+METHOD_SUBSTITUTE = "substitute"
+METHOD_PING = "ping"
+
+#  Printers.
+PRINTER_TEXT = "text"
+PRINTER_MATHML = "mathml"
+
+#  Statuses.
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+#  Error types.
+ERROR_TYPE_REQUEST = "request"
+ERROR_TYPE_INVALID_CHARACTER = "invalid_character"
+ERROR_TYPE_PARSER = "parser"
+ERROR_TYPE_LOGIC = "logic"
+ERROR_TYPE_SUBSTITUTION = "substitution"
+ERROR_TYPE_INTERNAL = "internal"
+
+
+def parse_address(address):
+    """Parse a service address.
+
+    Note:
+      [1] Addresses in "unix:<path>" form are Unix domain socket addresses.
+          Others should be in "<host>:<port>" form.
+
+    :type address: str
+    :param address: The address.
+    :rtype : (bool, str | (str, int))
+    :return: A tuple (whether the address is a Unix domain socket address, socket address).
+    :raise ValueError: Raise this exception if the address is invalid.
+    """
+
+    if address.startswith(UNIX_ADDRESS_PREFIX):
+        path = address[len(UNIX_ADDRESS_PREFIX):]
+        if len(path) == 0:
+            raise ValueError("Invalid address.")
+
+        return True, path
+
+    host, sep, port = address.rpartition(":")
+    if len(sep) == 0 or len(host) == 0 or not port.isdigit() or int(port) > 65535:
+        raise ValueError("Invalid address.")
+
+    return False, (host, int(port))
+
+
+def encode_message(message):
+    """Encode a message to a line.
+
+    :type message: dict
+    :param message: The message.
+    :rtype : bytes
+    :return: The encoded line (with the line feed).
+    """
+
+    return (_json.dumps(message, sort_keys=True) + "\n").encode("utf-8")
+
+
+def decode_message(line):
+    """Decode a message from a line.
+
+    :type line: bytes
+    :param line: The line.
+    :rtype : dict
+    :return: The message.
+    :raise ValueError: Raise this exception if the line isn't a JSON object.
+    """
+
+    message = _json.loads(line.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("The message is not a JSON object.")
+
+    return message
+
+
+def make_success_response(request_id, result):
+    """Make a response of a succeeded request.
+
+    :param request_id: The ID of the request.
+    :param result: The result.
+    :rtype : dict
+    :return: The response.
+    """
+
+    return {
+        "id": request_id,
+        "status": STATUS_OK,
+        "result": result
+    }
+
+
+def make_error_response(request_id, error_type, error_message):
+    """Make a response of a failed request.
+
+    :type error_type: str
+    :type error_message: str
+    :param request_id: The ID of the request.
+    :param error_type: The error type (one of ERROR_TYPE_* constants).
+    :param error_message: The error message.
+    :rtype : dict
+    :return: The response.
+    """
+
+    return {
+        "id": request_id,
+        "status": STATUS_ERROR,
+        "error": {
+            "type": error_type,
+            "message": error_message
+        }
+    }
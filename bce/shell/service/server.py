@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.base.version as _version
+import bce.parser.common.error as _ps_cm_error
+import bce.parser.interface.option as _interface_opt
+import bce.public.api as _public_api
+import bce.public.exception as _public_exception
+import bce.public.printer as _public_printer
+import bce.shell.service.protocol as _protocol
+import bce.utils.compatible as _utils_compatible
+import os as _os
+import socket as _socket
+import stat as _stat
+import sympy as _sympy
+
+try:
+    import socketserver as _socketserver
+except ImportError:
+    # noinspection PyUnresolvedReferences
+    import SocketServer as _socketserver
+
+#  Printer name => printer ID.
+_PRINTERS = {
+    _protocol.PRINTER_TEXT: _public_printer.PRINTER_TEXT,
+    _protocol.PRINTER_MATHML: _public_printer.PRINTER_MATHML
+}
+
+
+class _RequestError(Exception):
+    """Error raised when a request is malformed."""
+
+    pass
+
+
+def _get_string_field(request, key, default_value=None):
+    """Get a string field of a request.
+
+    :type request: dict
+    :type key: str
+    :type default_value: str | None
+    :param request: The request.
+    :param key: The field key.
+    :param default_value: The default value (None if the field is required).
+    :rtype : str
+    :return: The field value.
+    :raise _RequestError: Raise this exception if the field is missing or not a string.
+    """
+
+    if key not in request:
+        if default_value is None:
+            raise _RequestError("Missing field \"%s\"." % key)
+        return default_value
+
+    value = request[key]
+
+    #  Convert unicode to string in Python 2.
+    if _utils_compatible.is_old_python():
+        # noinspection PyUnresolvedReferences
+        if isinstance(value, unicode):
+            value = str(value)
+
+    if not isinstance(value, str):
+        raise _RequestError("Field \"%s\" should be a string." % key)
+
+    return value
+
+
+class BalancerService:
+    """Balancer service (handles requests with a warm toolkit)."""
+
+    def __init__(self, options, unknown_header="X"):
+        """Initialize the service.
+
+        :type options: bce.option.Option
+        :type unknown_header: str
+        :param options: The options.
+        :param unknown_header: The header of unknowns by default.
+        """
+
+        self.__opt = options
+        self.__unknown_header = unknown_header
+
+    def handle_request(self, request):
+        """Handle a request.
+
+        Note:
+          [1] Requests may be handled concurrently. The parsers keep no state
+              between calls and the shared caches (expressions, molecules and
+              solutions) are guarded by their own locks.
+
+        :type request: dict
+        :param request: The request.
+        :rtype : dict
+        :return: The response.
+        """
+
+        request_id = request.get("id")
+
+        try:
+            result = self.__dispatch(request)
+        except _RequestError as err:
+            return _protocol.make_error_response(request_id, _protocol.ERROR_TYPE_REQUEST, str(err))
+        except _public_exception.InvalidCharacterException as err:
+            return _protocol.make_error_response(request_id, _protocol.ERROR_TYPE_INVALID_CHARACTER, str(err))
+        except _public_exception.ParserErrorWrapper as err:
+            return _protocol.make_error_response(request_id, _protocol.ERROR_TYPE_PARSER, str(err))
+        except _public_exception.LogicErrorWrapper as err:
+            return _protocol.make_error_response(request_id, _protocol.ERROR_TYPE_LOGIC, str(err))
+        except _public_exception.SubstitutionErrorWrapper as err:
+            return _protocol.make_error_response(request_id, _protocol.ERROR_TYPE_SUBSTITUTION, str(err))
+        except Exception as err:
+            #  Keep the service alive.
+            return _protocol.make_error_response(request_id, _protocol.ERROR_TYPE_INTERNAL, repr(err))
+
+        return _protocol.make_success_response(request_id, result)
+
+    def handle_line(self, line):
+        """Handle a request line.
+
+        :type line: bytes
+        :param line: The request line.
+        :rtype : bytes
+        :return: The response line.
+        """
+
+        try:
+            request = _protocol.decode_message(line)
+        except ValueError as err:
+            response = _protocol.make_error_response(None, _protocol.ERROR_TYPE_REQUEST, str(err))
+        else:
+            response = self.handle_request(request)
+
+        return _protocol.encode_message(response)
+
+    def __dispatch(self, request):
+        """Dispatch a request to the API.
+
+        :type request: dict
+        :param request: The request.
+        :return: The result.
+        :raise _RequestError: Raise this exception if the request is malformed.
+        """
+
+        method = _get_string_field(request, "method")
+
+        if method == _protocol.METHOD_PING:
+            return {
+                "version": "%d.%d.%d" % _version.get_version()
+            }
+
+        expression = _get_string_field(request, "expression").replace(" ", "")
+
+        if method == _protocol.METHOD_CHECK:
+            return _public_api.is_chemical_equation_balanced(expression, self.__opt)
+
+        #  Get the printer and the header of unknowns.
+        printer_name = _get_string_field(request, "printer", _protocol.PRINTER_TEXT)
+        if printer_name not in _PRINTERS:
+            raise _RequestError("Unknown printer \"%s\"." % printer_name)
+        unknown_header = _get_string_field(request, "unknown_header", self.__unknown_header)
+
+        if method == _protocol.METHOD_BALANCE:
+            return _public_api.balance_chemical_equation(
+                expression,
+                self.__opt,
+                printer=_PRINTERS[printer_name],
+                unknown_header=unknown_header
+            )
+
+        if method == _protocol.METHOD_SUBSTITUTE:
+            return _public_api.substitute_chemical_equation(
+                expression,
+                self.__get_substitute_map(request),
+                self.__opt,
+                printer=_PRINTERS[printer_name],
+                unknown_header=unknown_header
+            )
+
+        raise _RequestError("Unknown method \"%s\"." % method)
+
+    def __get_substitute_map(self, request):
+        """Get the substitution map of a request.
+
+        :type request: dict
+        :param request: The request.
+        :rtype : dict
+        :return: The substitution map (symbol => value).
+        :raise _RequestError: Raise this exception if the map is malformed.
+        """
+
+        raw_map = request.get("substitute_map", {})
+        if not isinstance(raw_map, dict):
+            raise _RequestError("Field \"substitute_map\" should be an object.")
+
+        #  Values are evaluated by the math expression parser (instead of SymPy).
+        mexp_parser = _interface_opt.OptionWrapper(self.__opt).get_mexp_parser()
+        substitute_map = {}
+        for symbol in raw_map:
+            value = _get_string_field(raw_map, symbol)
+            try:
+                substitute_map[_sympy.Symbol(str(symbol))] = mexp_parser.parse(value.replace(" ", ""), self.__opt)
+            except _ps_cm_error.Error:
+                raise _RequestError("Invalid value of symbol \"%s\"." % symbol)
+
+        return substitute_map
+
+
+class _StreamRequestHandler(_socketserver.StreamRequestHandler):
+    """Handler of service connections."""
+
+    def handle(self):
+        """Handle requests of a connection until it is closed."""
+
+        while True:
+            line = self.rfile.readline()
+            if len(line) == 0:
+                break
+
+            #  Ignore empty lines.
+            if len(line.strip()) == 0:
+                continue
+
+            # noinspection PyUnresolvedReferences
+            self.wfile.write(self.server.balancer_service.handle_line(line))
+            self.wfile.flush()
+
+
+class _TCPServer(_socketserver.ThreadingMixIn, _socketserver.TCPServer):
+    """Threaded TCP server."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(_socket, "AF_UNIX"):
+    class _UnixStreamServer(_socketserver.ThreadingMixIn, _socketserver.UnixStreamServer):
+        """Threaded Unix domain socket server."""
+
+        daemon_threads = True
+else:
+    _UnixStreamServer = None
+
+
+def create_server(address, service):
+    """Create a server of the balancer service.
+
+    Note:
+      [1] A stale Unix domain socket file at the address is removed.
+
+    :type address: str
+    :type service: BalancerService
+    :param address: The address (see bce.shell.service.protocol.parse_address()).
+    :param service: The service.
+    :rtype : socketserver.BaseServer
+    :return: The server (bound and listening).
+    :raise ValueError: Raise this exception if the address is invalid or not supported.
+    """
+
+    is_unix, socket_address = _protocol.parse_address(address)
+
+    if is_unix:
+        if _UnixStreamServer is None:
+            raise ValueError("Unix domain sockets are not supported.")
+
+        #  Remove the stale socket file.
+        if _os.path.exists(socket_address) and _stat.S_ISSOCK(_os.stat(socket_address).st_mode):
+            _os.unlink(socket_address)
+
+        server = _UnixStreamServer(socket_address, _StreamRequestHandler)
+    else:
+        server = _TCPServer(socket_address, _StreamRequestHandler)
+
+    server.balancer_service = service
+
+    return server
+
+
+def serve(address, options, unknown_header="X"):
+    """Serve the balancer service until the process is interrupted.
+
+    :type address: str
+    :type options: bce.option.Option
+    :type unknown_header: str
+    :param address: The address (see bce.shell.service.protocol.parse_address()).
+    :param options: The options.
+    :param unknown_header: The header of unknowns by default.
+    :raise ValueError: Raise this exception if the address is invalid or not supported.
+    """
+
+    server = create_server(address, BalancerService(options, unknown_header=unknown_header))
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+        #  Remove the socket file.
+        is_unix, socket_address = _protocol.parse_address(address)
+        if is_unix and _os.path.exists(socket_address):
+            _os.unlink(socket_address)
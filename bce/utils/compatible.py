@@ -18,6 +18,16 @@ def is_old_python():
     return _sys.version_info.major < 3
 
 
+def is_module_getattr_supported():
+    """Get whether module-level __getattr__() (PEP 562) is supported by the Python runtime.
+
+    :rtype : bool
+    :return: Return True if the runtime supports it (>= 3.7). Otherwise, return False.
+    """
+
+    return tuple(_sys.version_info[:2]) >= (3, 7)
+
+
 def input_prompt(prompt_str=""):
     """Input a line.
 
@@ -39,3 +39,20 @@ def read_text_file(file_path, encoding="utf-8"):
         content = None
 
     return content
+
+
+def open_text_file(file_path, encoding="utf-8"):
+    """Open a text file for reading (line by line).
+
+    :type file_path: str
+    :type encoding: str
+    :param file_path: The file path.
+    :param encoding: The file encoding.
+    :return: The file handler (the caller should close it).
+    :raise IOError: Raise this exception if the file can't be opened.
+    """
+
+    if _utils_compatible.is_old_python():
+        return open(file_path, "r")
+    else:
+        return open(file_path, "r", encoding=encoding)
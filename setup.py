@@ -124,11 +124,20 @@ _setuptools.setup(
     install_requires=[
         "sympy>=0.7.3"
     ],
+    extras_require={
+        #  NumPy is optional (see bce.math.verification).
+        "numpy": [
+            "numpy"
+        ]
+    },
 
     #  Entry points.
     entry_points={
         "console_scripts": [
-            "bce-console = bce.shell.console.main:main"
+            "bce-console = bce.shell.console.main:main",
+            "bce-service-client = bce.shell.service.client:main",
+            "bce-benchmark = bce.benchmark.main:main",
+            "bce-benchmark-equivalence = bce.benchmark.equivalence:main"
         ]
     }
 )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+#
+#  Copyright 2014 - 2018 The BCE Authors. All rights reserved.
+#  Use of this source code is governed by a BSD-style license that can be
+#  found in the license.txt file.
+#
+
+import bce.math.verification as _verification
+import random as _random
+import unittest as _unittest
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+#  Bounds of 64-bit integers.
+_INT64_MAX = (1 << 63) - 1
+_INT64_MIN = -(1 << 63)
+
+
+@_unittest.skipIf(not _verification.is_numpy_available(), "NumPy is not available.")
+class CheckRowsWithNumpyTest(_unittest.TestCase):
+    """Compare _check_rows_with_numpy() with _check_rows_exactly()."""
+
+    def assert_same_as_exact(self, rows):
+        """Assert that both checks give the same results.
+
+        :type rows: list[list[(int, int)]]
+        :param rows: The rows.
+        """
+
+        self.assertEqual(_verification._check_rows_with_numpy(rows), _verification._check_rows_exactly(rows))
+
+    def test_small_rows(self):
+        rnd = _random.Random(0)
+        rows = []
+        for _ in range(0, 200):
+            row = [(rnd.randint(-50, 50), rnd.randint(-50, 50)) for _ in range(0, rnd.randint(0, 6))]
+            if len(row) != 0 and rnd.random() < 0.5:
+                #  Make the row satisfied.
+                row.append((-sum([a * x for a, x in row]), 1))
+            rows.append(row)
+
+        self.assert_same_as_exact(rows)
+
+    def test_empty_rows(self):
+        self.assertEqual(_verification._check_rows_with_numpy([[], []]), [True, True])
+        self.assert_same_as_exact([[], [(1, 2)], [], [(3, 4), (-4, 3)]])
+
+    def test_wrapped_sum_near_limit(self):
+        rows = [
+            #  The product wraps to zero in 64-bit integers.
+            [(1 << 62, 4), (1, 0)],
+            #  The products wrap, but their sum is still exactly zero.
+            [(1 << 62, 2), (-(1 << 62), 2)],
+            #  The sum wraps to zero in 64-bit integers.
+            [(_INT64_MAX, 1), (_INT64_MAX, 1), (2, 1)],
+            #  The bound is just below the limit (no exact check).
+            [(1 << 30, (1 << 31) - 1), (-((1 << 31) - 1), 1 << 30)],
+            [(1 << 30, (1 << 31) - 1), (-((1 << 31) - 1), (1 << 30) - 1)],
+            #  The bound is just at the limit.
+            [(1 << 31, 1 << 30), (-(1 << 30), 1 << 31)],
+            [(1 << 31, 1 << 30), (-(1 << 30), (1 << 31) + 1)]
+        ]
+
+        self.assert_same_as_exact(rows)
+        self.assertEqual(_verification._check_rows_with_numpy(rows), [False, True, False, True, False, True, False])
+
+    def test_overflow_fallback(self):
+        for value in [_INT64_MAX + 1, _INT64_MIN - 1, 1 << 100]:
+            rows = [[(1, 2), (-2, 1)], [(value, 1), (-value, 1)], [(value, 2), (-value, 1)]]
+
+            #  The values can't be packed into 64-bit integers.
+            self.assertRaises(OverflowError, _numpy.array, [(value, 1)], _numpy.int64)
+
+            self.assert_same_as_exact(rows)
+            self.assertEqual(_verification._check_rows_with_numpy(rows), [True, True, False])
+
+    def test_int64_bounds(self):
+        rows = [
+            [(_INT64_MAX, 1), (-_INT64_MAX, 1)],
+            [(_INT64_MIN, 1), (_INT64_MAX, 1), (1, 1)],
+            [(_INT64_MIN, -1), (_INT64_MAX, 1)],
+            [(_INT64_MIN, 1), (1, 0)]
+        ]
+
+        self.assert_same_as_exact(rows)
+
+    def test_random_rows_near_limit(self):
+        rnd = _random.Random(1)
+        rows = []
+        for _ in range(0, 500):
+            row = []
+            for _ in range(0, rnd.randint(1, 5)):
+                a_bits = rnd.randint(0, 62)
+                x_bits = rnd.randint(0, 63 - a_bits)
+                row.append((rnd.choice([-1, 1]) * rnd.getrandbits(a_bits), rnd.choice([-1, 1]) * rnd.getrandbits(x_bits)))
+            if rnd.random() < 0.5:
+                #  Make the row satisfied with exact integers (the last term may wrap).
+                rest = -sum([a * x for a, x in row])
+                if _INT64_MIN <= rest <= _INT64_MAX:
+                    row.append((rest, 1))
+            rows.append(row)
+
+        self.assert_same_as_exact(rows)
+
+    def test_check_integer_rows(self):
+        rnd = _random.Random(2)
+        rows = []
+        for _ in range(0, 100):
+            a = rnd.getrandbits(rnd.randint(1, 62))
+            x = rnd.getrandbits(rnd.randint(1, 62))
+            rows.append([(a, x), (-x, a), (rnd.randint(-1, 1), 1)])
+        rows.append([(_INT64_MAX + 1, 1), (-(_INT64_MAX + 1), 1)])
+
+        self.assertEqual(
+            _verification.check_integer_rows(rows, use_numpy=True),
+            _verification.check_integer_rows(rows, use_numpy=False)
+        )
+
+
+if __name__ == "__main__":
+    _unittest.main()